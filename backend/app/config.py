@@ -11,13 +11,16 @@ load_dotenv()
 BASE_DIR = Path(__file__).parent.parent
 
 # Data directories
-DATA_DIR = BASE_DIR / "data"
+DATA_DIR = Path(os.getenv("DATA_DIR", str(BASE_DIR / "data")))
 CV_DIR = DATA_DIR / "cv"
 JD_DIR = DATA_DIR / "jd"
 PROMPT_DIR = DATA_DIR / "prompts"
 TRANSCRIPT_DIR = DATA_DIR / "transcripts"
 RESULTS_DIR = DATA_DIR / "results"
 AUDIO_DIR = DATA_DIR / "audio"
+ANALYTICS_DIR = DATA_DIR / "analytics"
+SEARCH_DIR = DATA_DIR / "search"
+FULLTEXT_INDEX_PATH = Path(os.getenv("FULLTEXT_INDEX_PATH", str(SEARCH_DIR / "fulltext.db")))
 
 # API keys
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -31,8 +34,65 @@ OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4")
 ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
 LIVEKIT_URL = os.getenv("LIVEKIT_URL", "wss://your-livekit-instance.livekit.cloud")
 
+# Audio delivery: bitrate of the optional low-bandwidth MP3 variant
+# (0 disables it; needs ffmpeg on the PATH)
+AUDIO_LOW_BITRATE_KBPS = int(os.getenv("AUDIO_LOW_BITRATE_KBPS", "0"))
+AUDIO_CACHE_MAX_AGE = int(os.getenv("AUDIO_CACHE_MAX_AGE", str(365 * 24 * 3600)))
+
+# Retention GC: unreferenced artifacts older than the retention period are
+# deleted (0 keeps them), audio is evicted LRU above its quota (0 is no quota).
+# Unfinished interviews protect their artifacts until their record has not
+# been saved for ABANDONED_INTERVIEW_DAYS (0 protects them forever).
+GC_INTERVAL_MINUTES = float(os.getenv("GC_INTERVAL_MINUTES", "60"))
+RETENTION_AUDIO_DAYS = float(os.getenv("RETENTION_AUDIO_DAYS", "7"))
+RETENTION_DOCUMENTS_DAYS = float(os.getenv("RETENTION_DOCUMENTS_DAYS", "0"))
+ORPHAN_GRACE_HOURS = float(os.getenv("ORPHAN_GRACE_HOURS", "24"))
+ABANDONED_INTERVIEW_DAYS = float(os.getenv("ABANDONED_INTERVIEW_DAYS", "30"))
+AUDIO_QUOTA_MB = float(os.getenv("AUDIO_QUOTA_MB", "0"))
+
+# Segmented transcription: WAV answers longer than STT_SEGMENT_MAX_SECONDS are
+# split at pauses of STT_MIN_SILENCE_MS after STT_SEGMENT_SECONDS, and up to
+# STT_SEGMENT_CONCURRENCY segments are transcribed at once
+STT_SEGMENT_SECONDS = float(os.getenv("STT_SEGMENT_SECONDS", "15"))
+STT_SEGMENT_MAX_SECONDS = float(os.getenv("STT_SEGMENT_MAX_SECONDS", "30"))
+STT_MIN_SILENCE_MS = int(os.getenv("STT_MIN_SILENCE_MS", "300"))
+STT_SEGMENT_CONCURRENCY = int(os.getenv("STT_SEGMENT_CONCURRENCY", "4"))
+
+# Processes decoding and resampling answer audio (0 uses a thread instead)
+AUDIO_WORKERS = int(os.getenv("AUDIO_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+# Live interview event streams: heartbeat interval, which is also how often
+# an idle stream checks the interview file for writes by other workers
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "5"))
+
+# Interview version index: how long a record's cached version is trusted
+# before its file is stat'ed for saves by other workers
+INTERVIEW_VERSION_RECHECK_SECONDS = float(os.getenv("INTERVIEW_VERSION_RECHECK_SECONDS", "1"))
+
+# Latency budget (seconds) for a single interview turn
+TURN_DEADLINE_SECONDS = float(os.getenv("TURN_DEADLINE_SECONDS", "12"))
+
+# Seconds after a barge-in without an answer before the cancelled follow-up
+# question is asked after all
+BARGE_IN_REARM_SECONDS = float(os.getenv("BARGE_IN_REARM_SECONDS", "8"))
+
+# Live session registry: "sqlite" is shared by the workers of one host (the
+# database must be on a local disk), "memory" only works with a single worker process
+SESSION_REGISTRY = os.getenv("SESSION_REGISTRY", "sqlite").lower()
+SESSION_REGISTRY_PATH = Path(os.getenv("SESSION_REGISTRY_PATH", str(DATA_DIR / "sessions.db")))
+SESSION_LEASE_SECONDS = float(os.getenv("SESSION_LEASE_SECONDS", "30"))
+
+# Service lifecycle
+WARM_UP_SERVICES = os.getenv("WARM_UP_SERVICES", "True").lower() == "true"
+SHUTDOWN_DRAIN_SECONDS = float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "20"))
+
 # Application settings
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+
+# Event-loop watchdog: logs the stack of any callback blocking the loop for
+# longer than the threshold (on by default in debug mode)
+LOOP_WATCHDOG = os.getenv("LOOP_WATCHDOG", str(DEBUG)).lower() == "true"
+LOOP_BLOCK_THRESHOLD_MS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100"))
 PORT = int(os.getenv("PORT", "8000"))
 HOST = os.getenv("HOST", "0.0.0.0")
 
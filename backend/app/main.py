@@ -1,27 +1,58 @@
 import os
+import time
+import asyncio
+import secrets
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from starlette.websockets import WebSocketState
 import logging
 
 # Import routers
-from routers import admin_router, candidate_router, interviews_router
+from routers import admin_router, candidate_router, interviews_router, analytics_router, audio_router
 
 # Import services
-from services.llm_service import LLMService
-from services.stt_service import STTService
-from services.tts_service import TTSService
-from services.livekit_service import LiveKitService
+from services.container import get_container
+from services.llm_service import DEFAULT_FOLLOW_UP_QUESTION
+from services.session_registry import new_owner_id
+from models.transcript import Transcript
 
 # Import utils and config
-from utils.storage import save_file, read_file, save_json, read_json
-from config import RESULTS_DIR, PROMPT_DIR
+from utils.storage import save_file, read_file, read_json
+from utils.serialization import loads
+from utils.latency import Deadline
+from utils.prompt_utils import COMPLETION_MESSAGE, create_greeting
+from utils.metrics import registry, span, TurnTrace, CANCELLED_WORK
+from config import RESULTS_DIR, PROMPT_DIR, AUDIO_DIR, TURN_DEADLINE_SECONDS, SESSION_LEASE_SECONDS, BARGE_IN_REARM_SECONDS
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared services, created lazily and managed by the app lifespan
+services = get_container()
+registry.gauge("interview_active_sessions", "Interviews driven by this worker", lambda: services.active_sessions)
+
+# Stages of the follow-up that new candidate speech cancels; once the question
+# is being sent it is allowed to finish
+BARGE_IN_STAGES = ("queued", "llm", "tts")
+
+# Seconds a new connection has to send its resume message
+RESUME_MESSAGE_SECONDS = 10
+
+class SessionTakenOver(Exception):
+    """Another connection resumed the interview and now holds its lease"""
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await services.startup()
+    yield
+    await services.shutdown()
+
 # Initialize FastAPI app
-app = FastAPI(title="AI Interviewer API")
+app = FastAPI(title="AI Interviewer API", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -36,15 +67,8 @@ app.add_middleware(
 app.include_router(admin_router)
 app.include_router(candidate_router)
 app.include_router(interviews_router)
-
-# Initialize services
-llm_service = LLMService()
-stt_service = STTService()
-tts_service = TTSService()
-livekit_service = LiveKitService()
-
-# Store active interview connections
-active_interviews = {}
+app.include_router(analytics_router)
+app.include_router(audio_router)
 
 # Helper function to get interview data
 def get_interview_data(interview_id: str):
@@ -53,11 +77,83 @@ def get_interview_data(interview_id: str):
         raise HTTPException(status_code=404, detail="Interview not found")
     return read_json(interview_path)
 
+def add_turn(interview_id: str, transcript: Transcript, speaker: str, text: str, at: float = None, duration: float = None):
+    """Append a turn to the transcript, index it for search and push it to live watchers"""
+    transcript.append(speaker, text, at=at, duration=duration)
+    services.fulltext.add_turn(interview_id, speaker, text)
+    if services.events.has_subscribers(interview_id):
+        services.events.publish(interview_id, "transcript", {"index": len(transcript) - 1, "entry": transcript[-1].to_json()})
+
+def resume_token_matches(session: dict, resume_token) -> bool:
+    """Whether the client's resume token is the one issued for the interview's session"""
+    expected = session.get("resume_token")
+    return isinstance(resume_token, str) and bool(expected) and secrets.compare_digest(expected, resume_token)
+
+def publish_status(interview_id: str, interview_data: dict):
+    """Push the interview's status and progress to live watchers"""
+    services.events.publish(interview_id, "status", {
+        "status": interview_data["status"],
+        "questions_asked": interview_data.get("questions_asked", 0),
+        "max_questions": interview_data.get("max_questions")
+    })
+
+async def keep_lease(interview_id: str, owner: str, websocket: WebSocket):
+    """Renew the session lease until cancelled; close the socket if it is lost"""
+    while True:
+        await asyncio.sleep(SESSION_LEASE_SECONDS / 3)
+        if not await asyncio.to_thread(services.sessions.renew, interview_id, owner):
+            logger.warning(f"Lost session lease for interview {interview_id}")
+            await websocket.close(code=4409)
+            return
+
 # WebSocket for the interview session
 @app.websocket("/api/ws/interview/{interview_id}")
 async def interview_websocket(websocket: WebSocket, interview_id: str):
     await websocket.accept()
     
+    if not services.accepting_sessions:
+        await websocket.send_json({"type": "error", "message": "Server is restarting, please reconnect"})
+        await websocket.close(code=1012)
+        return
+    
+    # The client's first message carries the resume token of its previous
+    # session, if any; tokens stay out of URLs, which end up in access logs
+    try:
+        hello = loads(await asyncio.wait_for(websocket.receive_text(), timeout=RESUME_MESSAGE_SECONDS))
+    except WebSocketDisconnect:
+        return
+    except (asyncio.TimeoutError, ValueError):
+        await websocket.close(code=1008)
+        return
+    resume_token = hello.get("resume_token") if isinstance(hello, dict) and hello.get("type") == "resume" else None
+    
+    # Take the interview's lease before touching its state. A reconnect with
+    # the session's resume token takes it over from the connection it
+    # replaces, which may not have noticed the disconnect yet.
+    lease_owner = new_owner_id()
+    if not await asyncio.to_thread(services.sessions.acquire, interview_id, lease_owner):
+        try:
+            current_session = get_interview_data(interview_id).get("session") or {}
+        except HTTPException:
+            current_session = {}
+        if not resume_token_matches(current_session, resume_token):
+            await websocket.send_json({"type": "error", "message": "Interview is already in progress in another session"})
+            await websocket.close(code=4409)
+            return
+        logger.info(f"Reconnect took over the session of interview {interview_id}")
+        await asyncio.to_thread(services.sessions.take_over, interview_id, lease_owner)
+    lease_task = asyncio.create_task(keep_lease(interview_id, lease_owner, websocket))
+    services.session_started()
+    
+    # Background work of this session, cancelled when it ends
+    scoring_tasks = []
+    reply_task = None
+    reply_trace = None
+    # Re-asks a follow-up cancelled by speech that never became an answer
+    rearm_task = None
+    # Answer being streamed in audio chunks, transcribed as it arrives
+    transcription = None
+    
     try:
         # Get interview data
         interview_data = get_interview_data(interview_id)
@@ -67,161 +163,421 @@ async def interview_websocket(websocket: WebSocket, interview_id: str):
             await websocket.close()
             return
         
+        async def check_lease():
+            """Raise SessionTakenOver if a reconnect has taken the session over"""
+            if await asyncio.to_thread(services.sessions.owner_of, interview_id) != lease_owner:
+                raise SessionTakenOver()
+        
+        async def persist():
+            """Save the interview unless a reconnect has taken the session over"""
+            await check_lease()
+            services.interviews.save(interview_data)
+        
+        # A reconnect to an interview with an unanswered question resumes it
+        # instead of greeting the candidate again
+        session = interview_data.get("session") or {}
+        resuming = interview_data["status"] == "in_progress" and bool(session.get("pending_question"))
+        if resuming and not resume_token_matches(session, resume_token):
+            # Opened in a new tab or on another device, or the tab lost its
+            # token. No other connection holds the lease, so continue from
+            # the last persisted question under a new token; the old one no
+            # longer resumes or takes over the session.
+            logger.info(f"Resuming interview {interview_id} without its resume token; issuing a new one")
+            session["resume_token"] = secrets.token_urlsafe(16)
+        
+        if not resuming:
+            session = {"resume_token": secrets.token_urlsafe(16), "last_seq": 0}
+        interview_data["session"] = session
+        
         # Update interview status
         interview_data["status"] = "in_progress"
-        save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
-        
-        # Add to active interviews
-        active_interviews[interview_id] = websocket
+        await persist()
+        publish_status(interview_id, interview_data)
+        services.fulltext.index_interview(interview_data)
         
         # Get system prompt and initial questions
         prompt_data = read_json(PROMPT_DIR / f"{interview_id}.json")
         system_prompt = prompt_data["system_prompt"]
         interviewer_name = prompt_data.get("interviewer_name", "AI Interviewer")
         
-        # Get initial questions if available, or generate them
-        initial_questions = interview_data.get("initial_questions", [])
-        if not initial_questions:
-            cv_path = interview_data["cv_path"]
-            jd_path = interview_data["jd_path"]
-            
-            initial_questions = await llm_service.generate_initial_questions(
-                cv_path=cv_path,
-                jd_path=jd_path,
-                system_prompt=system_prompt,
-                max_questions=interview_data["max_questions"]
-            )
-            
-            interview_data["initial_questions"] = initial_questions
-            save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+        # Audio synthesized when the interview was created, keyed by text
+        prerendered = interview_data.get("prerendered_audio") or {}
         
-        # Send greeting
-        greeting = f"Hello, I'm {interviewer_name}. Thank you for joining this interview. I'll be asking you some questions to learn more about your skills and experience."
+        def audio_exists(url: str) -> bool:
+            # The retention GC deletes the audio of interviews left unstarted for too long
+            return bool(url) and (AUDIO_DIR / url.rsplit("/", 1)[-1]).exists()
         
-        # Convert greeting to speech
-        audio_url = await tts_service.text_to_speech(greeting)
+        async def audio_for(text: str) -> str:
+            url = prerendered.get(text)
+            return url if audio_exists(url) else await services.tts.text_to_speech(text)
         
-        # Send greeting to candidate
         await websocket.send_json({
-            "type": "greeting",
-            "text": greeting,
-            "audio_url": audio_url
+            "type": "session",
+            "resume_token": session["resume_token"],
+            "resumed": resuming,
+            "last_seq": session["last_seq"]
         })
         
-        # Update transcript
-        transcript = interview_data.get("transcript", [])
-        transcript.append({"speaker": "ai", "text": greeting})
+        transcript = Transcript.from_json(interview_data.get("transcript"))
         interview_data["transcript"] = transcript
-        save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+        # When the pending question was sent, to time the candidate's answer
+        question_sent_at = None
         
-        # Start with first question
-        if initial_questions:
-            first_question = initial_questions[0]
-            audio_url = await tts_service.text_to_speech(first_question)
+        if resuming:
+            # Replay the unanswered question with its already synthesized audio
+            logger.info(f"Resuming interview {interview_id} at question {session['pending_question']['question_number']}")
+            pending_question = session["pending_question"]
+            if not audio_exists(pending_question.get("audio_url")):
+                pending_question["audio_url"] = await services.tts.text_to_speech(pending_question["text"])
+            await websocket.send_json({"type": "question", **pending_question})
+            # Scoring cancelled by the disconnect is started again
+            scoring_tasks.extend(services.assessment.rescore_missing(
+                interview_data, transcript, exclude=session["pending_question"]["question_number"]
+            ))
+        else:
+            # Get initial questions if available, or generate them
+            initial_questions = interview_data.get("initial_questions", [])
+            if not initial_questions:
+                cv_path = interview_data["cv_path"]
+                jd_path = interview_data["jd_path"]
+                
+                initial_questions = await services.llm.generate_initial_questions(
+                    cv_path=cv_path,
+                    jd_path=jd_path,
+                    system_prompt=system_prompt,
+                    max_questions=interview_data["max_questions"]
+                )
+                
+                interview_data["initial_questions"] = initial_questions
+                await persist()
+            
+            # Send greeting
+            greeting = create_greeting(interviewer_name)
+            
+            # Greeting and first question audio are normally pre-rendered;
+            # otherwise synthesize both concurrently
+            first_question = initial_questions[0] if initial_questions else None
+            audio_url, first_question_audio_url = await asyncio.gather(
+                audio_for(greeting),
+                audio_for(first_question) if first_question else asyncio.sleep(0, result="")
+            )
             
+            # Send greeting to candidate
             await websocket.send_json({
-                "type": "question",
-                "text": first_question,
-                "audio_url": audio_url,
-                "question_number": 1
+                "type": "greeting",
+                "text": greeting,
+                "audio_url": audio_url
             })
             
+            # Update transcript
+            add_turn(interview_id, transcript, "ai", greeting)
+            await persist()
+            
+            # Start with first question
+            if first_question:
+                question_message = {
+                    "text": first_question,
+                    "audio_url": first_question_audio_url,
+                    "question_number": 1
+                }
+                await websocket.send_json({"type": "question", **question_message})
+                question_sent_at = time.time()
+                
+                # Update transcript and question count
+                add_turn(interview_id, transcript, "ai", first_question, at=question_sent_at)
+                interview_data["questions_asked"] = 1
+                session["pending_question"] = question_message
+                await persist()
+                publish_status(interview_id, interview_data)
+        
+        # The follow-up question (LLM + TTS) is produced by a background task
+        # while the socket keeps being read, so speech from the candidate can
+        # cancel it (barge-in); a question that is already being sent finishes.
+        # Per-answer scoring also runs in the background.
+        # Scoring of the answer to the pending question, redone on barge-in
+        answer_scoring = None
+        
+        async def send_next_question(current_question: int, deadline: Deadline, trace: TurnTrace):
+            nonlocal question_sent_at
+            
+            # Generate next question
+            with span("llm", trace):
+                next_question = await services.llm.generate_follow_up_question(
+                    transcript=transcript,
+                    system_prompt=system_prompt,
+                    cv_path=interview_data["cv_path"],
+                    jd_path=interview_data["jd_path"],
+                    deadline=deadline
+                )
+            
+            # Convert question to speech. When the LLM fell back to the default
+            # question the turn is out of time: use its pre-rendered audio, or
+            # the content-addressed file, synthesized only the first time
+            # any session needs it
+            with span("tts", trace):
+                if next_question == DEFAULT_FOLLOW_UP_QUESTION:
+                    audio_url = await audio_for(next_question)
+                else:
+                    audio_url = await services.tts.text_to_speech(next_question, deadline=deadline)
+            
+            # Send question to candidate
+            question_message = {
+                "text": next_question,
+                "audio_url": audio_url,
+                "question_number": current_question + 1
+            }
+            with span("send", trace):
+                # A connection that was taken over must not ask the question too
+                await check_lease()
+                await websocket.send_json({"type": "question", **question_message})
+            question_sent_at = time.time()
+            
             # Update transcript and question count
-            transcript.append({"speaker": "ai", "text": first_question})
-            interview_data["transcript"] = transcript
-            interview_data["questions_asked"] = 1
-            save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+            add_turn(interview_id, transcript, "ai", next_question, at=question_sent_at)
+            interview_data["questions_asked"] = current_question + 1
+            session["pending_question"] = question_message
+            services.assessment.collect_finished(interview_data, scoring_tasks)
+            with span("persist", trace):
+                await persist()
+            publish_status(interview_id, interview_data)
+            trace.finish()
+        
+        async def interrupt_reply() -> bool:
+            """
+            Cancel the follow-up the candidate is talking over, or wait for it
+            once it is being sent. Returns whether it was cancelled.
+            """
+            if reply_task is None or reply_task.done():
+                return False
+            if reply_trace.stage in BARGE_IN_STAGES:
+                logger.info(f"Candidate barged in during {reply_trace.stage} in interview {interview_id}")
+                reply_trace.cancelled("barge_in")
+                reply_task.cancel()
+            await asyncio.wait({reply_task})
+            if not reply_task.cancelled():
+                reply_task.result()
+                return False
+            return True
+        
+        async def rearm_follow_up():
+            """Ask the cancelled follow-up after all if no answer follows the speech that cancelled it"""
+            nonlocal reply_task, reply_trace
+            await asyncio.sleep(BARGE_IN_REARM_SECONDS)
+            logger.info(f"No answer after barge-in in interview {interview_id}; asking the follow-up again")
+            current_question = interview_data["questions_asked"]
+            reply_trace = TurnTrace(interview_id, current_question)
+            reply_task = asyncio.create_task(
+                send_next_question(current_question, Deadline(TURN_DEADLINE_SECONDS), reply_trace)
+            )
+        
+        def cancel_rearm() -> bool:
+            """Stop a pending re-ask; returns whether one was pending"""
+            if rearm_task is None or rearm_task.done():
+                return False
+            rearm_task.cancel()
+            return True
         
         # Main interview loop
         while True:
-            # Wait for candidate response
-            message = await websocket.receive_json()
+            # Wait for candidate response; the turn clock starts once it arrives
+            raw_message = await websocket.receive_text()
+            received_at = time.time()
+            with span("receive"):
+                message = loads(raw_message)
             
-            if message["type"] == "response":
+            if message["type"] == "speech_start":
+                # The client detected the candidate speaking again. Voice
+                # detection also fires on coughs and background noise, so a
+                # cancelled follow-up is asked after all if no answer arrives.
+                rearm_pending = cancel_rearm()
+                if await interrupt_reply() or rearm_pending:
+                    rearm_task = asyncio.create_task(rearm_follow_up())
+            
+            elif message["type"] == "audio_chunk":
+                # Part of an answer still being spoken; complete segments are
+                # transcribed while the candidate keeps talking
+                cancel_rearm()
+                if transcription is None:
+                    transcription = services.stt.incremental()
+                await transcription.feed(message["audio_data"])
+            
+            elif message["type"] == "response":
+                # Clients number their answers; a retransmitted answer that was
+                # already processed must not advance the interview again
+                seq = message.get("seq")
+                if seq is not None and seq <= session["last_seq"]:
+                    logger.info(f"Ignoring duplicate answer {seq} for interview {interview_id}")
+                    continue
+                
+                cancel_rearm()
+                await interrupt_reply()
+                
+                # Every stage of this turn shares one latency budget
+                deadline = Deadline(TURN_DEADLINE_SECONDS)
+                trace = TurnTrace(interview_id, interview_data["questions_asked"])
+                
                 # Process candidate audio response
                 audio_data = message.get("audio_data")
-                if audio_data:
+                if transcription is not None:
+                    # The answer was streamed; this message may carry its last chunk
+                    if audio_data:
+                        await transcription.feed(audio_data)
+                    with span("stt", trace):
+                        candidate_response = await transcription.finish(deadline=deadline)
+                    transcription = None
+                elif audio_data:
                     # Transcribe audio using STT
-                    candidate_response = await stt_service.speech_to_text(audio_data)
+                    with span("stt", trace):
+                        candidate_response = await services.stt.speech_to_text(audio_data, deadline=deadline)
                 else:
                     # If text response provided directly
                     candidate_response = message.get("text", "")
                 
                 # Update transcript
-                transcript.append({"speaker": "candidate", "text": candidate_response})
-                interview_data["transcript"] = transcript
+                asked_question = transcript.last("ai") or ""
+                add_turn(
+                    interview_id,
+                    transcript,
+                    "candidate",
+                    candidate_response,
+                    at=received_at,
+                    duration=received_at - question_sent_at if question_sent_at else None
+                )
+                if seq is not None:
+                    session["last_seq"] = seq
                 
                 # Check if we've reached max questions
                 current_question = interview_data["questions_asked"]
                 max_questions = interview_data["max_questions"]
                 
-                if current_question >= max_questions:
-                    # Complete the interview
-                    await complete_interview(interview_id, websocket)
-                    break
+                # After a barge-in the answer continues over several turns;
+                # score it as a whole, replacing the score of its first part
+                answer_parts = transcript.tail("candidate")
+                if len(answer_parts) > 1:
+                    if answer_scoring is not None and not answer_scoring.done():
+                        answer_scoring.cancel()
+                        CANCELLED_WORK.inc("barge_in", "scoring")
+                    interview_data["answer_scores"] = [
+                        entry for entry in interview_data.get("answer_scores", [])
+                        if entry["question_number"] != current_question
+                    ]
+                    if answer_scoring in scoring_tasks:
+                        scoring_tasks.remove(answer_scoring)
                 
-                # Generate next question
-                next_question = await llm_service.generate_follow_up_question(
-                    transcript=transcript,
-                    system_prompt=system_prompt,
+                # Score the answer incrementally without blocking the turn
+                answer_scoring = asyncio.create_task(services.assessment.score_answer(
+                    question_number=current_question,
+                    question=asked_question,
+                    answer=" ".join(answer_parts),
                     cv_path=interview_data["cv_path"],
                     jd_path=interview_data["jd_path"]
-                )
-                
-                # Convert question to speech
-                audio_url = await tts_service.text_to_speech(next_question)
+                ))
+                scoring_tasks.append(answer_scoring)
                 
-                # Send question to candidate
-                await websocket.send_json({
-                    "type": "question",
-                    "text": next_question,
-                    "audio_url": audio_url,
-                    "question_number": current_question + 1
-                })
+                if current_question >= max_questions:
+                    # Complete the interview
+                    with span("complete", trace):
+                        await complete_interview(interview_id, websocket, interview_data, scoring_tasks)
+                    trace.finish()
+                    break
                 
-                # Update transcript and question count
-                transcript.append({"speaker": "ai", "text": next_question})
-                interview_data["transcript"] = transcript
-                interview_data["questions_asked"] = current_question + 1
-                save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+                reply_trace = trace
+                reply_task = asyncio.create_task(send_next_question(current_question, deadline, trace))
                 
     except WebSocketDisconnect:
         logger.info(f"Client disconnected from interview {interview_id}")
-        if interview_id in active_interviews:
-            del active_interviews[interview_id]
+    except SessionTakenOver:
+        logger.info(f"Interview {interview_id} was resumed by another connection")
+        if websocket.application_state == WebSocketState.CONNECTED:
+            await websocket.close(code=4409)
     except Exception as e:
         logger.error(f"Error in interview websocket: {str(e)}")
         await websocket.send_json({"type": "error", "message": f"Error: {str(e)}"})
         await websocket.close()
-        if interview_id in active_interviews:
-            del active_interviews[interview_id]
+    finally:
+        # Nobody is left to receive in-flight work; stop paying for it. A
+        # question already being sent is waited for: its save must happen
+        # while this connection still holds the lease, or it could overwrite
+        # the state of a connection that resumed the interview.
+        if rearm_task is not None:
+            rearm_task.cancel()
+        if reply_task is not None and not reply_task.done():
+            if reply_trace.stage in BARGE_IN_STAGES:
+                reply_trace.cancelled("disconnect")
+                reply_task.cancel()
+            await asyncio.wait({reply_task})
+            if not reply_task.cancelled():
+                reply_task.exception()
+        for task in scoring_tasks:
+            if not task.done():
+                CANCELLED_WORK.inc("disconnect", "scoring")
+                task.cancel()
+        if transcription is not None:
+            for _ in range(transcription.cancel()):
+                CANCELLED_WORK.inc("disconnect", "stt")
+        lease_task.cancel()
+        await asyncio.to_thread(services.sessions.release, interview_id, lease_owner)
+        services.session_finished()
 
-async def complete_interview(interview_id: str, websocket: WebSocket):
+async def complete_interview(
+    interview_id: str,
+    websocket: WebSocket,
+    interview_data: dict = None,
+    scoring_tasks: list = None
+):
     """
-    Complete the interview and generate results
+    Complete the interview and generate results.
+    
+    The final assessment aggregates the per-answer scores collected during the
+    interview; the single large assessment prompt is only used when no answer
+    could be scored.
     """
     try:
         # Get interview data
-        interview_data = get_interview_data(interview_id)
+        if interview_data is None:
+            interview_data = get_interview_data(interview_id)
         transcript = interview_data.get("transcript", [])
         
-        # Generate final assessment using LLM
-        assessment = await llm_service.generate_final_assessment(
-            transcript=transcript,
-            cv_path=interview_data["cv_path"],
-            jd_path=interview_data["jd_path"]
+        # Synthesize the closing message while the last answer is being scored
+        completion_message = COMPLETION_MESSAGE
+        prerendered_url = (interview_data.get("prerendered_audio") or {}).get(completion_message)
+        completion_audio_task = asyncio.create_task(
+            asyncio.sleep(0, result=prerendered_url) if prerendered_url else services.tts.text_to_speech(completion_message)
         )
         
+        await services.assessment.drain(interview_data, scoring_tasks or [])
+        # Answers whose scoring was cancelled or failed are scored once more
+        await services.assessment.drain(interview_data, services.assessment.rescore_missing(interview_data, transcript))
+        assessment = services.assessment.aggregate(interview_data["answer_scores"])
+        
+        if assessment is None:
+            # Generate final assessment using LLM
+            assessment = await services.llm.generate_final_assessment(
+                transcript=transcript,
+                cv_path=interview_data["cv_path"],
+                jd_path=interview_data["jd_path"]
+            )
+        
         # Update interview data with results
         interview_data["status"] = "completed"
         interview_data["rating"] = assessment.get("rating")
         interview_data["verdict"] = assessment.get("verdict")
         interview_data["detailed_feedback"] = assessment.get("detailed_feedback")
-        save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+        interview_data["completed_at"] = datetime.now(timezone.utc).isoformat()
+        services.interviews.save(interview_data)
+        publish_status(interview_id, interview_data)
+        services.events.publish(interview_id, "results", {
+            "rating": interview_data["rating"],
+            "verdict": interview_data["verdict"],
+            "detailed_feedback": interview_data["detailed_feedback"],
+            "completed_at": interview_data["completed_at"]
+        })
+        await asyncio.to_thread(services.analytics.record_result, interview_data)
+        await asyncio.to_thread(services.search.index_answers, interview_id, transcript)
+        services.fulltext.index_interview(interview_data)
         
         # Send completion message
-        completion_message = "Thank you for completing this interview. Your responses have been recorded."
-        audio_url = await tts_service.text_to_speech(completion_message)
+        audio_url = await completion_audio_task
         
         await websocket.send_json({
             "type": "completion",
@@ -238,10 +594,6 @@ async def complete_interview(interview_id: str, websocket: WebSocket):
         
         # Close the connection
         await websocket.close()
-        
-        # Remove from active interviews
-        if interview_id in active_interviews:
-            del active_interviews[interview_id]
             
     except Exception as e:
         logger.error(f"Error completing interview: {str(e)}")
@@ -252,6 +604,11 @@ async def complete_interview(interview_id: str, websocket: WebSocket):
 async def health_check():
     return {"status": "healthy"}
 
+# Prometheus scrape endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -10,11 +10,16 @@ class Interview(BaseModel):
     jd_path: str
     prompt_path: str
     status: str = "created"
-    transcript: List[Dict[str, str]] = []
+    transcript: List[Dict[str, Any]] = []  # in memory: models.transcript.Transcript
     questions_asked: int = 0
     max_questions: int
     interviewer_name: str = "AI Interviewer"
     initial_questions: List[str] = []
+    answer_scores: List[Dict[str, Any]] = []
+    session: Optional[Dict[str, Any]] = None  # resume token, last answer seq, pending question
     rating: Optional[int] = None
     verdict: Optional[str] = None
+    role_id: Optional[str] = None
+    created_at: Optional[str] = None
+    completed_at: Optional[str] = None
     detailed_feedback: Optional[Dict[str, Any]] = {}
\ No newline at end of file
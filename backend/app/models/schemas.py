@@ -1,6 +1,6 @@
 # backend/app/models/schemas.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional, Any, Union
 
 class InterviewCreate(BaseModel):
@@ -25,12 +25,33 @@ class TranscriptEntry(BaseModel):
     """Single entry in the interview transcript"""
     speaker: str  # "ai" or "candidate"
     text: str
+    at: Optional[float] = None  # Unix time of the turn
+    duration: Optional[float] = None  # Seconds the candidate took to answer
+
+class DetailedFeedback(BaseModel):
+    """Structured feedback section of an assessment"""
+    model_config = ConfigDict(extra="allow")
+    
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    fit_for_role: str = ""
+
+class Assessment(BaseModel):
+    """Final assessment as returned by the LLM"""
+    rating: int = Field(..., ge=1, le=10)
+    verdict: str = Field(..., min_length=1)
+    detailed_feedback: DetailedFeedback = DetailedFeedback()
+
+class DimensionScore(BaseModel):
+    """Score for one answer on a single assessment dimension"""
+    score: int = Field(..., ge=1, le=10)
+    evidence: str = ""
 
 class InterviewResult(BaseModel):
     """Interview results model"""
     interview_id: str
-    transcript: List[Dict[str, str]]
-    rating: int
+    transcript: List[Dict[str, Any]]
+    rating: Optional[int] = None  # None when the assessment could not be validated
     verdict: str
     detailed_feedback: Optional[Dict[str, Any]] = {}
 
@@ -0,0 +1,174 @@
+# backend/app/models/transcript.py
+
+import math
+import time
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+# Speaker labels are interned: each turn stores a one-byte index into this list
+SPEAKERS: List[str] = ["ai", "candidate"]
+_SPEAKER_CODES: Dict[str, int] = {speaker: code for code, speaker in enumerate(SPEAKERS)}
+
+
+def speaker_code(speaker: str) -> int:
+    code = _SPEAKER_CODES.get(speaker)
+    if code is None:
+        if len(SPEAKERS) >= 127:
+            raise ValueError("Too many distinct transcript speakers")
+        code = _SPEAKER_CODES[speaker] = len(SPEAKERS)
+        SPEAKERS.append(speaker)
+    return code
+
+
+class Turn:
+    """
+    One transcript entry, created on access.
+
+    Supports entry["speaker"] / entry["text"] / entry.get(...) so code written
+    against the {"speaker": ..., "text": ...} dicts keeps working.
+    """
+
+    __slots__ = ("speaker", "text", "at", "duration")
+
+    def __init__(self, speaker: str, text: str, at: Optional[float] = None, duration: Optional[float] = None):
+        self.speaker = speaker
+        self.text = text
+        self.at = at
+        self.duration = duration
+
+    def __getitem__(self, key: str):
+        if key not in Turn.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None) if key in Turn.__slots__ else None
+        return default if value is None else value
+
+    def to_json(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"speaker": self.speaker, "text": self.text}
+        if self.at is not None:
+            entry["at"] = self.at
+        if self.duration is not None:
+            entry["duration"] = self.duration
+        return entry
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self.to_json() == other
+        return isinstance(other, Turn) and self.to_json() == other.to_json()
+
+    def __repr__(self):
+        return f"Turn({self.to_json()!r})"
+
+
+class Transcript:
+    """
+    Interview transcript stored as parallel arrays.
+
+    Each turn costs a byte for the interned speaker, a pointer to its text and
+    two doubles of timing metadata (when the turn was recorded and, for
+    answers, how long the candidate took), instead of a dict per turn.
+    Serializes to the list-of-dicts JSON shape stored in interview files; the
+    timing keys ("at", "duration") are only written when set.
+    """
+
+    __slots__ = ("_speakers", "_texts", "_at", "_durations")
+
+    def __init__(self):
+        self._speakers = array("b")
+        self._texts: List[str] = []
+        # NaN marks a missing value
+        self._at = array("d")
+        self._durations = array("d")
+
+    @classmethod
+    def from_json(cls, entries: Optional[List[Dict[str, Any]]]) -> "Transcript":
+        """Build from stored entries (also accepts an existing Transcript)"""
+        if isinstance(entries, Transcript):
+            return entries
+        transcript = cls()
+        for entry in entries or []:
+            transcript._push(entry["speaker"], entry["text"], entry.get("at"), entry.get("duration"))
+        return transcript
+
+    def append(self, speaker: str, text: str, at: Optional[float] = None, duration: Optional[float] = None):
+        """
+        Add a turn
+
+        Args:
+            speaker: "ai" or "candidate"
+            text: What was said
+            at: Unix time of the turn (defaults to now)
+            duration: Seconds the speaker took, if known
+        """
+        self._push(speaker, text, time.time() if at is None else at, duration)
+
+    def _push(self, speaker: str, text: str, at: Optional[float], duration: Optional[float]):
+        self._speakers.append(speaker_code(speaker))
+        self._texts.append(text)
+        self._at.append(math.nan if at is None else at)
+        self._durations.append(math.nan if duration is None else duration)
+
+    def _turn(self, index: int) -> Turn:
+        at, duration = self._at[index], self._durations[index]
+        return Turn(
+            SPEAKERS[self._speakers[index]],
+            self._texts[index],
+            None if math.isnan(at) else at,
+            None if math.isnan(duration) else duration
+        )
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index: int) -> Turn:
+        if isinstance(index, slice):
+            raise TypeError("Transcript does not support slicing; use to_json()")
+        return self._turn(index)
+
+    def __iter__(self) -> Iterator[Turn]:
+        speakers = SPEAKERS
+        for code, text, at, duration in zip(self._speakers, self._texts, self._at, self._durations):
+            # x != x is true only for NaN
+            yield Turn(speakers[code], text, None if at != at else at, None if duration != duration else duration)
+
+    def __reversed__(self) -> Iterator[Turn]:
+        for index in range(len(self._texts) - 1, -1, -1):
+            yield self._turn(index)
+
+    def texts(self, speaker: Optional[str] = None) -> List[str]:
+        """Texts of all turns, or only those of one speaker, without building Turn objects"""
+        if speaker is None:
+            return list(self._texts)
+        code = _SPEAKER_CODES.get(speaker)
+        return [text for text, s in zip(self._texts, self._speakers) if s == code]
+
+    def last(self, speaker: str) -> Optional[str]:
+        """Text of the most recent turn by `speaker`"""
+        code = _SPEAKER_CODES.get(speaker)
+        for index in range(len(self._texts) - 1, -1, -1):
+            if self._speakers[index] == code:
+                return self._texts[index]
+        return None
+
+    def tail(self, speaker: str) -> List[str]:
+        """Texts of the consecutive turns by `speaker` at the end of the transcript, oldest first"""
+        code = _SPEAKER_CODES.get(speaker)
+        index = len(self._texts)
+        while index > 0 and self._speakers[index - 1] == code:
+            index -= 1
+        return self._texts[index:]
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        return [turn.to_json() for turn in self]
+
+    def __eq__(self, other):
+        if isinstance(other, Transcript):
+            return self.to_json() == other.to_json()
+        if isinstance(other, list):
+            return self.to_json() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Transcript({len(self)} turns)"
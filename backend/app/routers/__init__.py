@@ -1,5 +1,7 @@
 from .admin import router as admin_router
 from .candidate import router as candidate_router
 from .interviews import router as interviews_router
+from .analytics import router as analytics_router
+from .audio import router as audio_router
 
-__all__ = ["admin_router", "candidate_router", "interviews_router"]
\ No newline at end of file
+__all__ = ["admin_router", "candidate_router", "interviews_router", "analytics_router", "audio_router"]
\ No newline at end of file
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
-from typing import Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Query
+from typing import Optional, List, Dict, Any
 import uuid
+import asyncio
+from datetime import datetime, timezone
 from pathlib import Path
 import logging
 
-from ..models.schemas import InterviewCreate, InterviewResponse, SystemPrompt
-from ..utils.storage import save_file, save_json, read_json
-from ..services.llm_service import LLMService
-from ..config import CV_DIR, JD_DIR, PROMPT_DIR, RESULTS_DIR
+from models.schemas import InterviewCreate, InterviewResponse, SystemPrompt
+from utils.storage import save_file, save_json, read_json
+from services.container import get_llm_service, get_search_index, get_prerender_service, get_interview_store
+from config import CV_DIR, JD_DIR, PROMPT_DIR, RESULTS_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -16,16 +18,17 @@ router = APIRouter(
     tags=["admin"],
 )
 
-# Initialize LLM service
-llm_service = LLMService()
-
 @router.post("/interviews", response_model=InterviewResponse)
 async def create_interview(
     cv: UploadFile = File(...),
     jd: UploadFile = File(...),
     system_prompt: str = Form(...),
     interviewer_name: Optional[str] = Form("AI Interviewer"),
-    max_questions: Optional[int] = Form(10)
+    max_questions: Optional[int] = Form(10),
+    llm_service=Depends(get_llm_service),
+    prerender_service=Depends(get_prerender_service),
+    interview_store=Depends(get_interview_store),
+    search_index=Depends(get_search_index)
 ):
     """
     Create a new interview session with uploaded CV and job description.
@@ -38,6 +41,9 @@ async def create_interview(
         cv_path = await save_file(cv, CV_DIR / f"{interview_id}.pdf")
         jd_path = await save_file(jd, JD_DIR / f"{interview_id}.pdf")
         
+        # Imported here to keep NumPy out of worker startup
+        from services.analytics_service import role_id_for
+        
         # Save system prompt
         prompt_data = {
             "system_prompt": system_prompt,
@@ -56,11 +62,13 @@ async def create_interview(
             "transcript": [],
             "questions_asked": 0,
             "max_questions": max_questions,
-            "interviewer_name": interviewer_name
+            "interviewer_name": interviewer_name,
+            "role_id": role_id_for(str(jd_path)),
+            "created_at": datetime.now(timezone.utc).isoformat()
         }
         
         # Save interview data
-        save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+        interview_store.save(interview_data)
         
         # Initialize interview with LLM
         initial_questions = await llm_service.generate_initial_questions(
@@ -72,7 +80,19 @@ async def create_interview(
         
         # Update interview data with initial questions
         interview_data["initial_questions"] = initial_questions
-        save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+        interview_store.save(interview_data)
+        
+        # Synthesize the greeting and first question before the candidate joins
+        prerender_service.schedule(interview_id)
+        
+        # Make the CV and job description searchable (blocking: embeds and appends to the shared log)
+        await asyncio.to_thread(
+            search_index.index_interview_documents,
+            interview_id=interview_id,
+            cv_text=await llm_service.get_document_text(str(cv_path)),
+            jd_text=await llm_service.get_document_text(str(jd_path)),
+            role_id=interview_data["role_id"]
+        )
         
         return {
             "interview_id": interview_id,
@@ -85,7 +105,13 @@ async def create_interview(
         raise HTTPException(status_code=500, detail=f"Failed to create interview: {str(e)}")
 
 @router.post("/interviews/{interview_id}/system-prompt")
-async def update_system_prompt(interview_id: str, prompt: SystemPrompt):
+async def update_system_prompt(
+    interview_id: str,
+    prompt: SystemPrompt,
+    llm_service=Depends(get_llm_service),
+    prerender_service=Depends(get_prerender_service),
+    interview_store=Depends(get_interview_store)
+):
     """
     Update the system prompt for an existing interview.
     """
@@ -117,7 +143,10 @@ async def update_system_prompt(interview_id: str, prompt: SystemPrompt):
         interview_data["initial_questions"] = initial_questions
         interview_data["max_questions"] = prompt_data["max_questions"]
         interview_data["interviewer_name"] = prompt_data["interviewer_name"]
-        save_json(interview_data, RESULTS_DIR / f"{interview_id}.json")
+        # Audio rendered for the old prompt no longer matches
+        interview_data.pop("prerendered_audio", None)
+        interview_store.save(interview_data)
+        prerender_service.schedule(interview_id)
         
         return {"message": "System prompt updated successfully"}
         
@@ -125,4 +154,31 @@ async def update_system_prompt(interview_id: str, prompt: SystemPrompt):
         raise
     except Exception as e:
         logger.error(f"Error updating system prompt: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to update system prompt: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to update system prompt: {str(e)}")
+
+@router.get("/search", response_model=List[Dict[str, Any]])
+async def search_documents(
+    q: str = Query(..., min_length=1),
+    kind: Optional[str] = Query(None, description="Restrict to cv, jd or answer"),
+    k: int = Query(10, ge=1, le=100),
+    approximate: Optional[bool] = None,
+    search_index=Depends(get_search_index)
+):
+    """
+    Similarity search over CVs, job descriptions and candidate answers.
+    """
+    try:
+        from services.search_service import KINDS
+        
+        if kind is not None and kind not in KINDS:
+            raise HTTPException(status_code=400, detail=f"Unknown document kind: {kind}")
+        
+        return await asyncio.to_thread(search_index.search, q, k=k, kind=kind, approximate=approximate)
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error searching documents: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search documents: {str(e)}")
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Dict, Any
+import asyncio
+import logging
+
+from services.container import get_analytics_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/analytics",
+    tags=["analytics"],
+)
+
+@router.get("/roles", response_model=List[Dict[str, Any]])
+async def list_roles(analytics=Depends(get_analytics_service)):
+    """
+    List roles (distinct job descriptions) with completed interviews.
+    """
+    try:
+        return await asyncio.to_thread(analytics.list_roles)
+    except Exception as e:
+        logger.error(f"Error listing roles: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to list roles: {str(e)}")
+
+@router.get("/roles/{role_id}/stats", response_model=Dict[str, Any])
+async def get_role_stats(role_id: str, analytics=Depends(get_analytics_service)):
+    """
+    Rating distribution and common strength/weakness terms for a role.
+    """
+    try:
+        stats = await asyncio.to_thread(analytics.role_stats, role_id)
+        if stats is None:
+            raise HTTPException(status_code=404, detail="Role not found")
+        return stats
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting role stats: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get role stats: {str(e)}")
+
+@router.get("/roles/{role_id}/top", response_model=List[Dict[str, Any]])
+async def get_top_candidates(
+    role_id: str,
+    n: int = Query(10, ge=1, le=1000),
+    analytics=Depends(get_analytics_service)
+):
+    """
+    Top-N candidates for a role by rating.
+    """
+    try:
+        top = await asyncio.to_thread(analytics.top_candidates, role_id, n)
+        if top is None:
+            raise HTTPException(status_code=404, detail="Role not found")
+        return top
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting top candidates: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get top candidates: {str(e)}")
+
+@router.get("/interviews/{interview_id}/rank", response_model=Dict[str, Any])
+async def get_interview_rank(interview_id: str, analytics=Depends(get_analytics_service)):
+    """
+    Percentile rank of a completed interview among candidates for the same role.
+    """
+    try:
+        rank = await asyncio.to_thread(analytics.interview_rank, interview_id)
+        if rank is None:
+            raise HTTPException(status_code=404, detail="No completed interview found")
+        return rank
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting interview rank: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get interview rank: {str(e)}")
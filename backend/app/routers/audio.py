@@ -0,0 +1,125 @@
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import Optional, Tuple
+import logging
+import re
+
+from config import AUDIO_DIR, AUDIO_CACHE_MAX_AGE
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/audio",
+    tags=["audio"],
+)
+
+# Content-addressed names (32 hex chars) and the older uuid4 names
+AUDIO_NAME_RE = re.compile(r"^([0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\.mp3$")
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "bytes=" header into inclusive (start, end)
+
+    Returns None for headers this endpoint ignores (multiple ranges or other
+    units), which are answered with the full file.
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, _, end_text = spec.strip().partition("-")
+    try:
+        if not start_text:
+            # Suffix range: the last N bytes
+            length = int(end_text)
+            if length <= 0:
+                raise ValueError("Empty suffix range")
+            return max(size - length, 0), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        raise ValueError(f"Invalid range {header!r}")
+    if start >= size or end < start:
+        raise ValueError(f"Range {header!r} not satisfiable for {size} bytes")
+    return start, min(end, size - 1)
+
+
+def _iter_file(path, start: int, length: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+@router.get("/{name}")
+async def get_audio(
+    name: str,
+    request: Request,
+    quality: str = Query("standard", pattern="^(standard|low)$")
+):
+    """
+    Serve a synthesized audio file.
+
+    Files never change once written, so responses carry a strong ETag and an
+    immutable Cache-Control header: repeat plays and reconnects are served
+    from the browser cache or answered with 304. Single byte ranges are
+    supported for seeking and resumed downloads. `quality=low` serves the
+    low-bitrate variant when one has been generated.
+    """
+    try:
+        if not AUDIO_NAME_RE.match(name):
+            raise HTTPException(status_code=404, detail="Audio not found")
+
+        stem = name[:-len(".mp3")]
+        path = AUDIO_DIR / name
+        variant = ""
+        if quality == "low" and (AUDIO_DIR / f"{stem}.low.mp3").exists():
+            path = AUDIO_DIR / f"{stem}.low.mp3"
+            variant = "-low"
+        if not path.exists():
+            raise HTTPException(status_code=404, detail="Audio not found")
+
+        etag = f'"{stem}{variant}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={AUDIO_CACHE_MAX_AGE}, immutable",
+            "Accept-Ranges": "bytes"
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+            return Response(status_code=304, headers=headers)
+
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header and (not if_range or if_range.strip() == etag):
+            size = path.stat().st_size
+            try:
+                byte_range = _parse_range(range_header, size)
+            except ValueError:
+                return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+            if byte_range is not None:
+                start, end = byte_range
+                length = end - start + 1
+                return StreamingResponse(
+                    _iter_file(path, start, length),
+                    status_code=206,
+                    media_type="audio/mpeg",
+                    headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(length)}
+                )
+
+        return FileResponse(path, media_type="audio/mpeg", headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error serving audio {name}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to serve audio: {str(e)}")
@@ -3,9 +3,9 @@ from typing import Dict, Any
 from pathlib import Path
 import logging
 
-from ..services.livekit_service import LiveKitService
-from ..utils.storage import read_json
-from ..config import RESULTS_DIR
+from services.container import get_livekit_service
+from utils.storage import read_json
+from config import RESULTS_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +14,6 @@ router = APIRouter(
     tags=["candidate"],
 )
 
-# Initialize LiveKit service
-livekit_service = LiveKitService()
-
 @router.get("/interviews/{interview_id}/join", response_model=Dict[str, Any])
 async def join_interview(interview_id: str):
     """
@@ -42,7 +39,7 @@ async def join_interview(interview_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to join interview: {str(e)}")
 
 @router.post("/interviews/{interview_id}/livekit-token")
-async def get_livekit_token(interview_id: str, participant_name: str):
+async def get_livekit_token(interview_id: str, participant_name: str, livekit_service=Depends(get_livekit_service)):
     """
     Generate a LiveKit token for the candidate to join the interview room.
     """
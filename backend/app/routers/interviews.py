@@ -1,14 +1,25 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Response, Request, Depends, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Optional
+from datetime import datetime
 from pathlib import Path
+import asyncio
 import logging
 
-from ..models.schemas import InterviewResponse, InterviewResult
-from ..utils.storage import read_json
-from ..config import RESULTS_DIR
+from models.schemas import InterviewResponse, InterviewResult
+from utils.storage import read_json
+from utils.serialization import FastJSONResponse, dumps
+from utils.metrics import registry
+from services.export_service import ExportFilter, ExportUnavailable, export, FORMATS as EXPORT_FORMATS
+from services.container import get_session_registry, get_event_bus, get_interview_store, get_fulltext_index
+from config import RESULTS_DIR, EVENTS_HEARTBEAT_SECONDS
 
 logger = logging.getLogger(__name__)
 
+INTERVIEW_READS = registry.counter(
+    "interview_reads_total", "Interview detail and results requests by how they were served", ["endpoint", "outcome"]
+)
+
 router = APIRouter(
     prefix="/api/interviews",
     tags=["interviews"],
@@ -33,48 +44,271 @@ async def list_interviews():
         logger.error(f"Error listing interviews: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to list interviews: {str(e)}")
 
+@router.get("/active", response_model=List[str])
+async def list_active_interviews(session_registry=Depends(get_session_registry)):
+    """
+    List interviews with a live candidate session on any worker.
+    """
+    try:
+        return await asyncio.to_thread(session_registry.active_sessions)
+    except Exception as e:
+        logger.error(f"Error listing active interviews: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to list active interviews: {str(e)}")
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names `etag`"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+def _transcript_delta(payload: Dict[str, Any], since_turn: int) -> Dict[str, Any]:
+    """Replace the transcript of a response with the turns from `since_turn` on"""
+    transcript = payload.get("transcript") or []
+    payload["transcript"] = transcript[since_turn:]
+    payload["since_turn"] = since_turn
+    payload["turn_count"] = len(transcript)
+    return payload
+
+@router.get("/search", response_model=Dict[str, Any])
+async def search_interviews(
+    q: str = Query(..., min_length=1, description='Terms (ANDed), "phrases", prefix* and OR'),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    field: Optional[str] = Query(None, pattern="^(transcript|verdict|feedback)$"),
+    speaker: Optional[str] = Query(None, pattern="^(candidate|ai)$"),
+    status: Optional[str] = None,
+    role_id: Optional[str] = None,
+    fulltext_index=Depends(get_fulltext_index)
+):
+    """
+    Full-text search over transcripts, verdicts and detailed feedback.
+    
+    Interviews are ranked by BM25 and come with a snippet per matching
+    field; e.g. `q=kubernetes&speaker=candidate` finds interviews where the
+    candidate mentioned Kubernetes. New turns are searchable while the
+    interview is still running.
+    """
+    try:
+        return await asyncio.to_thread(
+            fulltext_index.search, q,
+            page=page, page_size=page_size, field=field, speaker=speaker, status=status, role_id=role_id
+        )
+    except Exception as e:
+        logger.error(f"Error searching interviews: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search interviews: {str(e)}")
+
+@router.get("/export")
+async def export_interviews(
+    format: str = Query("ndjson", pattern="^(ndjson|csv|parquet|arrow)$"),
+    status: str = Query("completed", description="Interview status to export, or 'any'"),
+    role_id: Optional[str] = None,
+    since: Optional[str] = Query(None, description="ISO date or date/time"),
+    until: Optional[str] = Query(None, description="ISO date or date/time"),
+    transcript: bool = True
+):
+    """
+    Export interviews in bulk for an ATS or analytics.
+    
+    Streams NDJSON, CSV, Parquet or an Arrow IPC stream (the latter two need
+    pyarrow), reading one record at a time in a worker thread, so memory
+    stays flat and the event loop is free however many interviews match.
+    `since`/`until` filter on the completion time.
+    """
+    try:
+        try:
+            since_time = datetime.fromisoformat(since) if since else None
+            until_time = datetime.fromisoformat(until) if until else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid date: {str(e)}")
+        
+        export_filter = ExportFilter(
+            status=None if status == "any" else status,
+            role_id=role_id,
+            since=since_time,
+            until=until_time,
+            include_transcript=transcript
+        )
+        chunks = export(export_filter, format)
+        media_type, extension = EXPORT_FORMATS[format]
+        # A sync iterator: Starlette runs each step in its threadpool
+        return StreamingResponse(
+            chunks,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="interviews.{extension}"'}
+        )
+    except HTTPException:
+        raise
+    except ExportUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting interviews: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to export interviews: {str(e)}")
+
 @router.get("/{interview_id}", response_model=Dict[str, Any])
-async def get_interview(interview_id: str):
+async def get_interview(
+    interview_id: str,
+    request: Request,
+    since_turn: Optional[int] = Query(None, ge=0),
+    interview_store=Depends(get_interview_store)
+):
     """
     Get detailed information about a specific interview.
+    
+    Responses carry the record's version as ETag; a poll with a matching
+    If-None-Match is answered with 304 from the in-memory version index,
+    without reading the file. With `since_turn`, the transcript only holds
+    the turns from that index on, and `turn_count` is the full length.
     """
     try:
-        interview_path = RESULTS_DIR / f"{interview_id}.json"
-        if not interview_path.exists():
+        version = interview_store.version(interview_id)
+        if version is None:
             raise HTTPException(status_code=404, detail="Interview not found")
+        if _not_modified(request, version.etag):
+            INTERVIEW_READS.inc("interview", "not_modified")
+            return Response(status_code=304, headers={"ETag": version.etag, "Cache-Control": "no-cache"})
         
-        interview_data = read_json(interview_path)
-        return interview_data
+        if since_turn is not None:
+            interview_data, version = interview_store.read(interview_id)
+            INTERVIEW_READS.inc("interview", "delta")
+            return FastJSONResponse(
+                _transcript_delta(interview_data, since_turn),
+                headers={"ETag": version.etag, "Cache-Control": "no-cache"}
+            )
+        
+        # The stored document is the response body; skip decoding and re-encoding it
+        content, version = interview_store.read_bytes(interview_id)
+        INTERVIEW_READS.inc("interview", "full")
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers={"ETag": version.etag, "Cache-Control": "no-cache"}
+        )
     except HTTPException:
         raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Interview not found")
     except Exception as e:
         logger.error(f"Error getting interview: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get interview: {str(e)}")
 
-@router.get("/{interview_id}/results", response_model=InterviewResult)
-async def get_interview_results(interview_id: str):
+def _sse(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + dumps(data) + b"\n\n"
+
+async def _interview_events(interview_id: str, event_bus):
+    interview_path = RESULTS_DIR / f"{interview_id}.json"
+    # Subscribe before reading the snapshot so no event is missed in between
+    subscription = event_bus.subscribe(interview_id)
+    
+    def read_snapshot():
+        return interview_path.stat().st_mtime, read_json(interview_path)
+    
+    try:
+        while True:
+            # Parsing the record would block the event loop
+            mtime, snapshot = await asyncio.to_thread(read_snapshot)
+            yield _sse("snapshot", snapshot)
+            if snapshot["status"] == "completed":
+                return
+            
+            while True:
+                message = await subscription.get(timeout=EVENTS_HEARTBEAT_SECONDS)
+                if message is not None:
+                    yield _sse(message["event"], message["data"])
+                    if message["event"] == "results":
+                        return
+                    mtime = None
+                    continue
+                
+                if subscription.overflowed:
+                    # Fell too far behind; start over from a fresh snapshot
+                    subscription = event_bus.subscribe(interview_id)
+                    break
+                # No events: the interview may be driven by another worker,
+                # whose writes are only visible in the file
+                current = interview_path.stat().st_mtime
+                if mtime is not None and current != mtime:
+                    break
+                mtime = current
+                yield b": heartbeat\n\n"
+    except FileNotFoundError:
+        # The interview was deleted while being watched
+        logger.info(f"Interview {interview_id} was deleted; ending its event stream")
+    finally:
+        event_bus.unsubscribe(subscription)
+
+@router.get("/{interview_id}/events")
+async def watch_interview(interview_id: str, event_bus=Depends(get_event_bus)):
     """
-    Retrieve the results of a completed interview.
+    Stream live updates of an interview as Server-Sent Events.
+    
+    The stream starts with a "snapshot" event holding the interview record,
+    followed by "transcript" (new turn with its index), "status" and
+    "results" events as they happen; it ends once the interview is
+    completed. Watching costs one file read instead of a read per poll.
+    Turns recorded while the snapshot is read can be delivered twice;
+    clients deduplicate them by index. A new snapshot is sent when the
+    watcher fell behind or the interview is driven by another worker.
     """
     try:
         interview_path = RESULTS_DIR / f"{interview_id}.json"
         if not interview_path.exists():
             raise HTTPException(status_code=404, detail="Interview not found")
         
-        interview_data = read_json(interview_path)
+        return StreamingResponse(
+            _interview_events(interview_id, event_bus),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error watching interview: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to watch interview: {str(e)}")
+
+@router.get("/{interview_id}/results", response_model=InterviewResult)
+async def get_interview_results(
+    interview_id: str,
+    request: Request,
+    since_turn: Optional[int] = Query(None, ge=0),
+    interview_store=Depends(get_interview_store)
+):
+    """
+    Retrieve the results of a completed interview.
+    
+    Supports If-None-Match and `since_turn` like the interview detail.
+    """
+    try:
+        version = interview_store.version(interview_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        if version.status != "completed":
+            raise HTTPException(status_code=400, detail="Interview not completed yet")
+        if _not_modified(request, version.etag):
+            INTERVIEW_READS.inc("results", "not_modified")
+            return Response(status_code=304, headers={"ETag": version.etag, "Cache-Control": "no-cache"})
+        
+        interview_data, version = interview_store.read(interview_id)
         
         if interview_data["status"] != "completed":
             raise HTTPException(status_code=400, detail="Interview not completed yet")
         
-        return {
+        results = {
             "interview_id": interview_id,
             "transcript": interview_data.get("transcript", []),
             "rating": interview_data.get("rating"),
             "verdict": interview_data.get("verdict"),
             "detailed_feedback": interview_data.get("detailed_feedback", {})
         }
+        if since_turn is not None:
+            results = _transcript_delta(results, since_turn)
+        INTERVIEW_READS.inc("results", "full" if since_turn is None else "delta")
+        return FastJSONResponse(results, headers={"ETag": version.etag, "Cache-Control": "no-cache"})
     except HTTPException:
         raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Interview not found")
     except Exception as e:
         logger.error(f"Error getting interview results: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to get interview results: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to get interview results: {str(e)}")
@@ -0,0 +1,465 @@
+# backend/app/services/analytics_service.py
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from config import ANALYTICS_DIR, RESULTS_DIR
+from utils.storage import read_json, file_lock
+from utils.serialization import loads
+
+logger = logging.getLogger(__name__)
+
+# Compact the append-only event log into the columnar snapshot after this many entries
+COMPACT_EVERY = 1000
+
+STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "was", "were", "are", "has", "have",
+    "had", "not", "but", "their", "they", "very", "well", "good", "some", "more",
+    "from", "into", "about", "candidate", "role", "his", "her", "them", "its", "can",
+    "could", "would", "should", "also", "than", "when", "which", "while", "across",
+    "strong", "weak", "lack", "limited", "knowledge", "experience", "skills", "ability",
+    "understanding", "demonstrated", "shows", "showed"
+}
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9+#.\-]{2,}")
+
+def extract_terms(phrases: List[str]) -> List[str]:
+    """Lower-cased content words from feedback phrases"""
+    terms = []
+    for phrase in phrases or []:
+        for token in TOKEN_RE.findall(str(phrase).lower()):
+            token = token.rstrip(".-")
+            if len(token) >= 3 and token not in STOPWORDS:
+                terms.append(token)
+    return terms
+
+def role_id_for(jd_path: str) -> str:
+    """Identify a role by the content hash of its job description file"""
+    digest = hashlib.sha256()
+    with open(jd_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class RoleColumns:
+    """Columnar per-role aggregate of completed interviews"""
+
+    def __init__(self, capacity: int = 64):
+        self.interview_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.ratings = np.zeros(capacity, dtype=np.int8)
+        self.completed_at = np.zeros(capacity, dtype=np.float64)
+        self.size = 0
+        # Histogram over ratings 0-10, maintained incrementally for O(1) percentile ranks
+        self.rating_counts = np.zeros(11, dtype=np.int64)
+        self.strength_terms: Counter = Counter()
+        self.weakness_terms: Counter = Counter()
+
+    def _reserve(self, extra: int):
+        needed = self.size + extra
+        if needed > len(self.ratings):
+            capacity = max(needed, 2 * len(self.ratings))
+            self.ratings = np.resize(self.ratings, capacity)
+            self.completed_at = np.resize(self.completed_at, capacity)
+
+    def add(self, interview_id: str, rating: int, completed_at: float) -> bool:
+        """Append one result; returns False if the interview is already recorded"""
+        if interview_id in self.index:
+            return False
+        self._reserve(1)
+        self.index[interview_id] = self.size
+        self.interview_ids.append(interview_id)
+        self.ratings[self.size] = rating
+        self.completed_at[self.size] = completed_at
+        self.rating_counts[rating] += 1
+        self.size += 1
+        return True
+
+    def extend(self, interview_ids: List[str], ratings: np.ndarray, completed_at: np.ndarray):
+        """Bulk append used when loading a snapshot"""
+        self._reserve(len(interview_ids))
+        end = self.size + len(interview_ids)
+        self.ratings[self.size:end] = ratings
+        self.completed_at[self.size:end] = completed_at
+        for offset, interview_id in enumerate(interview_ids):
+            self.index[interview_id] = self.size + offset
+        self.interview_ids.extend(interview_ids)
+        self.rating_counts += np.bincount(ratings, minlength=11).astype(np.int64)
+        self.size = end
+
+    def percentile_rank(self, rating: int) -> float:
+        """Percentage of candidates for the role rated below `rating` (ties count half)"""
+        total = self.rating_counts.sum()
+        if total == 0:
+            return 0.0
+        below = self.rating_counts[:rating].sum()
+        equal = self.rating_counts[rating]
+        return float((below + 0.5 * equal) / total * 100.0)
+
+    def top(self, n: int) -> List[Dict[str, Any]]:
+        """Highest rated interviews, ties broken by earliest completion"""
+        if self.size == 0 or n <= 0:
+            return []
+        ratings = self.ratings[:self.size].astype(np.int16)
+        completed_at = self.completed_at[:self.size]
+        n = min(n, self.size)
+        if n < self.size:
+            # Everything rated at least the n-th best rating is a candidate,
+            # so ties at the boundary are resolved by completion time below
+            threshold = -np.partition(-ratings, n - 1)[n - 1]
+            candidates = np.flatnonzero(ratings >= threshold)
+        else:
+            candidates = np.arange(self.size)
+        order = candidates[np.lexsort((completed_at[candidates], -ratings[candidates]))][:n]
+        return [
+            {
+                "interview_id": self.interview_ids[i],
+                "rating": int(ratings[i]),
+                "completed_at": datetime.fromtimestamp(completed_at[i], tz=timezone.utc).isoformat() if completed_at[i] else None,
+                "percentile_rank": round(self.percentile_rank(int(ratings[i])), 1)
+            }
+            for i in order
+        ]
+
+    def stats(self, top_terms: int = 10) -> Dict[str, Any]:
+        """Rating distribution and feedback term frequencies"""
+        ratings = self.ratings[:self.size].astype(np.float64)
+        summary = {"count": int(self.size)}
+        if self.size:
+            p25, median, p75 = np.percentile(ratings, [25, 50, 75])
+            summary.update({
+                "mean": round(float(ratings.mean()), 2),
+                "std": round(float(ratings.std()), 2),
+                "min": int(ratings.min()),
+                "max": int(ratings.max()),
+                "p25": float(p25),
+                "median": float(median),
+                "p75": float(p75),
+            })
+        summary["distribution"] = {str(r): int(self.rating_counts[r]) for r in range(1, 11)}
+        summary["top_strength_terms"] = self.strength_terms.most_common(top_terms)
+        summary["top_weakness_terms"] = self.weakness_terms.most_common(top_terms)
+        return summary
+
+
+class AnalyticsService:
+    """
+    Cross-interview analytics grouped by role (job description).
+
+    Aggregates are updated incrementally as interviews complete. Updates are
+    appended to an event log and periodically compacted into a columnar
+    snapshot (NumPy arrays), so neither startup nor queries read result files.
+
+    Every worker appends to the same log. Appends, loads and compaction hold
+    a file lock, and compaction re-reads the log before truncating it, so no
+    worker's events are lost. Before answering a query, a worker replays the
+    log entries other workers appended since it last read it, or reloads
+    the store if another worker compacted it. Loads and writes block on the
+    file lock; async callers run them in a thread.
+    """
+
+    def __init__(self, directory: Path = ANALYTICS_DIR):
+        self.directory = Path(directory)
+        self.snapshot_path = self.directory / "snapshot.npz"
+        self.terms_path = self.directory / "terms.json"
+        self.log_path = self.directory / "events.jsonl"
+        self.lock_path = self.directory / "store.lock"
+        self.roles: Dict[str, RoleColumns] = {}
+        self.interview_roles: Dict[str, str] = {}
+        self._log_entries = 0
+        # Version of the snapshot and byte offset in the log this worker has read up to
+        self._snapshot_version: Optional[int] = None
+        self._log_offset = 0
+        self._loaded = False
+        # Serializes loading and writes within this process
+        self._lock = threading.RLock()
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            with file_lock(self.lock_path):
+                if self.snapshot_path.exists() or self.log_path.exists():
+                    self._swap(*self._read_store())
+                else:
+                    # First run: build the store from existing result files
+                    self._rebuild(RESULTS_DIR)
+            # Only now may queries use the aggregates
+            self._loaded = True
+
+    def _read_store(self) -> Tuple[Dict[str, RoleColumns], Dict[str, str], int, Optional[int], int]:
+        """
+        Aggregates in the snapshot and event log, the number of log entries,
+        the snapshot version and the log offset read up to (file lock held)
+        """
+        roles: Dict[str, RoleColumns] = {}
+        interview_roles: Dict[str, str] = {}
+        snapshot_version = self._current_snapshot_version()
+        if snapshot_version is not None:
+            self._load_snapshot(roles, interview_roles)
+
+        log_entries, log_offset = self._replay_log(roles, interview_roles, 0)
+        return roles, interview_roles, log_entries, snapshot_version, log_offset
+
+    def _replay_log(self, roles: Dict[str, RoleColumns], interview_roles: Dict[str, str], offset: int) -> Tuple[int, int]:
+        """Apply the log entries after a byte offset; returns their number and the new offset"""
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return 0, 0
+        # Appends hold the file lock, but stop at the last complete line regardless
+        end = data.rfind(b"\n") + 1
+        entries = 0
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._apply(loads(line), roles, interview_roles)
+                entries += 1
+        return entries, offset + end
+
+    def _current_snapshot_version(self) -> Optional[int]:
+        try:
+            return self.snapshot_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _log_size(self) -> int:
+        try:
+            return self.log_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _swap(
+        self,
+        roles: Dict[str, RoleColumns],
+        interview_roles: Dict[str, str],
+        log_entries: int,
+        snapshot_version: Optional[int],
+        log_offset: int
+    ):
+        # Queries see either the old or the new aggregates, never a partial load
+        self.roles, self.interview_roles, self._log_entries = roles, interview_roles, log_entries
+        self._snapshot_version, self._log_offset = snapshot_version, log_offset
+
+    def _refresh(self):
+        """Pick up results other workers recorded since this worker last read the store"""
+        self._ensure_loaded()
+        if self._current_snapshot_version() == self._snapshot_version and self._log_size() == self._log_offset:
+            return
+        with self._lock, file_lock(self.lock_path):
+            self._catch_up()
+
+    def _catch_up(self):
+        # Both locks held
+        if self._current_snapshot_version() != self._snapshot_version or self._log_size() < self._log_offset:
+            # Another worker compacted or rebuilt the store
+            self._swap(*self._read_store())
+            return
+        entries, self._log_offset = self._replay_log(self.roles, self.interview_roles, self._log_offset)
+        self._log_entries += entries
+
+    def _load_snapshot(self, roles: Dict[str, RoleColumns], interview_roles: Dict[str, str]):
+        snapshot = np.load(self.snapshot_path, allow_pickle=False)
+        role_ids = snapshot["role_ids"]
+        interview_ids = snapshot["interview_ids"]
+        ratings = snapshot["ratings"]
+        completed_at = snapshot["completed_at"]
+
+        unique_roles, inverse = np.unique(role_ids, return_inverse=True)
+        for k, role_id in enumerate(unique_roles.tolist()):
+            rows = np.flatnonzero(inverse == k)
+            columns = RoleColumns(capacity=max(64, len(rows)))
+            ids = interview_ids[rows].tolist()
+            columns.extend(ids, ratings[rows], completed_at[rows])
+            roles[role_id] = columns
+            interview_roles.update(dict.fromkeys(ids, role_id))
+
+        if self.terms_path.exists():
+            terms = read_json(self.terms_path)
+            for role_id, role_terms in terms.items():
+                columns = roles.setdefault(role_id, RoleColumns())
+                columns.strength_terms.update(role_terms.get("strengths", {}))
+                columns.weakness_terms.update(role_terms.get("weaknesses", {}))
+
+    @staticmethod
+    def _apply(event: Dict[str, Any], roles: Dict[str, RoleColumns], interview_roles: Dict[str, str]) -> bool:
+        columns = roles.setdefault(event["role_id"], RoleColumns())
+        if not columns.add(event["interview_id"], event["rating"], event["completed_at"]):
+            return False
+        columns.strength_terms.update(event.get("strength_terms", []))
+        columns.weakness_terms.update(event.get("weakness_terms", []))
+        interview_roles[event["interview_id"]] = event["role_id"]
+        return True
+
+    def _event_for(self, interview_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        rating = interview_data.get("rating")
+        if interview_data.get("status") != "completed" or rating is None:
+            return None
+
+        role_id = interview_data.get("role_id")
+        if not role_id:
+            try:
+                role_id = role_id_for(interview_data["jd_path"])
+            except (KeyError, OSError):
+                return None
+
+        completed_at = interview_data.get("completed_at")
+        timestamp = datetime.fromisoformat(completed_at).timestamp() if completed_at else 0.0
+        feedback = interview_data.get("detailed_feedback") or {}
+        return {
+            "interview_id": interview_data["id"],
+            "role_id": role_id,
+            "rating": max(0, min(10, int(rating))),
+            "completed_at": timestamp,
+            "strength_terms": extract_terms(feedback.get("strengths", [])),
+            "weakness_terms": extract_terms(feedback.get("weaknesses", []))
+        }
+
+    def record_result(self, interview_data: Dict[str, Any]):
+        """Add a completed interview to the aggregates (blocking)"""
+        try:
+            self._ensure_loaded()
+            event = self._event_for(interview_data)
+            if event is None:
+                return
+
+            with self._lock:
+                with file_lock(self.lock_path):
+                    self._catch_up()
+                    if not self._apply(event, self.roles, self.interview_roles):
+                        return
+                    with open(self.log_path, "ab") as f:
+                        f.write(json.dumps(event).encode("utf-8") + b"\n")
+                        self._log_offset = f.tell()
+                    self._log_entries += 1
+
+                if self._log_entries >= COMPACT_EVERY:
+                    self.compact()
+        except Exception as e:
+            logger.error(f"Error recording interview analytics: {str(e)}")
+
+    def compact(self):
+        """
+        Fold the event log into the columnar snapshot and truncate it
+
+        The snapshot and log are re-read under the file lock rather than
+        written from this worker's view, so events other workers appended are
+        kept, and picked up by this worker.
+        """
+        with self._lock, file_lock(self.lock_path):
+            roles, interview_roles = self._read_store()[:2]
+            self._write_snapshot(roles)
+            # Entries in the log are now covered by the snapshot
+            open(self.log_path, "w").close()
+            self._swap(roles, interview_roles, 0, self._current_snapshot_version(), 0)
+
+    def _write_snapshot(self, roles: Dict[str, RoleColumns]):
+        role_ids, interview_ids, ratings, completed_at = [], [], [], []
+        terms = {}
+        for role_id, columns in roles.items():
+            role_ids.extend([role_id] * columns.size)
+            interview_ids.extend(columns.interview_ids)
+            ratings.append(columns.ratings[:columns.size])
+            completed_at.append(columns.completed_at[:columns.size])
+            terms[role_id] = {
+                "strengths": dict(columns.strength_terms),
+                "weaknesses": dict(columns.weakness_terms)
+            }
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / "snapshot.tmp.npz"
+        np.savez(
+            tmp_path,
+            role_ids=np.array(role_ids, dtype=str),
+            interview_ids=np.array(interview_ids, dtype=str),
+            ratings=np.concatenate(ratings) if ratings else np.zeros(0, dtype=np.int8),
+            completed_at=np.concatenate(completed_at) if completed_at else np.zeros(0)
+        )
+        tmp_path.replace(self.snapshot_path)
+        tmp_path = self.directory / "terms.tmp.json"
+        with open(tmp_path, "w") as f:
+            json.dump(terms, f)
+        tmp_path.replace(self.terms_path)
+
+    def flush(self):
+        """Compact pending log entries, if any"""
+        if self._loaded and self._log_entries:
+            self.compact()
+
+    def rebuild(self, results_dir: Path = RESULTS_DIR):
+        """Recompute all aggregates from the stored interview results"""
+        with self._lock, file_lock(self.lock_path):
+            self._rebuild(results_dir)
+            self._loaded = True
+
+    def _rebuild(self, results_dir: Path):
+        # File lock held; every event in the log is also in a result file
+        roles: Dict[str, RoleColumns] = {}
+        interview_roles: Dict[str, str] = {}
+        for file_path in Path(results_dir).glob("*.json"):
+            try:
+                event = self._event_for(read_json(file_path))
+            except Exception as e:
+                logger.error(f"Skipping {file_path.name} during analytics rebuild: {str(e)}")
+                continue
+            if event is not None:
+                self._apply(event, roles, interview_roles)
+        self._write_snapshot(roles)
+        open(self.log_path, "w").close()
+        self._swap(roles, interview_roles, 0, self._current_snapshot_version(), 0)
+
+    def list_roles(self) -> List[Dict[str, Any]]:
+        self._refresh()
+        return [
+            {"role_id": role_id, "completed_interviews": columns.size}
+            for role_id, columns in sorted(self.roles.items(), key=lambda item: -item[1].size)
+        ]
+
+    def role_stats(self, role_id: str) -> Optional[Dict[str, Any]]:
+        self._refresh()
+        columns = self.roles.get(role_id)
+        return columns.stats() if columns is not None else None
+
+    def top_candidates(self, role_id: str, n: int = 10) -> Optional[List[Dict[str, Any]]]:
+        self._refresh()
+        columns = self.roles.get(role_id)
+        return columns.top(n) if columns is not None else None
+
+    def interview_rank(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """Percentile rank of an interview among candidates for the same role"""
+        self._refresh()
+        role_id = self.interview_roles.get(interview_id)
+        if role_id is None:
+            return None
+        columns = self.roles[role_id]
+        rating = int(columns.ratings[columns.index[interview_id]])
+        return {
+            "interview_id": interview_id,
+            "role_id": role_id,
+            "rating": rating,
+            "percentile_rank": round(columns.percentile_rank(rating), 1),
+            "role_size": columns.size
+        }
+
+
+_analytics_service: Optional[AnalyticsService] = None
+
+def get_analytics_service() -> AnalyticsService:
+    """Process-wide analytics service shared by the websocket handler and routers"""
+    global _analytics_service
+    if _analytics_service is None:
+        _analytics_service = AnalyticsService()
+    return _analytics_service
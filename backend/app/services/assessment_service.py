@@ -0,0 +1,210 @@
+# backend/app/services/assessment_service.py
+
+import asyncio
+import logging
+from typing import Iterable, List, Dict, Any, Optional, Tuple
+
+from services.llm_service import LLMService
+from utils.prompt_utils import DIMENSION_DESCRIPTIONS
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONS = list(DIMENSION_DESCRIPTIONS.keys())
+
+class AssessmentService:
+    """
+    Incremental candidate assessment.
+
+    Each answer is scored on every dimension with small concurrent prompts while
+    the interview is still running, so the final assessment is a cheap
+    aggregation over the stored scores instead of one large prompt at the end.
+    """
+
+    def __init__(self, llm_service: LLMService):
+        self.llm_service = llm_service
+
+    async def score_answer(
+        self,
+        question_number: int,
+        question: str,
+        answer: str,
+        cv_path: str,
+        jd_path: str
+    ) -> Dict[str, Any]:
+        """
+        Score one answer on all dimensions concurrently
+
+        Returns:
+            Dict with the question number and a score entry per dimension
+            (dimensions that failed to score are omitted)
+        """
+        results = await asyncio.gather(*[
+            self.llm_service.score_answer_dimension(
+                dimension=dimension,
+                question=question,
+                answer=answer,
+                cv_path=cv_path,
+                jd_path=jd_path
+            )
+            for dimension in DIMENSIONS
+        ])
+
+        return {
+            "question_number": question_number,
+            "scores": {
+                dimension: result
+                for dimension, result in zip(DIMENSIONS, results)
+                if result is not None
+            }
+        }
+
+    @staticmethod
+    def collect_finished(interview_data: Dict[str, Any], tasks: List[asyncio.Task]):
+        """
+        Move results of finished scoring tasks into the interview record
+
+        A result replaces the earlier entry for its question, unless it
+        scored nothing and the earlier entry did.
+        """
+        answer_scores = interview_data.setdefault("answer_scores", [])
+        for task in [t for t in tasks if t.done()]:
+            tasks.remove(task)
+            if not task.cancelled() and task.exception() is None:
+                result = task.result()
+                earlier = [e for e in answer_scores if e["question_number"] == result["question_number"]]
+                if result["scores"] or not any(e["scores"] for e in earlier):
+                    answer_scores[:] = [e for e in answer_scores if e not in earlier] + [result]
+            elif not task.cancelled():
+                logger.error(f"Answer scoring failed: {str(task.exception())}")
+
+    @staticmethod
+    def answered_questions(transcript: Iterable[Dict[str, Any]]) -> List[Tuple[int, str, str]]:
+        """
+        Every answered question in a transcript
+
+        The first interviewer turn is the greeting, so question N is the
+        interviewer's (N+1)th turn. An answer continued over several turns
+        after a barge-in is joined, as it is when scored live.
+
+        Returns:
+            (question_number, question, answer) tuples in interview order
+        """
+        answered = []
+        question_number, question, parts = -1, "", []
+        for turn in transcript:
+            if turn["speaker"] == "candidate":
+                parts.append(turn["text"])
+                continue
+            if parts and question_number > 0:
+                answered.append((question_number, question, " ".join(parts)))
+            question_number, question, parts = question_number + 1, turn["text"], []
+        if parts and question_number > 0:
+            answered.append((question_number, question, " ".join(parts)))
+        return answered
+
+    def rescore_missing(
+        self,
+        interview_data: Dict[str, Any],
+        transcript: Iterable[Dict[str, Any]],
+        exclude: Optional[int] = None
+    ) -> List[asyncio.Task]:
+        """
+        Start scoring every answer that has no score yet
+
+        Scoring tasks die with the session that started them (disconnects
+        cancel them), so a resumed or completing interview re-queues the
+        answers they left unscored. Answers whose every dimension failed to
+        score (e.g. during an LLM outage) count as unscored.
+
+        Args:
+            interview_data: Interview record with the scores collected so far
+            transcript: The interview's transcript
+            exclude: Question whose answer may still continue (the pending one)
+
+        Returns:
+            The started tasks, to be collected like live scoring tasks
+        """
+        scored = {entry["question_number"] for entry in interview_data.get("answer_scores", []) if entry.get("scores")}
+        tasks = []
+        for question_number, question, answer in self.answered_questions(transcript):
+            if question_number in scored or question_number == exclude:
+                continue
+            logger.info(f"Re-scoring answer {question_number} of interview {interview_data.get('id')}")
+            tasks.append(asyncio.create_task(self.score_answer(
+                question_number=question_number,
+                question=question,
+                answer=answer,
+                cv_path=interview_data["cv_path"],
+                jd_path=interview_data["jd_path"]
+            )))
+        return tasks
+
+    async def drain(self, interview_data: Dict[str, Any], tasks: List[asyncio.Task]):
+        """Wait for outstanding scoring tasks and collect their results"""
+        if tasks:
+            await asyncio.wait(tasks)
+        self.collect_finished(interview_data, tasks)
+
+    @staticmethod
+    def aggregate(answer_scores: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Aggregate per-answer scores into a final assessment
+
+        Args:
+            answer_scores: Entries produced by score_answer
+
+        Returns:
+            Assessment dict with rating, verdict and detailed_feedback, or None
+            if no answer was scored
+        """
+        per_dimension: Dict[str, List[int]] = {dimension: [] for dimension in DIMENSIONS}
+        strengths: List[str] = []
+        weaknesses: List[str] = []
+
+        for entry in sorted(answer_scores, key=lambda e: e["question_number"]):
+            for dimension, result in entry["scores"].items():
+                if dimension not in per_dimension:
+                    continue
+                per_dimension[dimension].append(result["score"])
+                if result.get("evidence"):
+                    if result["score"] >= 7:
+                        strengths.append(result["evidence"])
+                    elif result["score"] <= 4:
+                        weaknesses.append(result["evidence"])
+
+        dimension_scores = {
+            dimension: round(sum(scores) / len(scores), 1)
+            for dimension, scores in per_dimension.items()
+            if scores
+        }
+        if not dimension_scores:
+            return None
+
+        rating = round(sum(dimension_scores.values()) / len(dimension_scores))
+        rating = max(1, min(10, rating))
+
+        if rating >= 8:
+            verdict = "Strong hire: the candidate consistently performed well across all areas."
+        elif rating >= 6:
+            verdict = "Hire: the candidate is a good match with some areas to develop."
+        elif rating >= 4:
+            verdict = "Borderline: review the transcript before making a decision."
+        else:
+            verdict = "No hire: the candidate does not meet the requirements for this role."
+
+        role_fit = dimension_scores.get("role_fit")
+        fit_for_role = (
+            f"Average role fit score of {role_fit}/10 across {len(per_dimension['role_fit'])} answers."
+            if role_fit is not None else "Role fit could not be scored."
+        )
+
+        return {
+            "rating": rating,
+            "verdict": verdict,
+            "detailed_feedback": {
+                "strengths": strengths,
+                "weaknesses": weaknesses,
+                "fit_for_role": fit_for_role,
+                "dimension_scores": dimension_scores
+            }
+        }
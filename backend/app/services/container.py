@@ -0,0 +1,240 @@
+# backend/app/services/container.py
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+from config import SHUTDOWN_DRAIN_SECONDS, WARM_UP_SERVICES, LOOP_WATCHDOG, LOOP_BLOCK_THRESHOLD_MS, GC_INTERVAL_MINUTES
+
+logger = logging.getLogger(__name__)
+
+class ServiceContainer:
+    """
+    Process-wide service instances shared by the app, the routers and the
+    interview websocket.
+
+    Services are created on first use, so importing this module (or serving
+    routes that need no provider) does not construct SDK clients. Startup runs
+    the registered warm-up hooks and shutdown drains live interviews before
+    closing pooled clients.
+    """
+
+    def __init__(self):
+        self._llm = None
+        self._stt = None
+        self._tts = None
+        self._livekit = None
+        self._assessment = None
+        self._prerender = None
+        self._warm_ups: List[Callable[[], Awaitable[None]]] = []
+        self.accepting_sessions = True
+        self.active_sessions = 0
+        self._idle: Optional[asyncio.Event] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self.watchdog = None
+        self._gc_task: Optional[asyncio.Task] = None
+
+    @property
+    def llm(self):
+        if self._llm is None:
+            from services.llm_service import LLMService
+            self._llm = LLMService()
+        return self._llm
+
+    @property
+    def stt(self):
+        if self._stt is None:
+            from services.stt_service import STTService
+            self._stt = STTService()
+        return self._stt
+
+    @property
+    def tts(self):
+        if self._tts is None:
+            from services.tts_service import TTSService
+            self._tts = TTSService()
+        return self._tts
+
+    @property
+    def livekit(self):
+        if self._livekit is None:
+            from services.livekit_service import LiveKitService
+            self._livekit = LiveKitService()
+        return self._livekit
+
+    @property
+    def assessment(self):
+        if self._assessment is None:
+            from services.assessment_service import AssessmentService
+            self._assessment = AssessmentService(self.llm)
+        return self._assessment
+
+    @property
+    def prerender(self):
+        if self._prerender is None:
+            from services.prerender_service import PrerenderService
+            self._prerender = PrerenderService(self.tts)
+        return self._prerender
+
+    @property
+    def analytics(self):
+        from services.analytics_service import get_analytics_service
+        return get_analytics_service()
+
+    @property
+    def search(self):
+        from services.search_service import get_search_index
+        return get_search_index()
+
+    @property
+    def fulltext(self):
+        from services.fulltext_service import get_fulltext_index
+        return get_fulltext_index()
+
+    @property
+    def events(self):
+        from services.event_bus import get_event_bus
+        return get_event_bus()
+
+    @property
+    def interviews(self):
+        from services.interview_store import get_interview_store
+        return get_interview_store()
+
+    @property
+    def sessions(self):
+        from services.session_registry import get_session_registry
+        return get_session_registry()
+
+    def add_warm_up(self, hook: Callable[[], Awaitable[None]]):
+        """Register a coroutine function to run at startup"""
+        self._warm_ups.append(hook)
+
+    async def startup(self):
+        """
+        Start warm-up hooks in the background, so the worker is ready to serve
+        immediately and the first interview still finds warm clients.
+        """
+        self._idle = asyncio.Event()
+        self._idle.set()
+        if LOOP_WATCHDOG:
+            from utils.loop_monitor import LoopWatchdog
+            self.watchdog = LoopWatchdog(threshold=LOOP_BLOCK_THRESHOLD_MS / 1000)
+            self.watchdog.start()
+        self._warm_up_task = asyncio.create_task(self._run_warm_ups())
+        if GC_INTERVAL_MINUTES > 0:
+            self._gc_task = asyncio.create_task(self._run_gc(GC_INTERVAL_MINUTES * 60))
+
+    async def _run_warm_ups(self):
+        # Failures are logged and never prevent startup
+        for hook in self._warm_ups:
+            try:
+                await hook()
+            except Exception as e:
+                logger.error(f"Warm-up hook {getattr(hook, '__name__', hook)} failed: {str(e)}")
+
+    async def _run_gc(self, interval: float):
+        """Run the retention GC off the event loop every `interval` seconds, in one worker at a time"""
+        from services.retention_service import RetentionService
+        gc = RetentionService()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(gc.run_if_due, interval)
+            except Exception as e:
+                logger.error(f"Retention GC failed: {str(e)}")
+
+    def session_started(self):
+        self.active_sessions += 1
+        if self._idle is not None:
+            self._idle.clear()
+
+    def session_finished(self):
+        self.active_sessions = max(0, self.active_sessions - 1)
+        if self.active_sessions == 0 and self._idle is not None:
+            self._idle.set()
+
+    async def shutdown(self, drain_timeout: float = SHUTDOWN_DRAIN_SECONDS):
+        """
+        Stop accepting interviews, wait for live ones to finish, then flush
+        the local indexes and close pooled provider clients.
+        """
+        self.accepting_sessions = False
+        for task in (self._warm_up_task, self._gc_task):
+            if task is not None and not task.done():
+                task.cancel()
+        if self._prerender is not None:
+            await self._prerender.shutdown()
+
+        if self.active_sessions and self._idle is not None:
+            logger.info(f"Draining {self.active_sessions} live interview(s)")
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{self.active_sessions} interview(s) still live after {drain_timeout}s; they can resume on another worker")
+
+        for name, flush in (
+            ("analytics", lambda: self.analytics.flush()),
+            ("search", lambda: self.search.flush()),
+            ("full-text", lambda: self.fulltext.flush())
+        ):
+            try:
+                await asyncio.to_thread(flush)
+            except Exception as e:
+                logger.error(f"Error flushing {name} index: {str(e)}")
+
+        for service in (self._tts, self._stt):
+            if service is not None:
+                try:
+                    await service.close()
+                except Exception as e:
+                    logger.error(f"Error closing {type(service).__name__}: {str(e)}")
+        
+        if self.watchdog is not None:
+            self.watchdog.stop()
+
+
+async def _warm_up_indexes():
+    """Load the analytics and search stores before the first request needs them"""
+    await asyncio.to_thread(lambda: (container.analytics.list_roles(), len(container.search), container.fulltext.ensure_built()))
+
+async def _warm_up_clients():
+    """Construct provider clients so the first interview does not pay for it"""
+    container.llm, container.stt, container.tts, container.livekit
+
+
+container = ServiceContainer()
+if WARM_UP_SERVICES:
+    container.add_warm_up(_warm_up_clients)
+    container.add_warm_up(_warm_up_indexes)
+
+def get_container() -> ServiceContainer:
+    return container
+
+# FastAPI dependencies
+def get_llm_service():
+    return container.llm
+
+def get_prerender_service():
+    return container.prerender
+
+def get_livekit_service():
+    return container.livekit
+
+def get_analytics_service():
+    return container.analytics
+
+def get_search_index():
+    return container.search
+
+def get_fulltext_index():
+    return container.fulltext
+
+def get_session_registry():
+    return container.sessions
+
+def get_event_bus():
+    return container.events
+
+def get_interview_store():
+    return container.interviews
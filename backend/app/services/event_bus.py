@@ -0,0 +1,99 @@
+# backend/app/services/event_bus.py
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Events a subscriber may fall behind by before it is dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class Subscription:
+    """Queue of events for one watcher of one interview"""
+
+    def __init__(self, interview_id: str, maxsize: int = SUBSCRIBER_QUEUE_SIZE):
+        self.interview_id = interview_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        # Set when events were dropped; the watcher must resynchronize
+        self.overflowed = False
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, or None if none arrived within `timeout` seconds"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InterviewEventBus:
+    """
+    In-process publish/subscribe of live interview events.
+
+    The interview websocket publishes transcript turns, status changes and
+    final results as they happen, and admin watchers receive them without
+    reading the interview file. Publishing never blocks: a watcher that falls
+    more than its queue size behind is marked as overflowed and dropped.
+
+    Events only reach watchers in the process driving the interview; other
+    workers have to fall back to watching the interview file.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def subscribe(self, interview_id: str) -> Subscription:
+        subscription = Subscription(interview_id)
+        self._subscribers.setdefault(interview_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.interview_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.interview_id]
+
+    def has_subscribers(self, interview_id: str) -> bool:
+        return interview_id in self._subscribers
+
+    def publish(self, interview_id: str, event: str, data: Dict[str, Any]):
+        """
+        Send an event to every watcher of an interview
+
+        Args:
+            interview_id: Interview the event belongs to
+            event: Event type, e.g. "transcript", "status" or "results"
+            data: JSON-compatible payload
+        """
+        subscribers = self._subscribers.get(interview_id)
+        if not subscribers:
+            return
+        message = {"event": event, "data": data}
+        for subscription in list(subscribers):
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning(f"Dropping slow event subscriber of interview {interview_id}")
+                subscription.overflowed = True
+                self.unsubscribe(subscription)
+
+
+_event_bus: Optional[InterviewEventBus] = None
+
+def get_event_bus() -> InterviewEventBus:
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = InterviewEventBus()
+    return _event_bus
+
+registry.gauge(
+    "interview_event_watchers", "Live interview event subscriptions on this worker",
+    lambda: len(_event_bus) if _event_bus is not None else 0
+)
@@ -0,0 +1,301 @@
+# backend/app/services/export_service.py
+
+import io
+import os
+import csv
+import sys
+import argparse
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import RESULTS_DIR
+from utils.metrics import registry
+from utils.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+EXPORTED_ROWS = registry.counter("interview_export_rows_total", "Interviews written by bulk exports", ["format"])
+
+# Columns of every export; nested values are JSON-encoded in CSV and columnar formats
+COLUMNS = (
+    "interview_id", "status", "role_id", "interviewer_name", "created_at", "completed_at",
+    "questions_asked", "max_questions", "rating", "verdict", "detailed_feedback", "transcript"
+)
+NESTED_COLUMNS = ("detailed_feedback", "transcript")
+
+FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+# Size of the NDJSON and CSV chunks handed to the response
+CHUNK_BYTES = 256 * 1024
+
+# Rows per Parquet row group / Arrow record batch
+BATCH_ROWS = 1000
+
+
+class ExportUnavailable(RuntimeError):
+    """The requested format needs an optional dependency that is not installed"""
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+class ExportFilter:
+    """Which interview records an export includes"""
+
+    def __init__(
+        self,
+        status: Optional[str] = "completed",
+        role_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        include_transcript: bool = True
+    ):
+        """
+        Args:
+            status: Only records with this status (None for all)
+            role_id: Only interviews for this role
+            since: Only interviews completed (or, if unfinished, created) at or after this time
+            until: Only interviews completed (or created) before this time
+            include_transcript: Export the transcript column
+        """
+        self.status = status
+        self.role_id = role_id
+        self.since = since if since is None or since.tzinfo else since.replace(tzinfo=timezone.utc)
+        self.until = until if until is None or until.tzinfo else until.replace(tzinfo=timezone.utc)
+        self.include_transcript = include_transcript
+
+    def skip_file(self, mtime: float) -> bool:
+        """
+        Whether a record can be skipped from its file's mtime alone: every
+        timestamp in a record predates its last save
+        """
+        return self.since is not None and mtime < self.since.timestamp()
+
+    def matches(self, interview_data: Dict[str, Any]) -> bool:
+        if self.status is not None and interview_data.get("status") != self.status:
+            return False
+        if self.role_id is not None and interview_data.get("role_id") != self.role_id:
+            return False
+        if self.since is not None or self.until is not None:
+            moment = _parse_time(interview_data.get("completed_at") or interview_data.get("created_at"))
+            if moment is None:
+                return False
+            if self.since is not None and moment < self.since:
+                return False
+            if self.until is not None and moment >= self.until:
+                return False
+        return True
+
+
+def _columns(export_filter: ExportFilter) -> List[str]:
+    return [column for column in COLUMNS if column != "transcript" or export_filter.include_transcript]
+
+
+def iter_rows(export_filter: ExportFilter, results_dir: Path = RESULTS_DIR) -> Iterator[Dict[str, Any]]:
+    """
+    Matching interview records as export rows, one file at a time
+
+    Only one record is in memory at a time, however many interviews there
+    are. Unreadable records are logged and skipped.
+    """
+    columns = _columns(export_filter)
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if export_filter.skip_file(entry.stat().st_mtime):
+                    continue
+                with open(entry.path, "rb") as f:
+                    interview_data = loads(f.read())
+            except Exception as e:
+                logger.warning(f"Skipping unreadable interview record {entry.name}: {str(e)}")
+                continue
+            if not export_filter.matches(interview_data):
+                continue
+
+            row = {column: interview_data.get(column) for column in columns}
+            row["interview_id"] = interview_data.get("id", entry.name[:-len(".json")])
+            if "transcript" in row:
+                row["transcript"] = row["transcript"] or []
+            yield row
+
+
+def _flat(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Row with nested values encoded as JSON text"""
+    for column in NESTED_COLUMNS:
+        if row.get(column) is not None:
+            row[column] = dumps(row[column]).decode("utf-8")
+    return row
+
+
+def export_ndjson(export_filter: ExportFilter, results_dir: Path = RESULTS_DIR) -> Iterator[bytes]:
+    """One JSON document per line, yielded in chunks of about CHUNK_BYTES"""
+    lines: List[bytes] = []
+    size = 0
+    for row in iter_rows(export_filter, results_dir):
+        line = dumps(row) + b"\n"
+        lines.append(line)
+        size += len(line)
+        EXPORTED_ROWS.inc("ndjson")
+        if size >= CHUNK_BYTES:
+            yield b"".join(lines)
+            lines, size = [], 0
+    yield b"".join(lines)
+
+
+def export_csv(export_filter: ExportFilter, results_dir: Path = RESULTS_DIR) -> Iterator[bytes]:
+    """CSV with a header row, yielded in chunks of about CHUNK_BYTES"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=_columns(export_filter))
+    writer.writeheader()
+    for row in iter_rows(export_filter, results_dir):
+        writer.writerow(_flat(row))
+        EXPORTED_ROWS.inc("csv")
+        if buffer.tell() >= CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=writer.fieldnames)
+    yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only stream whose contents are collected and drained between batches"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ExportUnavailable("Parquet and Arrow exports need pyarrow (pip install pyarrow)")
+
+
+def export_columnar(export_filter: ExportFilter, results_dir: Path = RESULTS_DIR, file_format: str = "parquet") -> Iterator[bytes]:
+    """
+    Parquet file or Arrow IPC stream, one row group / record batch per
+    BATCH_ROWS rows
+
+    Raises:
+        ExportUnavailable: If pyarrow is not installed (raised before the first chunk)
+    """
+    pa = _import_pyarrow()
+    columns = _columns(export_filter)
+    types = {"questions_asked": pa.int32(), "max_questions": pa.int32(), "rating": pa.int32()}
+    schema = pa.schema([(column, types.get(column, pa.string())) for column in columns])
+    return _export_columnar(pa, schema, export_filter, results_dir, file_format)
+
+
+def _export_columnar(pa, schema, export_filter: ExportFilter, results_dir: Path, file_format: str) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        write = writer.write_table
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+        write = writer.write_table
+
+    def flush(batch: List[Dict[str, Any]]):
+        write(pa.Table.from_pylist(batch, schema=schema))
+        EXPORTED_ROWS.inc(file_format, amount=len(batch))
+
+    batch: List[Dict[str, Any]] = []
+    try:
+        for row in iter_rows(export_filter, results_dir):
+            batch.append(_flat(row))
+            if len(batch) == BATCH_ROWS:
+                flush(batch)
+                batch = []
+                yield sink.drain()
+        if batch:
+            flush(batch)
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def export(export_filter: ExportFilter, file_format: str = "ndjson", results_dir: Path = RESULTS_DIR) -> Iterator[bytes]:
+    """
+    Stream matching interviews in `file_format` (see FORMATS)
+
+    The returned iterator is synchronous and blocking; servers iterate it
+    in a thread.
+
+    Raises:
+        ValueError: For an unknown format
+        ExportUnavailable: If the format needs pyarrow and it is not installed
+    """
+    if file_format == "ndjson":
+        return export_ndjson(export_filter, results_dir)
+    if file_format == "csv":
+        return export_csv(export_filter, results_dir)
+    if file_format in ("parquet", "arrow"):
+        return export_columnar(export_filter, results_dir, file_format)
+    raise ValueError(f"Unknown export format {file_format!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export interview results as NDJSON, CSV, Parquet or Arrow")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="ndjson")
+    parser.add_argument("--output", type=Path, help="Output file (default: standard output)")
+    parser.add_argument("--status", default="completed", help="Interview status to export, or 'any'")
+    parser.add_argument("--role-id", help="Only interviews for this role")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Completed at or after this ISO date/time")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Completed before this ISO date/time")
+    parser.add_argument("--no-transcript", action="store_true", help="Leave out the transcript column")
+    args = parser.parse_args()
+
+    export_filter = ExportFilter(
+        status=None if args.status == "any" else args.status,
+        role_id=args.role_id,
+        since=args.since,
+        until=args.until,
+        include_transcript=not args.no_transcript
+    )
+    try:
+        chunks = export(export_filter, args.format)
+    except ExportUnavailable as e:
+        parser.error(str(e))
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    # From backend/app: python -m services.export_service --format csv --output results.csv
+    main()
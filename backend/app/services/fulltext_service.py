@@ -0,0 +1,366 @@
+# backend/app/services/fulltext_service.py
+
+import re
+import sqlite3
+import argparse
+import threading
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from config import FULLTEXT_INDEX_PATH, RESULTS_DIR
+from utils.serialization import loads
+
+logger = logging.getLogger(__name__)
+
+# Searchable columns of an interview document, by search field and speaker
+FIELD_COLUMNS = {
+    "transcript": ("candidate", "interviewer"),
+    "verdict": ("verdict",),
+    "feedback": ("feedback",),
+}
+SPEAKER_COLUMNS = {"candidate": ("candidate",), "ai": ("interviewer",)}
+TEXT_COLUMNS = ("candidate", "interviewer", "verdict", "feedback")
+
+# Snippet markers around matched terms (plain text, safe to render escaped)
+MATCH_START, MATCH_END = "**", "**"
+
+# A quoted phrase or a bare term, optionally a prefix ("kube*")
+QUERY_TERM_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+SCHEMA = (
+    # Maps interview ids to the rowids of their documents
+    "CREATE TABLE IF NOT EXISTS interviews (id INTEGER PRIMARY KEY, interview_id TEXT UNIQUE NOT NULL)",
+    # One document per interview, so FTS5 ranks interviews directly. C++ and
+    # C# stay single tokens; Porter stemming matches "deployed" to "deploy".
+    "CREATE VIRTUAL TABLE IF NOT EXISTS interviews_fts USING fts5("
+    "candidate, interviewer, verdict, feedback, "
+    "status UNINDEXED, role_id UNINDEXED, completed_at UNINDEXED, "
+    "tokenize=\"porter unicode61 tokenchars '+#'\")",
+)
+
+
+def match_expression(query: str) -> Optional[str]:
+    """
+    Translate a user query into an FTS5 MATCH expression
+
+    Terms are ANDed; "quoted text" is a phrase, a trailing * makes a prefix
+    query and OR between terms is kept. Everything else is quoted, so user
+    input never causes an FTS5 syntax error.
+
+    Returns:
+        The expression, or None if the query has no terms
+    """
+    parts = []
+    for phrase, term in QUERY_TERM_RE.findall(query):
+        if term == "OR" and parts and parts[-1] != "OR":
+            parts.append("OR")
+            continue
+        text = phrase if phrase else term
+        prefix = not phrase and text.endswith("*")
+        text = text.replace('"', "").rstrip("*").strip()
+        if text:
+            parts.append(f'"{text}"' + ("*" if prefix else ""))
+    while parts and parts[-1] == "OR":
+        parts.pop()
+    return " ".join(parts) or None
+
+
+def feedback_text(feedback: Any) -> str:
+    """All text in a detailed_feedback structure, one value per line"""
+    if isinstance(feedback, str):
+        return feedback
+    if isinstance(feedback, dict):
+        return "\n".join(filter(None, (feedback_text(value) for value in feedback.values())))
+    if isinstance(feedback, (list, tuple)):
+        return "\n".join(filter(None, (feedback_text(value) for value in feedback)))
+    return "" if feedback is None else str(feedback)
+
+
+class FullTextIndex:
+    """
+    SQLite FTS5 index over transcripts, verdicts and detailed feedback.
+
+    Each interview is one document with the candidate's turns, the
+    interviewer's turns, the verdict and the feedback as BM25-ranked
+    columns. The websocket appends turns as they are spoken and re-indexes
+    the whole interview when it starts and completes. Writes are queued and
+    committed in batches by a background thread, so they never wait on the
+    disk (or on another worker's transaction) in the event loop. The
+    database is a single file in WAL mode, shared by every worker like the
+    session registry.
+    """
+
+    def __init__(self, path: Path = FULLTEXT_INDEX_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._pending: List[Callable[[sqlite3.Connection], None]] = []
+        self._condition = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self._writing = False
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._schema_ready:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+                self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def __len__(self) -> int:
+        """Number of indexed interviews"""
+        return self._connect().execute("SELECT COUNT(*) FROM interviews").fetchone()[0]
+
+    # Writes
+
+    def _submit(self, operation: Callable[[sqlite3.Connection], None]):
+        with self._condition:
+            self._pending.append(operation)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="fulltext-writer", daemon=True)
+                self._writer.start()
+            self._condition.notify_all()
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                operations, self._pending = self._pending, []
+                self._writing = True
+            try:
+                self.apply(operations)
+            except Exception as e:
+                logger.error(f"Error updating full-text index ({len(operations)} change(s) lost): {str(e)}")
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def apply(self, operations: List[Callable[[sqlite3.Connection], None]]):
+        """Run write operations in one transaction (blocking)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for operation in operations:
+                operation(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until queued changes are committed; False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout=timeout)
+
+    @staticmethod
+    def _document_id(conn: sqlite3.Connection, interview_id: str) -> Optional[int]:
+        row = conn.execute("SELECT id FROM interviews WHERE interview_id = ?", (interview_id,)).fetchone()
+        return row[0] if row else None
+
+    def add_turn(self, interview_id: str, speaker: str, text: str):
+        """Queue a transcript turn to be appended to an interview's document"""
+        column = "candidate" if speaker == "candidate" else "interviewer"
+
+        def operation(conn):
+            document_id = self._document_id(conn, interview_id)
+            if document_id is None:
+                document_id = conn.execute("INSERT INTO interviews (interview_id) VALUES (?)", (interview_id,)).lastrowid
+                conn.execute(
+                    f"INSERT INTO interviews_fts (rowid, {column}, status) VALUES (?, ?, 'in_progress')",
+                    (document_id, text)
+                )
+            else:
+                conn.execute(
+                    f"UPDATE interviews_fts SET {column} = COALESCE({column} || char(10), '') || ? WHERE rowid = ?",
+                    (text, document_id)
+                )
+        self._submit(operation)
+
+    def _index_operation(self, interview_data: Dict[str, Any]) -> Callable[[sqlite3.Connection], None]:
+        interview_id = interview_data["id"]
+        turns = {"candidate": [], "interviewer": []}
+        for entry in interview_data.get("transcript") or []:
+            turns["candidate" if entry["speaker"] == "candidate" else "interviewer"].append(entry["text"])
+        document = (
+            "\n".join(turns["candidate"]),
+            "\n".join(turns["interviewer"]),
+            interview_data.get("verdict") or "",
+            feedback_text(interview_data.get("detailed_feedback")),
+            interview_data.get("status"),
+            interview_data.get("role_id"),
+            interview_data.get("completed_at")
+        )
+
+        def operation(conn):
+            document_id = self._document_id(conn, interview_id)
+            if document_id is None:
+                document_id = conn.execute("INSERT INTO interviews (interview_id) VALUES (?)", (interview_id,)).lastrowid
+            else:
+                conn.execute("DELETE FROM interviews_fts WHERE rowid = ?", (document_id,))
+            conn.execute(
+                "INSERT INTO interviews_fts (rowid, candidate, interviewer, verdict, feedback, status, role_id, completed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (document_id,) + document
+            )
+        return operation
+
+    def index_interview(self, interview_data: Dict[str, Any]):
+        """
+        Queue an interview to be (re-)indexed from its record, replacing the
+        turns appended so far
+        """
+        self._submit(self._index_operation(interview_data))
+
+    def ensure_built(self, results_dir: Path = RESULTS_DIR):
+        """Build the index from stored records on first run (blocking)"""
+        if len(self) == 0 and any(Path(results_dir).glob("*.json")):
+            logger.info(f"Indexed {self.rebuild(results_dir)} interview(s) for full-text search")
+
+    def rebuild(self, results_dir: Path = RESULTS_DIR, batch: int = 500) -> int:
+        """
+        Index every stored interview record (blocking)
+
+        Returns:
+            The number of interviews indexed
+        """
+        operations = []
+        count = 0
+        for file_path in Path(results_dir).glob("*.json"):
+            try:
+                with open(file_path, "rb") as f:
+                    operations.append(self._index_operation(loads(f.read())))
+            except Exception as e:
+                logger.error(f"Skipping {file_path.name} during full-text rebuild: {str(e)}")
+                continue
+            count += 1
+            if len(operations) == batch:
+                self.apply(operations)
+                operations = []
+        if operations:
+            self.apply(operations)
+        return count
+
+    # Queries
+
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        field: Optional[str] = None,
+        speaker: Optional[str] = None,
+        status: Optional[str] = None,
+        role_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Find interviews matching a query, best first (blocking)
+
+        Args:
+            query: Search terms (see match_expression)
+            page: 1-based page number
+            page_size: Interviews per page
+            field: Only match "transcript", "verdict" or "feedback"
+            speaker: Only match transcript turns of "candidate" or "ai"
+            status: Only interviews with this status
+            role_id: Only interviews for this role
+
+        Returns:
+            {"query", "total", "page", "page_size", "results": [...]}; each
+            result has its BM25 score and a snippet per matching field
+        """
+        response = {"query": query, "total": 0, "page": page, "page_size": page_size, "results": []}
+        expression = match_expression(query)
+        columns = [
+            column for column in TEXT_COLUMNS
+            if (field is None or column in FIELD_COLUMNS[field]) and (speaker is None or column in SPEAKER_COLUMNS[speaker])
+        ]
+        if expression is None or not columns:
+            return response
+        if len(columns) < len(TEXT_COLUMNS):
+            expression = f"{{{' '.join(columns)}}} : ({expression})"
+
+        conditions, params = ["interviews_fts MATCH ?"], [expression]
+        for column, value in (("status", status), ("role_id", role_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        where = " AND ".join(conditions)
+
+        conn = self._connect()
+        response["total"] = conn.execute(f"SELECT COUNT(*) FROM interviews_fts WHERE {where}", params).fetchone()[0]
+        ranked = conn.execute(
+            f"SELECT rowid, rank FROM interviews_fts WHERE {where} ORDER BY rank LIMIT ? OFFSET ?",
+            params + [page_size, (page - 1) * page_size]
+        ).fetchall()
+        if not ranked:
+            return response
+
+        # Snippets only for the page, not for every match
+        snippets = ", ".join(
+            f"snippet(interviews_fts, {TEXT_COLUMNS.index(column)}, '{MATCH_START}', '{MATCH_END}', '…', 16)"
+            for column in columns
+        )
+        rows = {
+            row[0]: row[1:] for row in conn.execute(
+                f"SELECT f.rowid, i.interview_id, f.status, f.role_id, f.completed_at, {snippets} "
+                f"FROM interviews_fts f JOIN interviews i ON i.id = f.rowid "
+                f"WHERE interviews_fts MATCH ? AND f.rowid IN ({','.join('?' * len(ranked))})",
+                [expression] + [document_id for document_id, _ in ranked]
+            )
+        }
+        for document_id, rank in ranked:
+            interview_id, interview_status, interview_role, completed_at, *column_snippets = rows[document_id]
+            matches = [
+                {"field": "transcript" if column in FIELD_COLUMNS["transcript"] else column,
+                 "speaker": {"candidate": "candidate", "interviewer": "ai"}.get(column),
+                 "snippet": snippet}
+                for column, snippet in zip(columns, column_snippets)
+                if MATCH_START in (snippet or "")
+            ]
+            response["results"].append({
+                "interview_id": interview_id,
+                "score": round(-rank, 4),
+                "status": interview_status,
+                "role_id": interview_role,
+                "completed_at": completed_at,
+                "matches": matches
+            })
+        return response
+
+
+_fulltext_index: Optional[FullTextIndex] = None
+
+def get_fulltext_index() -> FullTextIndex:
+    global _fulltext_index
+    if _fulltext_index is None:
+        _fulltext_index = FullTextIndex()
+    return _fulltext_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text index of interview transcripts and feedback")
+    parser.add_argument("--rebuild", action="store_true", help="Index every stored interview record")
+    parser.add_argument("query", nargs="?", help="Search the index")
+    args = parser.parse_args()
+
+    index = get_fulltext_index()
+    if args.rebuild:
+        print(f"Indexed {index.rebuild()} interview(s)")
+    if args.query:
+        for result in index.search(args.query)["results"]:
+            print(f"{result['score']:8.3f}  {result['interview_id']}  {result['status']}")
+            for match in result["matches"]:
+                print(f"          {match['field']}: {match['snippet']}")
+
+
+if __name__ == "__main__":
+    # From backend/app: python -m services.fulltext_service --rebuild ["kubernetes"]
+    main()
@@ -0,0 +1,142 @@
+# backend/app/services/interview_store.py
+
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import RESULTS_DIR, INTERVIEW_VERSION_RECHECK_SECONDS
+from utils.serialization import loads
+from utils.storage import save_json
+
+logger = logging.getLogger(__name__)
+
+
+class RecordVersion:
+    """What the version index knows about one interview record"""
+
+    __slots__ = ("version", "mtime_ns", "status", "turns", "checked")
+
+    def __init__(self, version: int, mtime_ns: int, status: Optional[str], turns: int):
+        self.version = version
+        self.mtime_ns = mtime_ns
+        self.status = status
+        self.turns = turns
+        # time.monotonic() of the last confirmation against the file
+        self.checked = time.monotonic()
+
+    @property
+    def etag(self) -> str:
+        # The mtime tells apart records two workers saved with the same version
+        return f'"{self.version}.{self.mtime_ns:x}"'
+
+
+class InterviewStore:
+    """
+    Interview records with a version number bumped on every save, and an
+    in-memory index of the current version of each record.
+
+    Every writer of an interview record goes through save(), which updates
+    the index, so conditional requests from polling dashboards are answered
+    without touching disk. Records saved by other workers are noticed by
+    stat'ing the file (never reading it) once the index entry is older than
+    `recheck_seconds`; 0 stats on every lookup.
+    """
+
+    def __init__(self, results_dir: Path = RESULTS_DIR, recheck_seconds: float = INTERVIEW_VERSION_RECHECK_SECONDS):
+        self.results_dir = Path(results_dir)
+        self.recheck_seconds = recheck_seconds
+        self._index: Dict[str, RecordVersion] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def path(self, interview_id: str) -> Path:
+        return self.results_dir / f"{interview_id}.json"
+
+    def _record(self, interview_id: str, interview_data: dict, mtime_ns: int) -> RecordVersion:
+        entry = RecordVersion(
+            interview_data.get("version", 0),
+            mtime_ns,
+            interview_data.get("status"),
+            len(interview_data.get("transcript") or ())
+        )
+        self._index[interview_id] = entry
+        return entry
+
+    def save(self, interview_data: dict) -> Path:
+        """
+        Save an interview record as its next version
+
+        Args:
+            interview_data: The record; its "version" is incremented in place
+
+        Returns:
+            Path to the saved file
+        """
+        interview_data["version"] = interview_data.get("version", 0) + 1
+        path = save_json(interview_data, self.path(interview_data["id"]))
+        self._record(interview_data["id"], interview_data, path.stat().st_mtime_ns)
+        return path
+
+    def version(self, interview_id: str) -> Optional[RecordVersion]:
+        """
+        Current version of a record, from memory while the index entry is fresh
+
+        Returns:
+            The version, or None if the interview does not exist
+        """
+        entry = self._index.get(interview_id)
+        if entry is not None and time.monotonic() - entry.checked < self.recheck_seconds:
+            return entry
+        try:
+            mtime_ns = self.path(interview_id).stat().st_mtime_ns
+        except FileNotFoundError:
+            self._index.pop(interview_id, None)
+            return None
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            entry.checked = time.monotonic()
+            return entry
+        # First lookup, or saved by another worker
+        return self.read(interview_id)[1]
+
+    def read_bytes(self, interview_id: str) -> Tuple[bytes, RecordVersion]:
+        """
+        Raw record and the version it holds
+
+        The document is only decoded when it is not the indexed version.
+
+        Raises:
+            FileNotFoundError: If the interview does not exist
+        """
+        with open(self.path(interview_id), "rb") as f:
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            data = f.read()
+        entry = self._index.get(interview_id)
+        if entry is None or entry.mtime_ns != mtime_ns:
+            entry = self._record(interview_id, loads(data), mtime_ns)
+        else:
+            entry.checked = time.monotonic()
+        return data, entry
+
+    def read(self, interview_id: str) -> Tuple[dict, RecordVersion]:
+        """
+        Decoded record and its version
+
+        Raises:
+            FileNotFoundError: If the interview does not exist
+        """
+        with open(self.path(interview_id), "rb") as f:
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            interview_data = loads(f.read())
+        return interview_data, self._record(interview_id, interview_data, mtime_ns)
+
+
+_interview_store: Optional[InterviewStore] = None
+
+def get_interview_store() -> InterviewStore:
+    global _interview_store
+    if _interview_store is None:
+        _interview_store = InterviewStore()
+    return _interview_store
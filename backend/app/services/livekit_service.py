@@ -3,7 +3,6 @@
 import os
 import logging
 import time
-import jwt
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +54,7 @@ class LiveKitService:
             }
             
             # Generate JWT token
+            import jwt
             token = jwt.encode(claims, self.api_secret, algorithm="HS256")
             
             return token
@@ -1,44 +1,143 @@
 # backend/app/services/llm_service.py
 
 import os
-import openai
 import json
+import asyncio
 import logging
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
 from pathlib import Path
-import PyPDF2
 from utils.prompt_utils import (
     create_initial_questions_prompt,
     create_follow_up_prompt,
-    create_assessment_prompt
+    create_assessment_prompt,
+    create_assessment_repair_prompt,
+    create_dimension_score_prompt
 )
+from utils.structured_output import parse_structured
+from models.schemas import Assessment, DimensionScore
+from utils.latency import Deadline, LatencyTracker, call_with_deadline
+from utils.metrics import observe_provider, span
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FOLLOW_UP_QUESTION = "Can you elaborate more on your previous answer?"
+
+# Extracted PDF texts kept in memory (a CV and a job description per live interview)
+PDF_TEXT_CACHE_SIZE = 128
+
+# Models accepting response_format={"type": "json_object"}; gpt-4 and the
+# older gpt-3.5-turbo snapshots reject the request
+JSON_MODE_MODEL_PREFIXES = (
+    "gpt-4o", "gpt-4.1", "gpt-4-turbo", "gpt-4-1106", "gpt-4-0125",
+    "gpt-3.5-turbo-1106", "gpt-3.5-turbo-0125"
+)
+
+def supports_json_mode(model: str) -> bool:
+    """Whether a chat model accepts JSON mode"""
+    return model.startswith(JSON_MODE_MODEL_PREFIXES)
+
 class LLMService:
     """Service for interacting with OpenAI's GPT models"""
     
     def __init__(self):
         """Initialize the LLM service with API key from environment"""
-        openai.api_key = os.getenv("OPENAI_API_KEY")
-        if not openai.api_key:
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
             logger.warning("OPENAI_API_KEY not found in environment variables")
         
+        # The OpenAI SDK is imported on first use to keep worker startup fast
+        self._openai = None
+        
         self.model = os.getenv("OPENAI_MODEL", "gpt-4")
+        
+        # Hedged requests trade extra provider calls for a shorter latency tail
+        self.hedge = os.getenv("HEDGE_REQUESTS", "False").lower() == "true"
+        self.hedge_percentile = float(os.getenv("HEDGE_PERCENTILE", "95"))
+        self.follow_up_latency = LatencyTracker()
+        
+        # Ask for JSON mode on structured prompts: "auto" only for models that accept it
+        json_mode = os.getenv("OPENAI_JSON_MODE", "auto").lower()
+        self.json_mode = supports_json_mode(self.model) if json_mode == "auto" else json_mode == "true"
+        
+        # Extracted CV/JD text keyed by (path, mtime), least recently used
+        # first; the PDFs are re-read every turn
+        self._pdf_text_cache: OrderedDict = OrderedDict()
+    
+    @property
+    def openai(self):
+        """The configured OpenAI SDK module"""
+        if self._openai is None:
+            import openai
+            openai.api_key = self.api_key
+            self._openai = openai
+        return self._openai
     
     async def _extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text content from PDF file"""
         text = ""
         try:
+            cache_key = (pdf_path, os.path.getmtime(pdf_path))
+            if cache_key in self._pdf_text_cache:
+                self._pdf_text_cache.move_to_end(cache_key)
+                return self._pdf_text_cache[cache_key]
+            
+            import PyPDF2
+            
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 for page in pdf_reader.pages:
                     text += page.extract_text() + "\n"
+            
+            self._pdf_text_cache[cache_key] = text
+            if len(self._pdf_text_cache) > PDF_TEXT_CACHE_SIZE:
+                self._pdf_text_cache.popitem(last=False)
             return text
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             return ""
     
+    async def get_document_text(self, pdf_path: str) -> str:
+        """Text of a CV or job description PDF (cached per file)"""
+        return await self._extract_text_from_pdf(pdf_path)
+    
+    async def _complete_json(self, prompt: Dict[str, str], temperature: float, max_tokens: int) -> str:
+        """
+        Run a chat completion that is expected to return a JSON object
+        
+        The prompts ask for JSON themselves and replies are parsed with the
+        tolerant extractor, so JSON mode is an optimization: if the model
+        rejects it, it is turned off and the request is sent without it.
+        """
+        messages = [
+            {"role": "system", "content": prompt["system"]},
+            {"role": "user", "content": prompt["user"]}
+        ]
+        with observe_provider("openai", "complete_json"):
+            if self.json_mode:
+                try:
+                    response = await self.openai.ChatCompletion.acreate(
+                        model=self.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        response_format={"type": "json_object"}
+                    )
+                    return response.choices[0].message.content
+                except Exception as e:
+                    # Bad request (400): the model does not accept response_format
+                    if (getattr(e, "http_status", None) or getattr(e, "status_code", None)) != 400:
+                        raise
+                    logger.warning(f"Model {self.model} rejected JSON mode, disabling it: {str(e)}")
+                    self.json_mode = False
+            response = await self.openai.ChatCompletion.acreate(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        return response.choices[0].message.content
+    
     async def generate_initial_questions(
         self, 
         cv_path: str, 
@@ -65,7 +164,7 @@ class LLMService:
             )
             
             # Call OpenAI API
-            response = await openai.ChatCompletion.acreate(
+            response = await self.openai.ChatCompletion.acreate(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": prompt["system"]},
@@ -114,42 +213,59 @@ class LLMService:
         transcript: List[Dict[str, str]], 
         system_prompt: str,
         cv_path: str,
-        jd_path: str
+        jd_path: str,
+        deadline: Optional[Deadline] = None
     ) -> str:
-        """Generate a follow-up question based on the interview transcript so far"""
+        """
+        Generate a follow-up question based on the interview transcript so far.
+        
+        If the turn deadline is reached first, DEFAULT_FOLLOW_UP_QUESTION is
+        returned so the caller can use its pre-synthesized audio.
+        """
         try:
-            # Extract text from PDFs
-            cv_text = await self._extract_text_from_pdf(cv_path)
-            jd_text = await self._extract_text_from_pdf(jd_path)
+            with span("prompt_build"):
+                # Extract text from PDFs
+                cv_text = await self._extract_text_from_pdf(cv_path)
+                jd_text = await self._extract_text_from_pdf(jd_path)
+                
+                # Create prompt for GPT
+                prompt = create_follow_up_prompt(
+                    transcript=transcript,
+                    cv_text=cv_text,
+                    jd_text=jd_text,
+                    system_prompt=system_prompt
+                )
             
-            # Create prompt for GPT
-            prompt = create_follow_up_prompt(
-                transcript=transcript,
-                cv_text=cv_text,
-                jd_text=jd_text,
-                system_prompt=system_prompt
-            )
-            
-            # Call OpenAI API
-            response = await openai.ChatCompletion.acreate(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": prompt["system"]},
-                    {"role": "user", "content": prompt["user"]}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
+            # Call OpenAI API within the remaining turn budget
+            with observe_provider("openai", "follow_up"):
+                response = await call_with_deadline(
+                    lambda: self.openai.ChatCompletion.acreate(
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": prompt["system"]},
+                            {"role": "user", "content": prompt["user"]}
+                        ],
+                        temperature=0.7,
+                        max_tokens=1000
+                    ),
+                    deadline=deadline,
+                    tracker=self.follow_up_latency,
+                    hedge=self.hedge,
+                    hedge_percentile=self.hedge_percentile
+                )
             
             # Extract the follow-up question
             follow_up = response.choices[0].message.content.strip()
             
             return follow_up
             
+        except asyncio.TimeoutError:
+            logger.warning("Follow-up question generation exceeded the turn deadline")
+            return DEFAULT_FOLLOW_UP_QUESTION
         except Exception as e:
             logger.error(f"Error generating follow-up question: {str(e)}")
             # Return a default follow-up question
-            return "Can you elaborate more on your previous answer?"
+            return DEFAULT_FOLLOW_UP_QUESTION
     
     async def generate_final_assessment(
         self, 
@@ -171,77 +287,73 @@ class LLMService:
             )
             
             # Call OpenAI API
-            response = await openai.ChatCompletion.acreate(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": prompt["system"]},
-                    {"role": "user", "content": prompt["user"]}
-                ],
-                temperature=0.5,
-                max_tokens=2000
-            )
+            content = await self._complete_json(prompt, temperature=0.5, max_tokens=2000)
             
-            # Extract the assessment
-            content = response.choices[0].message.content
+            # Validate in a single pass, allowing one bounded repair attempt
+            assessment, error = parse_structured(content, Assessment)
+            if assessment is None:
+                logger.warning(f"Assessment failed validation, requesting repair: {error}")
+                repair_prompt = create_assessment_repair_prompt(content, error)
+                content = await self._complete_json(repair_prompt, temperature=0.0, max_tokens=2000)
+                assessment, error = parse_structured(content, Assessment)
             
-            # Try to parse as JSON
-            try:
-                assessment = json.loads(content)
-            except json.JSONDecodeError:
-                # If not valid JSON, create a structured assessment manually
-                assessment = {
-                    "rating": 5,  # Default middle rating
+            if assessment is None:
+                logger.error(f"Assessment still invalid after repair: {error}")
+                return {
+                    "rating": None,
                     "verdict": "Unable to parse assessment properly. Please review the interview transcript.",
                     "detailed_feedback": {
-                        "strengths": ["Unable to parse assessment"],
-                        "weaknesses": ["Unable to parse assessment"],
-                        "fit_for_role": "Uncertain"
+                        "error": error
                     }
                 }
-                
-                # Try to extract rating from text
-                rating_line = [line for line in content.split('\n') if "rating" in line.lower()]
-                if rating_line:
-                    try:
-                        rating_text = rating_line[0].split(':')[1].strip()
-                        rating = int(rating_text[0])
-                        if 1 <= rating <= 10:
-                            assessment["rating"] = rating
-                    except:
-                        pass
-                
-                # Try to extract verdict
-                verdict_lines = []
-                verdict_section = False
-                for line in content.split('\n'):
-                    if "verdict" in line.lower():
-                        verdict_section = True
-                        continue
-                    if verdict_section and line.strip() and not any(kw in line.lower() for kw in ["strength", "weakness", "feedback"]):
-                        verdict_lines.append(line.strip())
-                    if verdict_section and any(kw in line.lower() for kw in ["strength", "weakness", "feedback"]):
-                        break
-                
-                if verdict_lines:
-                    assessment["verdict"] = " ".join(verdict_lines)
             
-            # Ensure required fields exist
-            if "rating" not in assessment:
-                assessment["rating"] = 5
-            if "verdict" not in assessment:
-                assessment["verdict"] = "Review the transcript for a complete assessment."
-            if "detailed_feedback" not in assessment:
-                assessment["detailed_feedback"] = {}
-            
-            return assessment
+            return assessment.model_dump()
             
         except Exception as e:
             logger.error(f"Error generating final assessment: {str(e)}")
             # Return a default assessment if there's an error
             return {
-                "rating": 5,
+                "rating": None,
                 "verdict": "Unable to generate assessment due to an error. Please review the interview transcript.",
                 "detailed_feedback": {
                     "error": str(e)
                 }
-            }
\ No newline at end of file
+            }
+    
+    async def score_answer_dimension(
+        self,
+        dimension: str,
+        question: str,
+        answer: str,
+        cv_path: str,
+        jd_path: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Score a single candidate answer on one assessment dimension
+        
+        Returns:
+            Dict with "score" (1-10) and "evidence", or None if scoring failed
+        """
+        try:
+            cv_text = await self._extract_text_from_pdf(cv_path)
+            jd_text = await self._extract_text_from_pdf(jd_path)
+            
+            prompt = create_dimension_score_prompt(
+                dimension=dimension,
+                question=question,
+                answer=answer,
+                cv_text=cv_text,
+                jd_text=jd_text
+            )
+            
+            content = await self._complete_json(prompt, temperature=0.2, max_tokens=300)
+            score, error = parse_structured(content, DimensionScore)
+            if score is None:
+                logger.warning(f"Invalid {dimension} score: {error}")
+                return None
+            
+            return score.model_dump()
+            
+        except Exception as e:
+            logger.error(f"Error scoring {dimension}: {str(e)}")
+            return None
@@ -0,0 +1,95 @@
+# backend/app/services/prerender_service.py
+
+import asyncio
+import logging
+import os
+from typing import Dict, List
+
+from config import RESULTS_DIR, PROMPT_DIR
+from services.llm_service import DEFAULT_FOLLOW_UP_QUESTION
+from services.interview_store import get_interview_store
+from utils.prompt_utils import COMPLETION_MESSAGE, create_greeting
+from utils.storage import read_json
+
+logger = logging.getLogger(__name__)
+
+
+def opening_texts(interview_data: dict, prompt_data: dict) -> List[str]:
+    """
+    Everything the interview can say without a provider call: the greeting,
+    the first question, the fallback follow-up and the closing message.
+    Later initial questions are never spoken (follow-ups are generated), so
+    they are not synthesized.
+    """
+    texts = [create_greeting(prompt_data.get("interviewer_name", "AI Interviewer"))]
+    texts.extend(interview_data.get("initial_questions", [])[:1])
+    texts.extend([DEFAULT_FOLLOW_UP_QUESTION, COMPLETION_MESSAGE])
+    return texts
+
+
+class PrerenderService:
+    """
+    Synthesizes an interview's opening audio in the background after it is
+    created or its prompt changes, so starting the session needs no provider
+    call.
+
+    Audio files are content-addressed by the TTS service; the text -> URL map
+    is stored as `prerendered_audio` in the interview record, which also keeps
+    the files safe from the retention GC. Rescheduling an interview cancels
+    its previous render, and a render only writes its result if the texts it
+    synthesized are still current.
+    """
+
+    def __init__(self, tts_service, concurrency: int = None):
+        self.tts = tts_service
+        self.concurrency = concurrency or int(os.getenv("PRERENDER_CONCURRENCY", "2"))
+        # Created on first use, inside the running loop
+        self._semaphore = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def schedule(self, interview_id: str):
+        """Start (or restart) pre-rendering an interview's opening audio"""
+        self.cancel(interview_id)
+        task = asyncio.create_task(self._render(interview_id))
+        self._tasks[interview_id] = task
+        task.add_done_callback(lambda done: self._forget(interview_id, done))
+
+    def _forget(self, interview_id: str, task: asyncio.Task):
+        if self._tasks.get(interview_id) is task:
+            del self._tasks[interview_id]
+
+    def cancel(self, interview_id: str):
+        task = self._tasks.pop(interview_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def _synthesize(self, text: str) -> str:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            return await self.tts.text_to_speech(text)
+
+    async def _render(self, interview_id: str):
+        try:
+            interview_path = RESULTS_DIR / f"{interview_id}.json"
+            prompt_path = PROMPT_DIR / f"{interview_id}.json"
+            texts = opening_texts(read_json(interview_path), read_json(prompt_path))
+
+            urls = await asyncio.gather(*(self._synthesize(text) for text in texts))
+
+            # The session may have started, or the prompt changed, while synthesizing
+            interview_data = read_json(interview_path)
+            if interview_data["status"] != "created" or opening_texts(interview_data, read_json(prompt_path)) != texts:
+                return
+            interview_data["prerendered_audio"] = {text: url for text, url in zip(texts, urls) if url}
+            get_interview_store().save(interview_data)
+            logger.info(f"Pre-rendered {len(interview_data['prerendered_audio'])} audio clip(s) for interview {interview_id}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error pre-rendering audio for interview {interview_id}: {str(e)}")
+
+    async def shutdown(self):
+        """Cancel outstanding renders; sessions fall back to synthesizing on demand"""
+        for interview_id in list(self._tasks):
+            self.cancel(interview_id)
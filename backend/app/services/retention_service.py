@@ -0,0 +1,300 @@
+# backend/app/services/retention_service.py
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from config import (
+    DATA_DIR, AUDIO_DIR, CV_DIR, JD_DIR, PROMPT_DIR, RESULTS_DIR,
+    RETENTION_AUDIO_DAYS, RETENTION_DOCUMENTS_DAYS, ORPHAN_GRACE_HOURS, AUDIO_QUOTA_MB,
+    ABANDONED_INTERVIEW_DAYS
+)
+from utils.metrics import registry
+from utils.storage import read_json, file_lock
+
+logger = logging.getLogger(__name__)
+
+GC_DELETED = registry.counter("gc_deleted_files_total", "Files removed by the retention GC", ["artifact"])
+GC_FREED = registry.counter("gc_freed_bytes_total", "Bytes freed by the retention GC", ["artifact"])
+
+# Unfinished interviews keep every artifact they reference, until abandoned
+LIVE_STATUSES = ("created", "in_progress")
+
+# Partially written files left behind by a crash
+STALE_TMP_SECONDS = 3600
+
+
+class ArtifactPolicy:
+    """Retention rules for one kind of artifact"""
+
+    def __init__(self, name: str, directory: Path, pattern: str, retention_days: float = 0, quota_mb: float = 0, per_interview: bool = True):
+        """
+        Args:
+            name: Artifact type, e.g. "audio" or "cv"
+            directory: Directory holding the files
+            pattern: Glob of the files, e.g. "*.pdf"
+            retention_days: Delete unreferenced files older than this (0 keeps them)
+            quota_mb: Evict least recently used unreferenced files above this size (0 is unlimited)
+            per_interview: Files are named after their interview id (CV, JD, prompt)
+        """
+        self.name = name
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.retention_days = retention_days
+        self.quota_mb = quota_mb
+        self.per_interview = per_interview
+
+
+def default_policies() -> List[ArtifactPolicy]:
+    return [
+        ArtifactPolicy("audio", AUDIO_DIR, "*.mp3", RETENTION_AUDIO_DAYS, AUDIO_QUOTA_MB, per_interview=False),
+        ArtifactPolicy("cv", CV_DIR, "*.pdf", RETENTION_DOCUMENTS_DAYS),
+        ArtifactPolicy("jd", JD_DIR, "*.pdf", RETENTION_DOCUMENTS_DAYS),
+        ArtifactPolicy("prompt", PROMPT_DIR, "*.json", RETENTION_DOCUMENTS_DAYS),
+    ]
+
+
+def audio_name(url: Optional[str]) -> Optional[str]:
+    """File stem referenced by an audio URL such as /api/audio/<hash>.mp3"""
+    if not url:
+        return None
+    return url.rsplit("/", 1)[-1].split(".", 1)[0] or None
+
+
+class References:
+    """What the interview records still point at"""
+
+    def __init__(self):
+        self.interviews: Set[str] = set()
+        self.live: Set[str] = set()
+        self.audio: Set[str] = set()
+
+
+class GCReport:
+    """Files a GC pass removed (or would remove, in a dry run)"""
+
+    def __init__(self, dry_run: bool):
+        self.dry_run = dry_run
+        self.scanned: Dict[str, List[int]] = {}  # artifact -> [files, bytes]
+        self.deletions: List[Dict] = []
+
+    def add(self, artifact: str, path: Path, size: int, reason: str):
+        self.deletions.append({"artifact": artifact, "path": str(path), "bytes": size, "reason": reason})
+
+    def freed(self, artifact: str = None) -> int:
+        return sum(d["bytes"] for d in self.deletions if artifact is None or d["artifact"] == artifact)
+
+    def summary(self) -> str:
+        verb = "would free" if self.dry_run else "freed"
+        lines = [f"{'artifact':10s} {'files':>8s} {'size':>10s} {'deleted':>8s} {verb:>10s}"]
+        for artifact, (files, size) in self.scanned.items():
+            deleted = [d for d in self.deletions if d["artifact"] == artifact]
+            lines.append(
+                f"{artifact:10s} {files:8d} {size / 1e6:8.1f}MB {len(deleted):8d} {self.freed(artifact) / 1e6:8.1f}MB"
+            )
+        return "\n".join(lines)
+
+
+class RetentionService:
+    """
+    Garbage collector for synthesized audio and interview artifacts.
+
+    Anything referenced by an unfinished interview is kept, unless its record
+    has not been saved for the abandonment period. Otherwise a file is
+    removed when:
+      - its interview record no longer exists (orphan) and it is older than
+        the orphan grace period,
+      - it is older than its artifact's retention period, or
+      - its artifact type is over quota, least recently used first.
+    Audio is content-addressed and shared between interviews; a cache hit in
+    the TTS service refreshes its mtime, which is what LRU eviction uses.
+
+    Every worker schedules passes, but run_if_due lets only one of them run
+    per interval. Interview records are decoded once and cached until their
+    file changes.
+    """
+
+    def __init__(
+        self,
+        policies: List[ArtifactPolicy] = None,
+        results_dir: Path = RESULTS_DIR,
+        orphan_grace_hours: float = ORPHAN_GRACE_HOURS,
+        abandoned_days: float = ABANDONED_INTERVIEW_DAYS,
+        state_dir: Path = DATA_DIR
+    ):
+        self.policies = policies if policies is not None else default_policies()
+        self.results_dir = Path(results_dir)
+        self.orphan_grace = orphan_grace_hours * 3600
+        self.abandoned_after = abandoned_days * 86400
+        self.lock_path = Path(state_dir) / "gc.lock"
+        # Touched when a pass starts; its mtime is shared by the workers
+        self.stamp_path = Path(state_dir) / "gc.last_run"
+        # Record path -> ((mtime_ns, size), (interview id, status, audio names))
+        self._records: Dict[Path, Tuple[Tuple[int, int], Tuple[str, Optional[str], Tuple[str, ...]]]] = {}
+
+    def _read_record(self, path: Path, key: Tuple[int, int]) -> Tuple[str, Optional[str], Tuple[str, ...]]:
+        cached = self._records.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        interview = read_json(path)
+        pending = (interview.get("session") or {}).get("pending_question") or {}
+        urls = [pending.get("audio_url")] + list((interview.get("prerendered_audio") or {}).values())
+        record = (interview.get("id", path.stem), interview.get("status"), tuple(filter(None, map(audio_name, urls))))
+        self._records[path] = (key, record)
+        return record
+
+    def collect_references(self, now: float = None) -> References:
+        now = time.time() if now is None else now
+        references = References()
+        seen = set()
+        for path in self.results_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+                seen.add(path)
+                interview_id, status, audio = self._read_record(path, (stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                continue
+            except Exception:
+                # Unreadable records still protect their artifacts
+                references.interviews.add(path.stem)
+                references.live.add(path.stem)
+                continue
+            references.interviews.add(interview_id)
+            # Every save rewrites the record, so its mtime is the last activity
+            abandoned = self.abandoned_after and now - stat.st_mtime > self.abandoned_after
+            if status in LIVE_STATUSES and not abandoned:
+                references.live.add(interview_id)
+                references.audio.update(audio)
+        for path in set(self._records) - seen:
+            del self._records[path]
+        return references
+
+    def _scan_policy(self, policy: ArtifactPolicy, references: References, report: GCReport, now: float):
+        if not policy.directory.exists():
+            report.scanned[policy.name] = [0, 0]
+            return
+
+        kept = []  # (mtime, size, path) of files eligible for quota eviction
+        files = total = removed = 0
+        for tmp_path in policy.directory.glob("*.tmp"):
+            try:
+                stat = tmp_path.stat()
+            except FileNotFoundError:
+                # Renamed into place or removed since the listing
+                continue
+            if now - stat.st_mtime > STALE_TMP_SECONDS:
+                report.add(policy.name, tmp_path, stat.st_size, "stale temporary file")
+
+        for path in policy.directory.glob(policy.pattern):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files += 1
+            total += stat.st_size
+            age = now - stat.st_mtime
+            stem = path.name.split(".", 1)[0]
+
+            if policy.per_interview:
+                if stem in references.live:
+                    continue
+                if stem not in references.interviews:
+                    if age > self.orphan_grace:
+                        report.add(policy.name, path, stat.st_size, "orphan")
+                        removed += stat.st_size
+                    continue
+            elif stem in references.audio:
+                continue
+
+            if policy.retention_days and age > policy.retention_days * 86400:
+                report.add(policy.name, path, stat.st_size, "expired")
+                removed += stat.st_size
+            else:
+                kept.append((stat.st_mtime, stat.st_size, path))
+
+        report.scanned[policy.name] = [files, total]
+
+        if policy.quota_mb:
+            used = total - removed
+            quota = policy.quota_mb * 1e6
+            for _, size, path in sorted(kept, key=lambda item: item[0]):
+                if used <= quota:
+                    break
+                report.add(policy.name, path, size, "over quota")
+                used -= size
+
+    def run(self, dry_run: bool = False, now: float = None) -> GCReport:
+        """
+        Run one GC pass
+
+        Args:
+            dry_run: Only report what would be deleted
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            The report of deleted (or deletable) files
+        """
+        now = time.time() if now is None else now
+        report = GCReport(dry_run)
+        references = self.collect_references(now)
+        for policy in self.policies:
+            try:
+                self._scan_policy(policy, references, report, now)
+            except Exception as e:
+                logger.error(f"Error scanning {policy.name} artifacts: {str(e)}")
+
+        if not dry_run:
+            for deletion in report.deletions:
+                try:
+                    Path(deletion["path"]).unlink()
+                    GC_DELETED.inc(deletion["artifact"])
+                    GC_FREED.inc(deletion["artifact"], amount=deletion["bytes"])
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.error(f"Error deleting {deletion['path']}: {str(e)}")
+            if report.deletions:
+                logger.info(f"Retention GC removed {len(report.deletions)} file(s), {report.freed() / 1e6:.1f}MB")
+        return report
+
+    def run_if_due(self, interval: float) -> Optional[GCReport]:
+        """
+        Run a GC pass unless another worker is running one, or one started
+        less than `interval` seconds ago
+
+        Returns:
+            The report, or None if the pass was skipped
+        """
+        with file_lock(self.lock_path, blocking=False) as acquired:
+            if not acquired:
+                return None
+            try:
+                last_run = self.stamp_path.stat().st_mtime
+            except FileNotFoundError:
+                last_run = 0.0
+            if time.time() - last_run < interval:
+                return None
+            self.stamp_path.touch()
+            return self.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove expired, orphaned and over-quota interview artifacts")
+    parser.add_argument("--apply", action="store_true", help="Delete files (the default is a dry-run report)")
+    parser.add_argument("--verbose", action="store_true", help="List every file")
+    args = parser.parse_args()
+
+    report = RetentionService().run(dry_run=not args.apply)
+    if args.verbose:
+        for deletion in report.deletions:
+            print(f"{deletion['reason']:22s} {deletion['bytes']:>10d}  {deletion['path']}")
+    print(report.summary())
+    if report.dry_run:
+        print("Dry run: nothing was deleted (use --apply)")
+
+
+if __name__ == "__main__":
+    # From backend/app: python -m services.retention_service [--apply]
+    main()
@@ -0,0 +1,391 @@
+# backend/app/services/search_service.py
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from config import SEARCH_DIR
+from services.assessment_service import AssessmentService
+from utils.serialization import loads
+from utils.storage import file_lock
+
+logger = logging.getLogger(__name__)
+
+# Compact the append-only document log into the vector snapshot after this many entries
+COMPACT_EVERY = 500
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+KINDS = {"cv": 0, "jd": 1, "answer": 2}
+
+
+def embed_text(text: str, dim: int) -> np.ndarray:
+    """
+    Embed text with signed feature hashing of unigrams and bigrams.
+
+    Runs locally on CPU with no model download; the vectors are L2-normalised
+    so cosine similarity is a dot product.
+    """
+    tokens = TOKEN_RE.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    counts: Dict[int, float] = {}
+    for feature in features:
+        h = zlib.crc32(feature.encode("utf-8"))
+        index = h % dim
+        sign = 1.0 if (h >> 31) & 1 else -1.0
+        counts[index] = counts.get(index, 0.0) + sign
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for index, value in counts.items():
+        # Sub-linear term frequency keeps long CVs from dominating
+        vector[index] = math.copysign(1.0 + math.log(abs(value)), value) if value else 0.0
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class LSHIndex:
+    """Random-hyperplane LSH over the stored vectors, used to pre-filter candidates"""
+
+    def __init__(self, dim: int, tables: int = 8, bits: int = 12, seed: int = 7):
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((tables, bits, dim)).astype(np.float32)
+        self.weights = (1 << np.arange(bits)).astype(np.int64)
+        self.codes = np.zeros((0, tables), dtype=np.int64)
+
+    def hash(self, vectors: np.ndarray) -> np.ndarray:
+        """Bucket codes with shape (n, tables)"""
+        projections = np.einsum("tbd,nd->ntb", self.planes, vectors) > 0
+        return projections.astype(np.int64) @ self.weights
+
+    def add(self, vectors: np.ndarray):
+        self.codes = np.concatenate([self.codes, self.hash(vectors)])
+
+    def candidates(self, vector: np.ndarray) -> np.ndarray:
+        """Rows sharing a bucket with the query in at least one table"""
+        query_codes = self.hash(vector[None, :])[0]
+        return np.flatnonzero((self.codes == query_codes).any(axis=1))
+
+
+class SearchIndex:
+    """
+    Local similarity index over CV text, job descriptions and candidate answers.
+
+    Vectors are held in a single float32 matrix and searched by brute-force
+    matrix-vector product, optionally narrowed by an LSH pre-filter. New
+    documents are appended to a log and periodically compacted into an .npz
+    snapshot, mirroring the analytics store: every worker appends to the
+    same log under a file lock, and compaction re-reads it before
+    truncating it. Searches replay what other workers appended since, or
+    reload after another worker compacted. Loads, writes and searches
+    block; async callers run them in a thread.
+    """
+
+    def __init__(self, directory: Path = SEARCH_DIR, dim: int = None, use_ann: bool = None):
+        self.directory = Path(directory)
+        self.dim = dim or int(os.getenv("SEARCH_EMBEDDING_DIM", "256"))
+        self.use_ann = use_ann if use_ann is not None else os.getenv("SEARCH_USE_ANN", "False").lower() == "true"
+        self.snapshot_path = self.directory / "vectors.npz"
+        self.meta_path = self.directory / "documents.jsonl"
+        self.log_path = self.directory / "pending.jsonl"
+        self.lock_path = self.directory / "store.lock"
+
+        self.vectors = np.zeros((0, self.dim), dtype=np.float32)
+        self.kinds = np.zeros(0, dtype=np.int8)
+        self.documents: List[Dict[str, Any]] = []
+        self.doc_index: Dict[str, int] = {}
+        self.lsh = LSHIndex(self.dim) if self.use_ann else None
+        self._size = 0
+        self._log_entries = 0
+        # Version of the snapshot and byte offset in the log this worker has read up to
+        self._snapshot_version: Optional[int] = None
+        self._log_offset = 0
+        self._loaded = False
+        # Serializes loading and writes within this process
+        self._lock = threading.RLock()
+        # Held briefly while the in-memory index changes, so searches see a consistent view
+        self._state_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return self._size
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            with file_lock(self.lock_path):
+                self._swap(self._read_store())
+            # Only now may searches use the index
+            self._loaded = True
+
+    def _read_store(self) -> "SearchIndex":
+        """A new index holding the snapshot and the pending log (file lock held)"""
+        store = SearchIndex(self.directory, self.dim, self.use_ann)
+        store._snapshot_version = self._current_snapshot_version()
+        if store._snapshot_version is not None and self.meta_path.exists():
+            vectors = np.load(self.snapshot_path)["vectors"]
+            with open(self.meta_path, "r") as f:
+                documents = [loads(line) for line in f if line.strip()]
+            if vectors.shape[1] == self.dim and len(documents) == len(vectors):
+                store._append(documents, vectors)
+            else:
+                logger.warning("Search snapshot does not match the configured dimension; ignoring it")
+
+        store._log_entries, store._log_offset = store._replay_log(0)
+        return store
+
+    def _replay_log(self, offset: int) -> Tuple[int, int]:
+        """Add the logged documents after a byte offset; returns their number and the new offset"""
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return 0, 0
+        # Appends hold the file lock, but stop at the last complete line regardless
+        end = data.rfind(b"\n") + 1
+        entries = 0
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._add_document(loads(line))
+                entries += 1
+        return entries, offset + end
+
+    def _current_snapshot_version(self) -> Optional[int]:
+        try:
+            return self.snapshot_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _log_size(self) -> int:
+        try:
+            return self.log_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _swap(self, store: "SearchIndex"):
+        with self._state_lock:
+            self.vectors, self.kinds, self.lsh = store.vectors, store.kinds, store.lsh
+            self.documents, self.doc_index = store.documents, store.doc_index
+            self._size, self._log_entries = store._size, store._log_entries
+            self._snapshot_version, self._log_offset = store._snapshot_version, store._log_offset
+
+    def _refresh(self):
+        """Pick up documents other workers indexed since this worker last read the store"""
+        self._ensure_loaded()
+        if self._current_snapshot_version() == self._snapshot_version and self._log_size() == self._log_offset:
+            return
+        with self._lock, file_lock(self.lock_path):
+            self._catch_up()
+
+    def _catch_up(self):
+        # Both locks held
+        if self._current_snapshot_version() != self._snapshot_version or self._log_size() < self._log_offset:
+            # Another worker compacted the store
+            self._swap(self._read_store())
+            return
+        entries, self._log_offset = self._replay_log(self._log_offset)
+        self._log_entries += entries
+
+    def _append(self, documents: List[Dict[str, Any]], vectors: np.ndarray):
+        with self._state_lock:
+            self._append_locked(documents, vectors)
+
+    def _append_locked(self, documents: List[Dict[str, Any]], vectors: np.ndarray):
+        needed = self._size + len(documents)
+        if needed > len(self.vectors):
+            grown = np.zeros((max(needed, 2 * len(self.vectors), 64), self.dim), dtype=np.float32)
+            grown[:self._size] = self.vectors[:self._size]
+            self.vectors = grown
+            self.kinds = np.resize(self.kinds, len(grown))
+        self.vectors[self._size:needed] = vectors
+        self.kinds[self._size:needed] = [KINDS[d["kind"]] for d in documents]
+        for offset, document in enumerate(documents):
+            self.doc_index[document["doc_id"]] = self._size + offset
+        self.documents.extend(documents)
+        if self.lsh is not None:
+            self.lsh.add(vectors)
+        self._size = needed
+
+    def _add_document(self, document: Dict[str, Any]) -> bool:
+        vector = embed_text(document["text"], self.dim)
+        with self._state_lock:
+            existing = self.doc_index.get(document["doc_id"])
+            if existing is not None:
+                # Re-indexing a document (e.g. an updated prompt) replaces it in place
+                self.vectors[existing] = vector
+                self.documents[existing] = document
+                if self.lsh is not None:
+                    self.lsh.codes[existing] = self.lsh.hash(vector[None, :])[0]
+                return False
+            self._append_locked([document], vector[None, :])
+            return True
+
+    def add(self, doc_id: str, kind: str, interview_id: str, text: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Index one document (blocking)
+
+        Args:
+            doc_id: Stable identifier, e.g. "answer:<interview_id>:3"
+            kind: One of "cv", "jd" or "answer"
+            interview_id: Interview the document belongs to
+            text: Text to embed
+            metadata: Extra fields returned with search hits
+        """
+        if not text or not text.strip():
+            return
+        try:
+            self._ensure_loaded()
+            document = {"doc_id": doc_id, "kind": kind, "interview_id": interview_id, "text": text}
+            if metadata:
+                document["metadata"] = metadata
+
+            with self._lock:
+                with file_lock(self.lock_path):
+                    self._catch_up()
+                    self._add_document(document)
+                    with open(self.log_path, "ab") as f:
+                        f.write(json.dumps(document).encode("utf-8") + b"\n")
+                        self._log_offset = f.tell()
+                    self._log_entries += 1
+
+                if self._log_entries >= COMPACT_EVERY:
+                    self.compact()
+        except Exception as e:
+            logger.error(f"Error indexing document {doc_id}: {str(e)}")
+
+    def index_interview_documents(self, interview_id: str, cv_text: str, jd_text: str, role_id: str = None):
+        """Index the CV and job description of a newly created interview"""
+        self.add(f"cv:{interview_id}", "cv", interview_id, cv_text)
+        # Interviews for the same role share a job description
+        jd_key = role_id or interview_id
+        self.add(f"jd:{jd_key}", "jd", interview_id, jd_text, {"role_id": role_id} if role_id else None)
+
+    def index_answers(self, interview_id: str, transcript: List[Dict[str, str]]):
+        """
+        Index candidate answers of an interview, each with the question it answers
+
+        Answers are numbered by question, like their scores, with the parts
+        of an answer continued after a barge-in joined.
+        """
+        for number, question, answer in AssessmentService.answered_questions(transcript):
+            self.add(
+                f"answer:{interview_id}:{number}",
+                "answer",
+                interview_id,
+                f"{question}\n{answer}",
+                {"question": question, "answer_number": number}
+            )
+
+    def compact(self):
+        """
+        Fold the pending log into the vector snapshot and clear it
+
+        The snapshot and log are re-read under the file lock rather than
+        written from this worker's view, so documents other workers appended
+        are kept, and picked up by this worker.
+        """
+        with self._lock, file_lock(self.lock_path):
+            store = self._read_store()
+            tmp_path = self.directory / "vectors.tmp.npz"
+            np.savez(tmp_path, vectors=store.vectors[:store._size])
+            meta_tmp_path = self.directory / "documents.tmp.jsonl"
+            with open(meta_tmp_path, "w") as f:
+                for document in store.documents:
+                    f.write(json.dumps(document) + "\n")
+            meta_tmp_path.replace(self.meta_path)
+            tmp_path.replace(self.snapshot_path)
+            open(self.log_path, "w").close()
+            store._log_entries, store._snapshot_version, store._log_offset = 0, self._current_snapshot_version(), 0
+            self._swap(store)
+
+    def flush(self):
+        """Compact pending log entries, if any"""
+        if self._loaded and self._log_entries:
+            self.compact()
+
+    def search(self, query: str, k: int = 10, kind: str = None, approximate: bool = None) -> List[Dict[str, Any]]:
+        """
+        Find the documents most similar to a query
+
+        Args:
+            query: Free-text query
+            k: Number of results
+            kind: Restrict results to "cv", "jd" or "answer"
+            approximate: Use the LSH pre-filter (defaults to SEARCH_USE_ANN)
+
+        Returns:
+            Hits ordered by descending cosine similarity
+
+        Raises:
+            ValueError: If approximate search is requested but SEARCH_USE_ANN is off
+        """
+        if approximate and self.lsh is None:
+            raise ValueError("Approximate search needs SEARCH_USE_ANN=True")
+        self._refresh()
+        with self._state_lock:
+            vectors, kinds, documents, lsh, size = self.vectors, self.kinds, self.documents, self.lsh, self._size
+        if size == 0 or k <= 0:
+            return []
+
+        vector = embed_text(query, self.dim)
+        approximate = self.use_ann if approximate is None else approximate
+        if approximate:
+            rows = lsh.candidates(vector)
+            # Documents added after the view was taken
+            rows = rows[rows < size]
+        else:
+            rows = None
+
+        if rows is None:
+            # Score everything in one matrix-vector product and mask other kinds,
+            # which is cheaper than gathering a sub-matrix
+            scores = vectors[:size] @ vector
+            if kind is not None:
+                scores[kinds[:size] != KINDS[kind]] = -np.inf
+        else:
+            if kind is not None:
+                rows = rows[kinds[rows] == KINDS[kind]]
+            scores = vectors[rows] @ vector
+
+        k = min(k, int(np.isfinite(scores).sum()))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        hits = []
+        for position in top:
+            row = int(position if rows is None else rows[position])
+            document = documents[row]
+            hits.append({
+                "doc_id": document["doc_id"],
+                "kind": document["kind"],
+                "interview_id": document["interview_id"],
+                "score": round(float(scores[position]), 4),
+                "snippet": document["text"][:200],
+                **document.get("metadata", {})
+            })
+        return hits
+
+
+_search_index: Optional[SearchIndex] = None
+
+def get_search_index() -> SearchIndex:
+    """Process-wide search index shared by the websocket handler and routers"""
+    global _search_index
+    if _search_index is None:
+        _search_index = SearchIndex()
+    return _search_index
@@ -0,0 +1,208 @@
+# backend/app/services/session_registry.py
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import SESSION_REGISTRY, SESSION_REGISTRY_PATH, SESSION_LEASE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+def new_owner_id() -> str:
+    """Unique owner id for one websocket connection on this host and process"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class SessionRegistry(ABC):
+    """
+    Registry of live interview sessions with exclusive, expiring leases.
+
+    A connection must hold the lease of an interview to drive it. Leases
+    expire unless renewed, so a crashed worker never blocks an interview
+    for longer than the lease duration. Methods may block on I/O; the
+    websocket handler and routers call them in a thread.
+    """
+
+    @abstractmethod
+    def acquire(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS) -> bool:
+        """Take the lease if it is free, expired or already held by `owner`"""
+
+    @abstractmethod
+    def take_over(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS):
+        """Give the lease to `owner` even if another connection holds it"""
+
+    @abstractmethod
+    def renew(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS) -> bool:
+        """Extend a lease held by `owner`; returns False if it was lost"""
+
+    @abstractmethod
+    def release(self, interview_id: str, owner: str):
+        """Drop the lease if `owner` still holds it"""
+
+    @abstractmethod
+    def owner_of(self, interview_id: str) -> Optional[str]:
+        """Current lease holder, or None if the interview is not live"""
+
+    def is_active(self, interview_id: str) -> bool:
+        return self.owner_of(interview_id) is not None
+
+    @abstractmethod
+    def active_sessions(self) -> List[str]:
+        """Ids of interviews with an unexpired lease"""
+
+
+class InProcessSessionRegistry(SessionRegistry):
+    """Registry for a single worker process"""
+
+    def __init__(self):
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS) -> bool:
+        now = time.time()
+        with self._lock:
+            current = self._leases.get(interview_id)
+            if current and current[0] != owner and current[1] > now:
+                return False
+            self._leases[interview_id] = (owner, now + ttl)
+            return True
+
+    def take_over(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS):
+        with self._lock:
+            self._leases[interview_id] = (owner, time.time() + ttl)
+
+    def renew(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS) -> bool:
+        now = time.time()
+        with self._lock:
+            current = self._leases.get(interview_id)
+            if not current or current[0] != owner or current[1] <= now:
+                return False
+            self._leases[interview_id] = (owner, now + ttl)
+            return True
+
+    def release(self, interview_id: str, owner: str):
+        with self._lock:
+            current = self._leases.get(interview_id)
+            if current and current[0] == owner:
+                del self._leases[interview_id]
+
+    def owner_of(self, interview_id: str) -> Optional[str]:
+        current = self._leases.get(interview_id)
+        if current and current[1] > time.time():
+            return current[0]
+        return None
+
+    def active_sessions(self) -> List[str]:
+        now = time.time()
+        return [interview_id for interview_id, (_, expires) in list(self._leases.items()) if expires > now]
+
+
+class SQLiteSessionRegistry(SessionRegistry):
+    """
+    Registry shared by every worker process on this host through one SQLite
+    file. Lease changes run in IMMEDIATE transactions, so SQLite's file lock
+    serialises competing acquirers. The file must be on a local disk: WAL
+    mode does not work over network filesystems, so it cannot coordinate
+    several hosts.
+
+    Each worker keeps one connection, shared by its threads under a lock.
+    """
+
+    def __init__(self, path: Path = SESSION_REGISTRY_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            "interview_id TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def _transaction(self, statements) -> bool:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(self._conn)
+                self._conn.execute("COMMIT")
+                return result
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _query(self, sql: str, parameters: tuple) -> list:
+        with self._lock:
+            return self._conn.execute(sql, parameters).fetchall()
+
+    def acquire(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS) -> bool:
+        def statements(conn):
+            now = time.time()
+            row = conn.execute(
+                "SELECT owner, expires_at FROM leases WHERE interview_id = ?", (interview_id,)
+            ).fetchone()
+            if row and row[0] != owner and row[1] > now:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (interview_id, owner, expires_at) VALUES (?, ?, ?)",
+                (interview_id, owner, now + ttl)
+            )
+            return True
+        return self._transaction(statements)
+
+    def take_over(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS):
+        def statements(conn):
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (interview_id, owner, expires_at) VALUES (?, ?, ?)",
+                (interview_id, owner, time.time() + ttl)
+            )
+            return True
+        self._transaction(statements)
+
+    def renew(self, interview_id: str, owner: str, ttl: float = SESSION_LEASE_SECONDS) -> bool:
+        def statements(conn):
+            now = time.time()
+            cursor = conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE interview_id = ? AND owner = ? AND expires_at > ?",
+                (now + ttl, interview_id, owner, now)
+            )
+            return cursor.rowcount == 1
+        return self._transaction(statements)
+
+    def release(self, interview_id: str, owner: str):
+        def statements(conn):
+            conn.execute("DELETE FROM leases WHERE interview_id = ? AND owner = ?", (interview_id, owner))
+            return True
+        self._transaction(statements)
+
+    def owner_of(self, interview_id: str) -> Optional[str]:
+        rows = self._query(
+            "SELECT owner FROM leases WHERE interview_id = ? AND expires_at > ?",
+            (interview_id, time.time())
+        )
+        return rows[0][0] if rows else None
+
+    def active_sessions(self) -> List[str]:
+        rows = self._query("SELECT interview_id FROM leases WHERE expires_at > ?", (time.time(),))
+        return [row[0] for row in rows]
+
+
+_session_registry: Optional[SessionRegistry] = None
+
+def get_session_registry() -> SessionRegistry:
+    """Registry backend selected by SESSION_REGISTRY ("memory" or "sqlite")"""
+    global _session_registry
+    if _session_registry is None:
+        if SESSION_REGISTRY == "sqlite":
+            _session_registry = SQLiteSessionRegistry()
+        else:
+            if SESSION_REGISTRY != "memory":
+                logger.warning(f"Unknown SESSION_REGISTRY '{SESSION_REGISTRY}', using in-process registry")
+            _session_registry = InProcessSessionRegistry()
+    return _session_registry
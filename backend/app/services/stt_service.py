@@ -4,12 +4,27 @@ import os
 import logging
 import base64
 import asyncio
-from typing import Optional
-import tempfile
-from deepgram import Deepgram
+from typing import List, Optional
+from config import STT_SEGMENT_SECONDS, STT_SEGMENT_MAX_SECONDS, STT_MIN_SILENCE_MS, STT_SEGMENT_CONCURRENCY, AUDIO_WORKERS
+from utils.audio_format import AudioNormalizer, AudioRejected, NormalizedAudio
+from utils.audio_segmenter import PCMAudio, read_wav, split_at_silence
+from utils.latency import Deadline, LatencyTracker, call_with_deadline
+from utils.metrics import observe_provider, registry, span
 
 logger = logging.getLogger(__name__)
 
+AUDIO_REJECTED = registry.counter("audio_rejected_total", "Answer audio rejected before transcription", ["reason"])
+AUDIO_BYTES = registry.counter("audio_bytes_total", "Answer audio received from clients and sent to speech-to-text", ["stage"])
+
+UNHEARD_MESSAGE = "I couldn't hear your response clearly."
+REPEAT_MESSAGE = "I'm sorry, there was an issue processing your audio. Could you please repeat?"
+
+
+def stitch(texts: List[Optional[str]]) -> str:
+    """Join segment transcripts in order, skipping failed and empty ones"""
+    return " ".join(text.strip() for text in texts if text and text.strip())
+
+
 class STTService:
     """Service for converting speech to text using Deepgram"""
     
@@ -19,56 +34,180 @@ class STTService:
         if not self.api_key:
             logger.warning("DEEPGRAM_API_KEY not found in environment variables")
         
-        self.deepgram = Deepgram(self.api_key)
+        self._deepgram = None
         self.language = os.getenv("DEEPGRAM_LANGUAGE", "en-US")
+        
+        self.hedge = os.getenv("HEDGE_REQUESTS", "False").lower() == "true"
+        self.hedge_percentile = float(os.getenv("HEDGE_PERCENTILE", "95"))
+        self.latency = LatencyTracker()
+        
+        # Long answers are split at pauses and transcribed in parallel
+        self.segment_seconds = STT_SEGMENT_SECONDS
+        self.segment_max_seconds = STT_SEGMENT_MAX_SECONDS
+        self.min_silence_ms = STT_MIN_SILENCE_MS
+        self.segment_concurrency = STT_SEGMENT_CONCURRENCY
+        
+        # Audio is validated and converted off the event loop; compressed
+        # answers long enough to split are converted to PCM
+        self.normalizer = AudioNormalizer(AUDIO_WORKERS, pcm_above_seconds=self.segment_max_seconds)
     
-    async def speech_to_text(self, audio_data: str) -> str:
+    @property
+    def deepgram(self):
+        """Deepgram client, created on first use"""
+        if self._deepgram is None:
+            from deepgram import Deepgram
+            self._deepgram = Deepgram(self.api_key)
+        return self._deepgram
+    
+    async def close(self):
+        """Release the Deepgram client and the audio worker pool"""
+        self._deepgram = None
+        self.normalizer.shutdown()
+    
+    @staticmethod
+    def _decode_audio(audio_data: str) -> bytes:
+        """Decode base64 audio sent by the client"""
+        return base64.b64decode(audio_data)
+    
+    async def _transcribe(self, audio: bytes, deadline: Optional[Deadline] = None, mimetype: str = "audio/wav") -> str:
+        """
+        Transcribe one recording with Deepgram
+        
+        Raises:
+            asyncio.TimeoutError: If the deadline is reached first
+            Exception: On provider errors
+        """
+        async def transcribe():
+            source = {'buffer': audio, 'mimetype': mimetype}
+            return await self.deepgram.transcription.prerecorded(
+                source,
+                {
+                    'punctuate': True,
+                    'language': self.language,
+                    'model': 'nova',
+                    'smart_format': True
+                }
+            )
+        
+        # Send to Deepgram within the turn budget
+        with observe_provider("deepgram", "transcribe"):
+            response = await call_with_deadline(
+                transcribe,
+                deadline=deadline,
+                tracker=self.latency,
+                hedge=self.hedge,
+                hedge_percentile=self.hedge_percentile
+            )
+        
+        # Extract the transcript
+        return response['results']['channels'][0]['alternatives'][0]['transcript']
+    
+    async def prepare(self, audio: bytes) -> NormalizedAudio:
+        """
+        Validate and normalize client audio in the worker pool
+        
+        Raises:
+            AudioRejected: If the audio cannot be transcribed
+        """
+        AUDIO_BYTES.inc("received", amount=len(audio))
+        try:
+            with span("normalize"):
+                normalized = await self.normalizer.normalize(audio)
+        except AudioRejected as e:
+            AUDIO_REJECTED.inc(e.reason)
+            raise
+        AUDIO_BYTES.inc("transcribed", amount=len(normalized.data))
+        return normalized
+    
+    def split(self, audio: bytes) -> List[bytes]:
+        """
+        Split a long WAV recording at pauses (blocking; other formats and
+        short recordings are returned whole)
+        """
+        pcm = read_wav(audio)
+        if pcm is None or pcm.duration <= self.segment_max_seconds:
+            return [audio]
+        segments = split_at_silence(pcm, self.segment_seconds, self.segment_max_seconds, self.min_silence_ms)
+        return [segment.to_wav() for segment in segments]
+    
+    async def transcribe_segments(self, segments: List[bytes], deadline: Optional[Deadline] = None) -> List[Optional[str]]:
+        """
+        Transcribe segments concurrently, at most `segment_concurrency` at a time
+        
+        Returns:
+            The transcript of each segment in order, None where it failed
+        """
+        semaphore = asyncio.Semaphore(self.segment_concurrency)
+        
+        async def transcribe(segment: bytes) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await self._transcribe(segment, deadline=deadline)
+                except asyncio.TimeoutError:
+                    logger.warning("Transcribing an answer segment exceeded the turn deadline")
+                except Exception as e:
+                    logger.error(f"Error transcribing answer segment: {str(e)}")
+                return None
+        
+        return await asyncio.gather(*(transcribe(segment) for segment in segments))
+    
+    async def transcribe_audio(self, audio: NormalizedAudio, deadline: Optional[Deadline] = None) -> str:
+        """
+        Transcribe normalized audio, in parallel segments when it is long
+        
+        Raises:
+            asyncio.TimeoutError: If the deadline is reached first
+            Exception: If nothing could be transcribed
+        """
+        if audio.silent:
+            # Nothing to transcribe; skip the provider call
+            return ""
+        long_wav = audio.mimetype == "audio/wav" and (audio.duration or 0) > self.segment_max_seconds
+        segments = await asyncio.to_thread(self.split, audio.data) if long_wav else [audio.data]
+        if len(segments) == 1:
+            return await self._transcribe(audio.data, deadline=deadline, mimetype=audio.mimetype)
+        texts = await self.transcribe_segments(segments, deadline=deadline)
+        if all(text is None for text in texts):
+            raise RuntimeError("No answer segment could be transcribed")
+        return stitch(texts)
+    
+    async def speech_to_text(self, audio_data: str, deadline: Optional[Deadline] = None) -> str:
         """
         Convert audio data to text
         
+        The audio is validated and normalized first: corrupt or undecodable
+        chunks and silence are answered without a provider call, and long
+        answers are split at pauses and the segments transcribed in parallel,
+        so transcription time no longer grows with answer length.
+        
         Args:
             audio_data: Base64 encoded audio data
+            deadline: Optional turn deadline bounding the provider call
             
         Returns:
             Transcribed text
         """
         try:
-            # Decode base64 audio data
-            decoded_audio = base64.b64decode(audio_data)
+            with span("decode"):
+                audio = self._decode_audio(audio_data)
             
-            # Create a temporary file to store the audio
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_file_path = temp_file.name
-                temp_file.write(decoded_audio)
+            transcript = await self.transcribe_audio(await self.prepare(audio), deadline=deadline)
             
-            try:
-                # Open the audio file
-                with open(temp_file_path, 'rb') as audio_file:
-                    # Send to Deepgram
-                    source = {'buffer': audio_file, 'mimetype': 'audio/wav'}
-                    response = await self.deepgram.transcription.prerecorded(
-                        source,
-                        {
-                            'punctuate': True,
-                            'language': self.language,
-                            'model': 'nova',
-                            'smart_format': True
-                        }
-                    )
-                
-                # Extract the transcript
-                transcript = response['results']['channels'][0]['alternatives'][0]['transcript']
-                
-                return transcript if transcript else "I couldn't hear your response clearly."
-                
-            finally:
-                # Clean up the temporary file
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
-                    
+            return transcript if transcript else UNHEARD_MESSAGE
+            
+        except AudioRejected as e:
+            logger.warning(f"Rejected answer audio: {str(e)}")
+            return REPEAT_MESSAGE
+        except asyncio.TimeoutError:
+            logger.warning("Speech to text exceeded the turn deadline")
+            return REPEAT_MESSAGE
         except Exception as e:
             logger.error(f"Error in speech to text conversion: {str(e)}")
-            return "I'm sorry, there was an issue processing your audio. Could you please repeat?"
+            return REPEAT_MESSAGE
+    
+    def incremental(self) -> "IncrementalTranscription":
+        """Start transcribing an answer that arrives in chunks while the candidate speaks"""
+        return IncrementalTranscription(self)
 
     async def live_transcription(self, websocket):
         """
@@ -79,4 +218,124 @@ class STTService:
         """
         # This method would be implemented for streaming audio transcription
         # if required by the application
-        pass
\ No newline at end of file
+        pass
+
+
+class IncrementalTranscription:
+    """
+    Transcription of one answer received in chunks while the candidate is
+    still speaking.
+
+    Chunks are normalized as they arrive. WAV audio is buffered, and every
+    segment that is complete (it has reached the target length and ended in a
+    pause) is transcribed in the background right away, so when the answer
+    ends only its last segment is left to transcribe. Compressed streams
+    (MediaRecorder's webm, whose later chunks cannot be decoded on their own)
+    are concatenated and transcribed as one recording at the end.
+    """
+
+    def __init__(self, stt: STTService):
+        self.stt = stt
+        self._semaphore = asyncio.Semaphore(stt.segment_concurrency)
+        self._tasks: List[asyncio.Task] = []
+        self._pending: Optional[PCMAudio] = None
+        self._stream = bytearray()
+
+    def _start(self, segment: bytes, deadline: Optional[Deadline] = None):
+        async def transcribe() -> Optional[str]:
+            async with self._semaphore:
+                return await self.stt._transcribe(segment, deadline=deadline)
+        self._tasks.append(asyncio.create_task(transcribe()))
+
+    def _start_stream(self, stream: bytes, deadline: Optional[Deadline] = None):
+        async def transcribe() -> Optional[str]:
+            try:
+                audio = await self.stt.prepare(stream)
+            except AudioRejected as e:
+                logger.warning(f"Rejected answer audio: {str(e)}")
+                return None
+            return await self.stt.transcribe_audio(audio, deadline=deadline)
+        self._tasks.append(asyncio.create_task(transcribe()))
+
+    async def feed(self, audio_data: str):
+        """Add a base64 chunk of the answer; chunks that cannot be decoded are dropped"""
+        audio = self.stt._decode_audio(audio_data)
+        if self._stream:
+            # Continuation of a compressed stream
+            self._stream.extend(audio)
+            return
+        try:
+            normalized = await self.stt.prepare(audio)
+        except AudioRejected as e:
+            logger.warning(f"Dropping answer audio chunk: {str(e)}")
+            return
+        pcm = read_wav(normalized.data) if normalized.mimetype == "audio/wav" else None
+        if pcm is None:
+            self._stream.extend(audio)
+            return
+
+        # Normalized WAV is always 16 kHz mono
+        if self._pending is not None:
+            pcm = PCMAudio(self._pending.samples + pcm.samples, pcm.sample_rate, pcm.channels)
+        *complete, self._pending = split_at_silence(
+            pcm, self.stt.segment_seconds, self.stt.segment_max_seconds, self.stt.min_silence_ms, final=False
+        )
+        for segment in complete:
+            self._start(segment.to_wav())
+
+    async def finish(self, deadline: Optional[Deadline] = None) -> str:
+        """
+        Transcribe what is left and return the whole answer
+
+        Args:
+            deadline: Turn deadline; segments still running when it is reached
+                are dropped from the answer
+        """
+        try:
+            if self._pending is not None and self._pending.samples:
+                for segment in split_at_silence(
+                    self._pending, self.stt.segment_seconds, self.stt.segment_max_seconds, self.stt.min_silence_ms
+                ):
+                    self._start(segment.to_wav(), deadline)
+            if self._stream:
+                self._start_stream(bytes(self._stream), deadline)
+            self._pending = None
+            self._stream = bytearray()
+
+            if not self._tasks:
+                return UNHEARD_MESSAGE
+            timeout = deadline.remaining() if deadline is not None else None
+            await asyncio.wait(self._tasks, timeout=timeout)
+
+            texts = []
+            for task in self._tasks:
+                if not task.done():
+                    logger.warning("Transcribing an answer segment exceeded the turn deadline")
+                    task.cancel()
+                    texts.append(None)
+                elif task.cancelled() or task.exception() is not None:
+                    if not task.cancelled():
+                        logger.error(f"Error transcribing answer segment: {str(task.exception())}")
+                    texts.append(None)
+                else:
+                    texts.append(task.result())
+            self._tasks = []
+
+            if all(text is None for text in texts):
+                return REPEAT_MESSAGE
+            return stitch(texts) or UNHEARD_MESSAGE
+        except Exception as e:
+            logger.error(f"Error in incremental speech to text conversion: {str(e)}")
+            return REPEAT_MESSAGE
+
+    def cancel(self) -> int:
+        """Abandon the answer; returns how many segment transcriptions were cancelled"""
+        cancelled = 0
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+                cancelled += 1
+        self._tasks = []
+        self._pending = None
+        self._stream = bytearray()
+        return cancelled
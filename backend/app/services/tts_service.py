@@ -4,10 +4,16 @@ import os
 import logging
 import asyncio
 import base64
-import requests
+import hashlib
+import shutil
+import subprocess
 import tempfile
-import uuid
+import threading
 from pathlib import Path
+from typing import Optional
+from utils.latency import Deadline, LatencyTracker, call_with_deadline
+from utils.metrics import observe_provider
+from config import AUDIO_DIR, AUDIO_LOW_BITRATE_KBPS
 
 logger = logging.getLogger(__name__)
 
@@ -23,52 +29,151 @@ class TTSService:
         self.base_url = "https://api.elevenlabs.io/v1"
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")  # Default voice
         self.model_id = os.getenv("ELEVENLABS_MODEL_ID", "eleven_monolingual_v1")
+        self.request_timeout = float(os.getenv("ELEVENLABS_TIMEOUT", "15"))
         
-        # Create directory for audio files if it doesn't exist
-        self.audio_dir = Path(__file__).parent.parent.parent / "data" / "audio"
-        self.audio_dir.mkdir(parents=True, exist_ok=True)
+        self.hedge = os.getenv("HEDGE_REQUESTS", "False").lower() == "true"
+        self.hedge_percentile = float(os.getenv("HEDGE_PERCENTILE", "95"))
+        self.latency = LatencyTracker()
+        
+        # Audio directory is created on first write
+        self.audio_dir = Path(AUDIO_DIR)
+        self._audio_dir_ready = False
+        
+        # Low-bitrate variants are transcoded with ffmpeg when it is available
+        self.low_bitrate_kbps = AUDIO_LOW_BITRATE_KBPS if shutil.which("ffmpeg") else 0
+        self._background = set()
+        
+        # Pooled HTTP connections to ElevenLabs, created on first request
+        self._session = None
+    
+    @property
+    def session(self):
+        """Pooled requests.Session (requests is imported on first use)"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+    
+    async def close(self):
+        """Close pooled HTTP connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def _synthesize(self, text: str, cancelled: Optional[threading.Event] = None) -> bytes:
+        """
+        Blocking ElevenLabs request returning the raw MP3 bytes
+
+        The response is streamed, so setting `cancelled` aborts the download
+        and releases the connection instead of reading the rest of the audio.
+        """
+        url = f"{self.base_url}/text-to-speech/{self.voice_id}"
+        headers = {
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        body = {
+            "text": text,
+            "model_id": self.model_id,
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.8
+            }
+        }
+        
+        with self.session.post(url, json=body, headers=headers, timeout=self.request_timeout, stream=True) as response:
+            response.raise_for_status()
+            chunks = []
+            for chunk in response.iter_content(chunk_size=16 * 1024):
+                if cancelled is not None and cancelled.is_set():
+                    return b""
+                chunks.append(chunk)
+            return b"".join(chunks)
+    
+    async def _synthesize_async(self, text: str) -> bytes:
+        """Run _synthesize in a thread, aborting the request if the caller is cancelled"""
+        cancelled = threading.Event()
+        try:
+            return await asyncio.to_thread(self._synthesize, text, cancelled)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    
+    def audio_key(self, text: str) -> str:
+        """Content address of the audio for `text` with the configured voice and model"""
+        digest = hashlib.sha256(f"{self.voice_id}\0{self.model_id}\0{text}".encode("utf-8"))
+        return digest.hexdigest()[:32]
+    
+    def _write_low_bitrate_variant(self, source: Path):
+        """Transcode `source` to a mono low-bitrate MP3 next to it (blocking)"""
+        target = source.with_name(f"{source.stem}.low.mp3")
+        tmp_path = target.with_name(f"{target.name}.tmp")
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-i", str(source),
+                    "-ac", "1", "-b:a", f"{self.low_bitrate_kbps}k", "-f", "mp3", str(tmp_path)
+                ],
+                check=True,
+                timeout=60
+            )
+            tmp_path.replace(target)
+        except Exception as e:
+            logger.error(f"Error creating low-bitrate audio for {source.name}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
     
-    async def text_to_speech(self, text: str) -> str:
+    async def text_to_speech(self, text: str, deadline: Optional[Deadline] = None) -> str:
         """
         Convert text to speech using ElevenLabs
         
+        Files are content-addressed by voice, model and text, so repeated text
+        (greetings, the fallback question, the closing message) is synthesized
+        once and served with immutable cache headers.
+        
         Args:
             text: Text to convert to speech
+            deadline: Optional turn deadline bounding the provider call
             
         Returns:
-            URL path to the generated audio file
+            URL path to the generated audio file, or "" on error or timeout
         """
         try:
-            # Generate unique filename for the audio
-            filename = f"{uuid.uuid4()}.mp3"
+            filename = f"{self.audio_key(text)}.mp3"
             file_path = self.audio_dir / filename
+            if file_path.exists():
+                # Mark as recently used for the retention GC's LRU eviction
+                os.utime(file_path)
+                return f"/api/audio/{filename}"
             
-            # Prepare request to ElevenLabs API
-            url = f"{self.base_url}/text-to-speech/{self.voice_id}"
-            headers = {
-                "xi-api-key": self.api_key,
-                "Content-Type": "application/json"
-            }
-            body = {
-                "text": text,
-                "model_id": self.model_id,
-                "voice_settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.8
-                }
-            }
+            # Make API request off the event loop, within the turn budget
+            with observe_provider("elevenlabs", "synthesize"):
+                audio = await call_with_deadline(
+                    lambda: self._synthesize_async(text),
+                    deadline=deadline,
+                    tracker=self.latency,
+                    hedge=self.hedge,
+                    hedge_percentile=self.hedge_percentile
+                )
             
-            # Make API request
-            response = requests.post(url, json=body, headers=headers)
-            response.raise_for_status()
+            # Save audio file; readers never see a partial file
+            if not self._audio_dir_ready:
+                self.audio_dir.mkdir(parents=True, exist_ok=True)
+                self._audio_dir_ready = True
+            with tempfile.NamedTemporaryFile(dir=self.audio_dir, suffix=".tmp", delete=False) as f:
+                f.write(audio)
+            Path(f.name).replace(file_path)
             
-            # Save audio file
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+            if self.low_bitrate_kbps:
+                task = asyncio.create_task(asyncio.to_thread(self._write_low_bitrate_variant, file_path))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
             
-            # Return relative URL to audio file
-            return f"/data/audio/{filename}"
+            # Return URL of the audio endpoint
+            return f"/api/audio/{filename}"
             
+        except asyncio.TimeoutError:
+            logger.warning("Text to speech exceeded the turn deadline")
+            return ""
         except Exception as e:
             logger.error(f"Error in text to speech conversion: {str(e)}")
             return ""
@@ -104,7 +209,7 @@ class TTSService:
             }
             
             # Make API request
-            response = requests.post(url, json=body, headers=headers)
+            response = self.session.post(url, json=body, headers=headers)
             response.raise_for_status()
             
             # Convert to base64
@@ -122,7 +227,7 @@ class TTSService:
             url = f"{self.base_url}/voices"
             headers = {"xi-api-key": self.api_key}
             
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers)
             response.raise_for_status()
             
             return response.json().get("voices", [])
@@ -0,0 +1,251 @@
+# backend/app/utils/audio_format.py
+
+import io
+import math
+import wave
+import shutil
+import asyncio
+import logging
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+import numpy as np
+
+from utils.audio_segmenter import MIN_SILENCE_RMS, PCMAudio, frame_energies, silence_threshold
+
+logger = logging.getLogger(__name__)
+
+# Canonical format sent to speech-to-text
+SAMPLE_RATE = 16000
+
+# Leading bytes of the containers clients send: (signature, offset, format, mimetype)
+SIGNATURES = (
+    (b"\x1aE\xdf\xa3", 0, "webm", "audio/webm"),
+    (b"OggS", 0, "ogg", "audio/ogg"),
+    (b"fLaC", 0, "flac", "audio/flac"),
+    (b"ID3", 0, "mp3", "audio/mpeg"),
+    (b"ftyp", 4, "mp4", "audio/mp4"),
+    # A MediaRecorder chunk after the first: a bare WebM cluster without header
+    (b"\x1fC\xb6u", 0, "webm_fragment", "audio/webm"),
+)
+
+
+def sniff(data: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Identify an audio container from its leading bytes
+
+    Returns:
+        (format, mimetype), or (None, None) if unrecognised
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        return "wav", "audio/wav"
+    for signature, offset, audio_format, mimetype in SIGNATURES:
+        if data[offset:offset + len(signature)] == signature:
+            return audio_format, mimetype
+    if len(data) > 1 and data[0] == 0xFF and data[1] & 0xE0 == 0xE0:
+        # MPEG audio frame sync without an ID3 tag
+        return "mp3", "audio/mpeg"
+    return None, None
+
+
+class AudioRejected(ValueError):
+    """Audio that cannot be transcribed; `reason` labels the rejection metric"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+    def __reduce__(self):
+        # Raised in pool workers; keep `reason` across pickling
+        return (AudioRejected, (self.reason, str(self)))
+
+
+class NormalizedAudio:
+    """Audio ready for speech-to-text, with cheap level statistics for VAD"""
+
+    def __init__(
+        self,
+        data: bytes,
+        mimetype: str,
+        source_format: str,
+        duration: Optional[float] = None,
+        rms_dbfs: Optional[float] = None,
+        peak: Optional[float] = None,
+        speech_ratio: Optional[float] = None
+    ):
+        """
+        Args:
+            data: Encoded audio (canonical WAV, or the original compressed stream)
+            mimetype: MIME type of `data`
+            source_format: Container the client sent, e.g. "webm"
+            duration: Length in seconds, if it could be decoded
+            rms_dbfs: Overall level in dB relative to full scale
+            peak: Peak amplitude (0-1)
+            speech_ratio: Fraction of frames above the silence threshold
+        """
+        self.data = data
+        self.mimetype = mimetype
+        self.source_format = source_format
+        self.duration = duration
+        self.rms_dbfs = rms_dbfs
+        self.peak = peak
+        self.speech_ratio = speech_ratio
+
+    @property
+    def silent(self) -> bool:
+        """Known to contain no speech (False when the audio could not be decoded)"""
+        return self.speech_ratio == 0.0
+
+
+def _read_wav_samples(data: bytes) -> Tuple[np.ndarray, int]:
+    """Decode a PCM WAV into mono float32 samples in [-1, 1] and its sample rate"""
+    try:
+        with wave.open(io.BytesIO(data)) as wav:
+            width, channels, rate = wav.getsampwidth(), wav.getnchannels(), wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise AudioRejected("corrupt", f"Invalid WAV audio: {str(e)}")
+    if rate <= 0 or channels <= 0:
+        raise AudioRejected("corrupt", "Invalid WAV header")
+
+    frames = frames[:len(frames) - len(frames) % (width * channels)]
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = (np.where(values >= 1 << 23, values - (1 << 24), values)).astype(np.float32) / float(1 << 23)
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / float(1 << 31)
+    else:
+        raise AudioRejected("corrupt", f"Unsupported WAV sample width {width}")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples, rate
+
+
+def _low_pass(samples: np.ndarray, cutoff: float, taps: int = 63) -> np.ndarray:
+    """Windowed-sinc FIR low-pass; `cutoff` is a fraction of the sample rate"""
+    n = np.arange(taps) - (taps - 1) / 2
+    kernel = np.sinc(2 * cutoff * n) * np.hamming(taps)
+    return np.convolve(samples, (kernel / kernel.sum()).astype(np.float32), mode="same")
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Resample mono float samples (band-limited first when downsampling)"""
+    if source_rate == target_rate or len(samples) == 0:
+        return samples
+    if target_rate < source_rate:
+        samples = _low_pass(samples, 0.5 * target_rate / source_rate)
+    count = int(round(len(samples) * target_rate / source_rate))
+    positions = np.arange(count, dtype=np.float64) * (source_rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def _decode_with_ffmpeg(data: bytes) -> np.ndarray:
+    """Decode any container ffmpeg understands into 16 kHz mono float samples"""
+    result = subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", "pipe:0", "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "pipe:1"],
+        input=data,
+        capture_output=True,
+        timeout=60
+    )
+    if result.returncode != 0 or not result.stdout:
+        raise AudioRejected("corrupt", f"Undecodable audio: {result.stderr.decode('utf-8', 'replace').strip()[:200]}")
+    return np.frombuffer(result.stdout, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def _pcm16(samples: np.ndarray) -> PCMAudio:
+    pcm = np.clip(samples * 32768.0, -32768, 32767).astype("<i2")
+    return PCMAudio(pcm.tobytes(), SAMPLE_RATE)
+
+
+def _stats(audio: PCMAudio, samples: np.ndarray) -> Tuple[float, float, float]:
+    """(rms_dbfs, peak, speech_ratio) of canonical audio"""
+    if len(samples) == 0:
+        return -math.inf, 0.0, 0.0
+    rms = float(np.sqrt(np.mean(samples * samples)))
+    peak = float(np.max(np.abs(samples)))
+    energies = frame_energies(audio)
+    if len(energies) == 0 or float(np.max(energies)) < MIN_SILENCE_RMS:
+        speech_ratio = 0.0
+    else:
+        speech_ratio = float(np.mean(energies >= silence_threshold(energies)))
+    return (20 * math.log10(rms) if rms > 0 else -math.inf), peak, speech_ratio
+
+
+def normalize_audio(data: bytes, pcm_above_seconds: float = 0, use_ffmpeg: bool = False) -> NormalizedAudio:
+    """
+    Validate client audio and convert it to the canonical format (blocking;
+    runs in the worker pool)
+
+    WAV is decoded, mixed down to mono and resampled to 16 kHz 16-bit PCM,
+    which is what speech-to-text uses anyway and is up to 6x smaller than
+    48 kHz stereo. Compressed streams (webm/opus from MediaRecorder, ogg, mp3)
+    are already smaller than PCM and are passed through; with ffmpeg they are
+    decoded for validation and statistics, and converted to PCM when longer
+    than `pcm_above_seconds` so they can be split for parallel transcription.
+
+    Raises:
+        AudioRejected: For empty, unrecognised, headerless or corrupt audio
+    """
+    if not data:
+        raise AudioRejected("empty", "No audio data")
+    source_format, mimetype = sniff(data)
+    if source_format is None:
+        raise AudioRejected("unknown_format", "Unrecognised audio format")
+    if source_format == "webm_fragment":
+        raise AudioRejected("fragment", "WebM chunk without its header cannot be decoded on its own")
+
+    if source_format == "wav":
+        samples, rate = _read_wav_samples(data)
+        samples = resample(samples, rate)
+    elif use_ffmpeg:
+        samples = _decode_with_ffmpeg(data)
+    else:
+        # Nothing to decode with; the provider gets the original stream
+        return NormalizedAudio(data, mimetype, source_format)
+
+    if len(samples) == 0:
+        raise AudioRejected("empty", "Audio contains no samples")
+
+    audio = _pcm16(samples)
+    rms_dbfs, peak, speech_ratio = _stats(audio, samples)
+    if source_format == "wav" or (pcm_above_seconds and audio.duration > pcm_above_seconds):
+        data, mimetype = audio.to_wav(), "audio/wav"
+    return NormalizedAudio(data, mimetype, source_format, audio.duration, rms_dbfs, peak, speech_ratio)
+
+
+class AudioNormalizer:
+    """
+    Runs normalize_audio off the event loop in a process pool (decoding and
+    resampling are CPU-bound), or in a thread when `workers` is 0.
+    """
+
+    def __init__(self, workers: int = 2, pcm_above_seconds: float = 0):
+        self.workers = workers
+        self.pcm_above_seconds = pcm_above_seconds
+        self.use_ffmpeg = shutil.which("ffmpeg") is not None
+        # Started on first use
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def normalize(self, data: bytes) -> NormalizedAudio:
+        """
+        Raises:
+            AudioRejected: If the audio cannot be transcribed
+        """
+        if self.workers <= 0:
+            return await asyncio.to_thread(normalize_audio, data, self.pcm_above_seconds, self.use_ffmpeg)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, normalize_audio, data, self.pcm_above_seconds, self.use_ffmpeg)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,177 @@
+# backend/app/utils/audio_segmenter.py
+
+import io
+import math
+import wave
+import logging
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Analysis window for the energy envelope
+FRAME_MS = 30
+
+# Frames below this RMS (16-bit scale) count as silence even in quiet recordings
+MIN_SILENCE_RMS = 100.0
+
+
+class PCMAudio:
+    """Interleaved 16-bit little-endian PCM samples and their format"""
+
+    __slots__ = ("samples", "sample_rate", "channels")
+
+    def __init__(self, samples: bytes, sample_rate: int, channels: int = 1):
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.sample_rate * self.channels * 2
+
+    @property
+    def duration(self) -> float:
+        """Length in seconds"""
+        return len(self.samples) / self.bytes_per_second
+
+    def frame_bytes(self, frame_ms: int = FRAME_MS) -> int:
+        """Bytes in one analysis frame"""
+        return self.sample_rate * frame_ms // 1000 * self.channels * 2
+
+    def to_wav(self) -> bytes:
+        """Encode as a WAV file"""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(self.channels)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(self.samples)
+        return buffer.getvalue()
+
+
+def read_wav(data: bytes) -> Optional[PCMAudio]:
+    """
+    Parse a 16-bit PCM WAV file
+
+    Returns:
+        The decoded audio, or None for other containers and encodings (which
+        are transcribed without segmentation)
+    """
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    try:
+        with wave.open(io.BytesIO(data)) as wav:
+            if wav.getsampwidth() != 2 or wav.getcomptype() != "NONE":
+                return None
+            return PCMAudio(wav.readframes(wav.getnframes()), wav.getframerate(), wav.getnchannels())
+    except (wave.Error, EOFError) as e:
+        logger.warning(f"Unreadable WAV audio: {str(e)}")
+        return None
+
+
+def frame_energies(audio: PCMAudio, frame_ms: int = FRAME_MS) -> np.ndarray:
+    """RMS level of each complete frame (channels are mixed down)"""
+    samples = np.frombuffer(audio.samples, dtype="<i2", count=len(audio.samples) // 2)
+    if audio.channels > 1:
+        samples = samples[:len(samples) - len(samples) % audio.channels].reshape(-1, audio.channels).mean(axis=1)
+    frame = audio.sample_rate * frame_ms // 1000
+    count = len(samples) // frame
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[:count * frame].astype(np.float32).reshape(count, frame)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def silence_threshold(energies: np.ndarray) -> float:
+    """
+    Level below which a frame is silent: twice the recording's noise floor,
+    but never above half its loud level (so steady sound is not all "silence")
+    """
+    if len(energies) == 0:
+        return MIN_SILENCE_RMS
+    floor, loud = np.percentile(energies, [10, 90])
+    return max(MIN_SILENCE_RMS, min(float(floor) * 2.0, float(loud) * 0.5))
+
+
+def find_cut_points(
+    energies: np.ndarray,
+    target_seconds: float,
+    max_seconds: float,
+    min_silence_ms: int,
+    frame_ms: int = FRAME_MS,
+    final: bool = True
+) -> List[int]:
+    """
+    Frame indices at which to split a recording
+
+    Each segment runs for at least `target_seconds` and is then cut in the
+    middle of the first pause of `min_silence_ms`. Without such a pause it is
+    cut at its quietest frame once it reaches `max_seconds`.
+
+    Args:
+        energies: Frame levels from frame_energies
+        target_seconds: Preferred minimum segment length
+        max_seconds: Hard maximum segment length
+        min_silence_ms: Pause length that counts as a boundary
+        frame_ms: Frame length the energies were computed with
+        final: The recording is complete. Otherwise (incremental use) only
+            cuts whose pause has been fully received are returned, and the
+            tail after the last cut is left for later.
+
+    Returns:
+        Increasing frame indices of the cuts
+    """
+    target = max(1, int(target_seconds * 1000 / frame_ms))
+    longest = max(target + 1, int(max_seconds * 1000 / frame_ms))
+    min_silence = max(1, math.ceil(min_silence_ms / frame_ms))
+    silent = energies < silence_threshold(energies)
+    total = len(energies)
+
+    cuts: List[int] = []
+    start = 0
+    while True:
+        if final and total - start <= longest:
+            break
+        cut = None
+        run = 0
+        for index in range(start + target, min(total, start + longest)):
+            run = run + 1 if silent[index] else 0
+            if run >= min_silence:
+                cut = index - min_silence // 2
+                break
+        if cut is None:
+            if start + longest > total:
+                # Not enough audio yet to force a cut
+                break
+            window = energies[start + target:start + longest]
+            cut = start + target + int(np.argmin(window))
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+def split_at_silence(
+    audio: PCMAudio,
+    target_seconds: float,
+    max_seconds: float,
+    min_silence_ms: int,
+    final: bool = True
+) -> List[PCMAudio]:
+    """
+    Split a recording into segments at pauses (see find_cut_points)
+
+    With `final=False` the last element is the unfinished tail, which should
+    be kept and extended with further audio.
+    """
+    if final and audio.duration <= max_seconds:
+        return [audio]
+    frame_bytes = audio.frame_bytes()
+    cuts = find_cut_points(frame_energies(audio), target_seconds, max_seconds, min_silence_ms, final=final)
+    bounds = [0] + [cut * frame_bytes for cut in cuts] + [len(audio.samples)]
+    return [
+        PCMAudio(audio.samples[begin:end], audio.sample_rate, audio.channels)
+        for begin, end in zip(bounds, bounds[1:])
+        if end > begin or not final
+    ]
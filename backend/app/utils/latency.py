@@ -0,0 +1,160 @@
+# backend/app/utils/latency.py
+
+import asyncio
+import time
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """Latency budget for a single interview turn, shared by every stage of the turn"""
+
+    def __init__(self, budget: float):
+        """
+        Args:
+            budget: Total time allowed for the turn in seconds
+        """
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+class LatencyTracker:
+    """Rolling window of observed call latencies for one provider operation"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Return the q-th percentile (0-100) of recent latencies, or None until
+        enough samples have been collected to make it meaningful.
+        """
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(q / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+async def _timed(factory: Callable[[], Awaitable[T]], tracker: Optional[LatencyTracker]) -> T:
+    start = time.monotonic()
+    try:
+        result = await factory()
+    except asyncio.CancelledError:
+        # Timeouts are recorded by call_with_deadline; a cancelled hedge
+        # loser says nothing beyond the winner's latency
+        raise
+    except Exception:
+        # Failures count too, or the p95 only reflects the calls that went well
+        if tracker is not None:
+            tracker.record(time.monotonic() - start)
+        raise
+    if tracker is not None:
+        tracker.record(time.monotonic() - start)
+    return result
+
+
+async def hedged_call(
+    factory: Callable[[], Awaitable[T]],
+    hedge_after: float,
+    tracker: Optional[LatencyTracker] = None
+) -> T:
+    """
+    Run a call and, if it has not finished after `hedge_after` seconds, fire a
+    second identical call and return whichever finishes first.
+
+    Args:
+        factory: Zero-argument callable creating a fresh awaitable per attempt
+        hedge_after: Delay in seconds before the hedge request is sent
+        tracker: Optional tracker receiving the latency of every attempt that finishes
+
+    Returns:
+        The result of the first attempt to complete successfully
+    """
+    primary = asyncio.ensure_future(_timed(factory, tracker))
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+    except asyncio.CancelledError:
+        # asyncio.wait does not cancel what it waits on
+        primary.cancel()
+        raise
+    if done:
+        return primary.result()
+
+    logger.info(f"Hedging request after {hedge_after:.2f}s")
+    pending = {primary, asyncio.ensure_future(_timed(factory, tracker))}
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def call_with_deadline(
+    factory: Callable[[], Awaitable[T]],
+    deadline: Optional[Deadline] = None,
+    tracker: Optional[LatencyTracker] = None,
+    hedge: bool = False,
+    hedge_percentile: float = 95.0
+) -> T:
+    """
+    Await a provider call bounded by the remaining turn budget.
+
+    Args:
+        factory: Zero-argument callable creating the provider awaitable
+        deadline: Turn deadline; when None the call is unbounded
+        tracker: Latency tracker for the operation, used for the hedge threshold
+        hedge: Whether to send a hedge request after the p95 latency
+        hedge_percentile: Percentile of recent latencies used as hedge threshold;
+            no hedge is sent until the tracker has enough samples
+
+    Returns:
+        The provider result
+
+    Raises:
+        asyncio.TimeoutError: If the deadline is reached first
+    """
+    timeout = deadline.remaining() if deadline is not None else None
+    if timeout is not None and timeout <= 0:
+        raise asyncio.TimeoutError()
+
+    hedge_after = None
+    if hedge and tracker is not None:
+        hedge_after = tracker.percentile(hedge_percentile)
+
+    if hedge_after is not None and (timeout is None or hedge_after < timeout):
+        call = hedged_call(factory, hedge_after, tracker)
+    else:
+        call = _timed(factory, tracker)
+
+    try:
+        return await asyncio.wait_for(call, timeout=timeout)
+    except asyncio.TimeoutError:
+        # A call cut off by the deadline took at least the whole remaining budget
+        if tracker is not None and deadline is not None and deadline.expired:
+            tracker.record(timeout)
+        raise
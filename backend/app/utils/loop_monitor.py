@@ -0,0 +1,132 @@
+# backend/app/utils/loop_monitor.py
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, List, Optional
+
+from utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_SECONDS = registry.histogram(
+    "event_loop_lag_seconds", "Delay before the event loop ran a watchdog ping",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+)
+LOOP_BLOCKED = registry.counter(
+    "event_loop_blocked_total", "Times a callback blocked the event loop past the watchdog threshold"
+)
+
+
+class BlockingReport:
+    """One episode of the event loop being blocked"""
+
+    def __init__(self, duration: float, stack: str):
+        self.duration = duration
+        self.stack = stack
+
+    def __repr__(self):
+        return f"BlockingReport(duration={self.duration * 1000:.0f}ms)\n{self.stack}"
+
+
+class LoopWatchdog:
+    """
+    Detects callbacks that block the event loop.
+
+    A background thread pings the loop with call_soon_threadsafe. If a ping is
+    not answered within `threshold` seconds, the loop thread's current stack
+    (the code that is blocking it) is captured, then logged with the total
+    blocked time once the loop recovers. Every ping's delay is recorded in
+    the event_loop_lag_seconds histogram.
+    """
+
+    def __init__(self, threshold: float = 0.1, interval: float = 0.05, max_reports: int = 100):
+        self.threshold = threshold
+        self.interval = interval
+        self.reports: Deque[BlockingReport] = deque(maxlen=max_reports)
+        self.blocked = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Watch the running loop; must be called from a coroutine on that loop"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _ack(self, sent: float, acked: threading.Event):
+        LOOP_LAG_SECONDS.observe(time.monotonic() - sent)
+        acked.set()
+
+    def _loop_stack(self) -> str:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        return "".join(traceback.format_stack(frame)) if frame is not None else "<stack unavailable>"
+
+    def _watch(self):
+        while not self._stopping.is_set():
+            acked = threading.Event()
+            sent = time.monotonic()
+            try:
+                self._loop.call_soon_threadsafe(self._ack, sent, acked)
+            except RuntimeError:
+                # Loop closed
+                return
+
+            if not acked.wait(self.threshold):
+                stack = self._loop_stack()
+                while not acked.wait(self.interval):
+                    if self._stopping.is_set() or self._loop.is_closed():
+                        return
+                report = BlockingReport(time.monotonic() - sent, stack)
+                self.reports.append(report)
+                self.blocked += 1
+                LOOP_BLOCKED.inc()
+                logger.warning(f"Event loop blocked for {report.duration * 1000:.0f}ms at:\n{stack}")
+
+            self._stopping.wait(self.interval)
+
+
+@contextmanager
+def assert_no_blocking(watchdog: Optional[LoopWatchdog]):
+    """
+    Fail if the watched loop was blocked while the block ran.
+
+    Meant for test fixtures, with the app started with LOOP_WATCHDOG=True:
+
+        @pytest.fixture
+        def client():
+            with TestClient(app) as client, assert_no_blocking(services.watchdog):
+                yield client
+
+    Args:
+        watchdog: The running watchdog (ServiceContainer.watchdog)
+
+    Raises:
+        AssertionError: With the blocking stacks, if any callback blocked
+    """
+    if watchdog is None:
+        raise RuntimeError("Loop watchdog is not running; start the app with LOOP_WATCHDOG=True")
+    seen = watchdog.blocked
+    yield watchdog
+    # Give the watchdog one threshold to notice a block that just ended
+    time.sleep(watchdog.threshold + watchdog.interval)
+    new = min(watchdog.blocked - seen, len(watchdog.reports))
+    reports: List[BlockingReport] = list(watchdog.reports)[len(watchdog.reports) - new:]
+    if reports:
+        details = "\n".join(repr(report) for report in reports)
+        raise AssertionError(f"Event loop was blocked {len(reports)} time(s):\n{details}")
@@ -0,0 +1,203 @@
+# backend/app/utils/metrics.py
+
+import time
+import asyncio
+import logging
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers sub-millisecond persistence up to slow provider calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0)
+
+
+def _format_labels(names: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {value}")
+        return lines
+
+
+class Gauge:
+    """Gauge whose value is read from a callback at scrape time"""
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float]):
+        self.name = name
+        self.help_text = help_text
+        self.read = read
+
+    def render(self) -> List[str]:
+        try:
+            value = float(self.read())
+        except Exception:
+            return []
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge", f"{self.name} {value}"]
+
+
+class Histogram:
+    """Fixed-bucket histogram with optional labels"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, label_values)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, label_values)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._metrics.setdefault(name, Counter(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._metrics.setdefault(name, Histogram(name, help_text, labels, buckets))
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float]) -> Gauge:
+        gauge = Gauge(name, help_text, read)
+        self._metrics[name] = gauge
+        return gauge
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS = registry.histogram(
+    "interview_stage_seconds", "Latency of each interview turn pipeline stage", ["stage"]
+)
+TURN_SECONDS = registry.histogram(
+    "interview_turn_seconds", "Server-side latency of a full interview turn"
+)
+PROVIDER_SECONDS = registry.histogram(
+    "provider_request_seconds", "Latency of external provider requests", ["provider", "operation"]
+)
+PROVIDER_ERRORS = registry.counter(
+    "provider_errors_total", "Failed or timed out external provider requests", ["provider", "operation", "reason"]
+)
+CANCELLED_WORK = registry.counter(
+    "interview_cancelled_work_total", "In-flight turn work abandoned on barge-in or disconnect", ["reason", "stage"]
+)
+
+
+@contextmanager
+def span(stage: str, trace: Optional["TurnTrace"] = None):
+    """
+    Time a pipeline stage into interview_stage_seconds (and the turn trace, if
+    given). Cancelled stages are not recorded as latencies.
+    """
+    start = time.perf_counter()
+    if trace is not None:
+        trace.stage = stage
+    cancelled = False
+    try:
+        yield
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        if not cancelled:
+            elapsed = time.perf_counter() - start
+            STAGE_SECONDS.observe(elapsed, stage)
+            if trace is not None:
+                trace.stages[stage] = trace.stages.get(stage, 0.0) + elapsed
+
+
+@contextmanager
+def observe_provider(provider: str, operation: str):
+    """Record latency of a provider request and count it if it raises"""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        reason = {"TimeoutError": "timeout", "CancelledError": "cancelled"}.get(type(e).__name__, "error")
+        PROVIDER_ERRORS.inc(provider, operation, reason)
+        raise
+    finally:
+        PROVIDER_SECONDS.observe(time.perf_counter() - start, provider, operation)
+
+
+class TurnTrace:
+    """Per-turn collection of stage timings, logged as one line when the turn ends"""
+
+    def __init__(self, interview_id: str, question_number: int):
+        self.interview_id = interview_id
+        self.question_number = question_number
+        self.stages: Dict[str, float] = {}
+        # Stage the turn is in, reported when its work is cancelled
+        self.stage = "queued"
+        self.start = time.perf_counter()
+
+    def cancelled(self, reason: str):
+        """Count the turn's in-flight work as abandoned ("barge_in" or "disconnect")"""
+        CANCELLED_WORK.inc(reason, self.stage)
+
+    def finish(self):
+        total = time.perf_counter() - self.start
+        TURN_SECONDS.observe(total)
+        if logger.isEnabledFor(logging.DEBUG):
+            breakdown = " ".join(f"{stage}={seconds * 1000:.0f}ms" for stage, seconds in self.stages.items())
+            logger.debug(f"turn interview={self.interview_id} question={self.question_number} total={total * 1000:.0f}ms {breakdown}")
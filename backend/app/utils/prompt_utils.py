@@ -2,6 +2,13 @@
 
 from typing import List, Dict, Any
 
+# Spoken when the interview ends
+COMPLETION_MESSAGE = "Thank you for completing this interview. Your responses have been recorded."
+
+def create_greeting(interviewer_name: str) -> str:
+    """Opening line spoken to the candidate when the interview starts"""
+    return f"Hello, I'm {interviewer_name}. Thank you for joining this interview. I'll be asking you some questions to learn more about your skills and experience."
+
 def create_initial_questions_prompt(
     cv_text: str, 
     jd_text: str, 
@@ -178,4 +185,110 @@ def create_assessment_prompt(
     return {
         "system": system_message,
         "user": user_message
-    }
\ No newline at end of file
+    }
+
+def create_assessment_repair_prompt(
+    previous_output: str,
+    error: str
+) -> Dict[str, str]:
+    """
+    Create a prompt asking the model to fix an assessment that failed validation
+    
+    Args:
+        previous_output: The model's previous (invalid) response
+        error: Description of why the response was rejected
+        
+    Returns:
+        Dict containing system and user prompts
+    """
+    system_message = """
+    You repair malformed candidate assessments. Respond with ONLY a JSON object with the following structure:
+    {
+        "rating": <integer between 1-10>,
+        "verdict": "<brief hiring recommendation>",
+        "detailed_feedback": {
+            "strengths": ["<strength 1>", "<strength 2>", ...],
+            "weaknesses": ["<weakness 1>", "<weakness 2>", ...],
+            "fit_for_role": "<assessment of fit>"
+        }
+    }
+    
+    Preserve the content of the original assessment. Do not add prose or code fences.
+    """
+    
+    user_message = f"""
+    ## Previous Response
+    {previous_output[:4000]}
+    
+    ## Validation Error
+    {error[:1000]}
+    
+    Please return the corrected assessment as a JSON object.
+    """
+    
+    return {
+        "system": system_message,
+        "user": user_message
+    }
+
+DIMENSION_DESCRIPTIONS = {
+    "technical_depth": "depth and accuracy of the technical knowledge shown in the answer",
+    "communication": "clarity, structure and conciseness of the answer",
+    "role_fit": "how well the experience and motivation shown match the job description"
+}
+
+def create_dimension_score_prompt(
+    dimension: str,
+    question: str,
+    answer: str,
+    cv_text: str,
+    jd_text: str
+) -> Dict[str, str]:
+    """
+    Create a small prompt scoring one answer on a single assessment dimension
+    
+    Args:
+        dimension: Key of DIMENSION_DESCRIPTIONS to score
+        question: The interviewer's question
+        answer: The candidate's answer
+        cv_text: Text content of the CV
+        jd_text: Text content of the job description
+        
+    Returns:
+        Dict containing system and user prompts
+    """
+    # Only a short excerpt is needed for per-answer scoring
+    cv_text = cv_text[:1000]
+    jd_text = jd_text[:1000]
+    
+    system_message = f"""
+    You are an experienced hiring manager scoring a single interview answer.
+    
+    Score ONLY the {dimension.replace("_", " ")}: {DIMENSION_DESCRIPTIONS[dimension]}.
+    Use a scale from 1-10 (where 1 is very poor and 10 is excellent).
+    
+    Format your response as a JSON object with the following structure:
+    {{
+        "score": <integer between 1-10>,
+        "evidence": "<one sentence justifying the score>"
+    }}
+    """
+    
+    user_message = f"""
+    ## CV Summary
+    {cv_text}
+    
+    ## Job Description Summary
+    {jd_text}
+    
+    ## Question
+    {question}
+    
+    ## Candidate Answer
+    {answer}
+    """
+    
+    return {
+        "system": system_message,
+        "user": user_message
+    }
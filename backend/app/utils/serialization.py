@@ -0,0 +1,72 @@
+# backend/app/utils/serialization.py
+
+import os
+import json
+import logging
+from typing import Any, Union
+
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# "auto" uses orjson when it is installed, "stdlib" forces the json module
+JSON_BACKEND = os.getenv("JSON_BACKEND", "auto").lower()
+
+_orjson = None
+if JSON_BACKEND != "stdlib":
+    try:
+        import orjson as _orjson
+    except ImportError:
+        if JSON_BACKEND == "orjson":
+            logger.warning("JSON_BACKEND=orjson but orjson is not installed; using the json module")
+
+BACKEND = "orjson" if _orjson is not None else "stdlib"
+
+
+def _default(obj: Any) -> Any:
+    # Compact in-memory types (e.g. models.transcript.Transcript) provide to_json()
+    to_json = getattr(obj, "to_json", None)
+    if to_json is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_json()
+
+
+def dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON bytes (compact unless `pretty`)
+
+    Args:
+        data: JSON-compatible data
+        pretty: Indent with two spaces, as the files used to be written
+
+    Returns:
+        Encoded JSON
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS | (_orjson.OPT_INDENT_2 if pretty else 0)
+        return _orjson.dumps(data, default=_default, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from bytes or str"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response encoded with the fast serializer.
+
+    Returning it from a route skips FastAPI's jsonable_encoder and response
+    model validation, so it suits large documents that are already plain
+    JSON data (e.g. interviews with long transcripts).
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
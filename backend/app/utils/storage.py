@@ -1,11 +1,14 @@
 # backend/app/utils/storage.py
 
-import json
 import os
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from fastapi import UploadFile
 import shutil
+import threading
+
+from utils.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +37,14 @@ async def save_file(upload_file: UploadFile, destination: Path) -> Path:
         logger.error(f"Error saving file: {str(e)}")
         raise e
 
-def save_json(data: dict, destination: Path) -> Path:
+def save_json(data: dict, destination: Path, pretty: bool = False) -> Path:
     """
     Save JSON data to a file
     
     Args:
         data: The data to save
         destination: Destination path
+        pretty: Indent the file for reading by hand (compact by default)
         
     Returns:
         Path to the saved file
@@ -49,9 +53,12 @@ def save_json(data: dict, destination: Path) -> Path:
         # Ensure the directory exists
         destination.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save the JSON data
-        with open(destination, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write to a temporary file and rename it over the destination, so
+        # readers in other threads or workers never see a partial document
+        tmp_path = destination.with_name(f"{destination.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(dumps(data, pretty=pretty))
+        os.replace(tmp_path, destination)
         
         return destination
     
@@ -70,8 +77,8 @@ def read_json(file_path: Path) -> dict:
         The loaded JSON data
     """
     try:
-        with open(file_path, "r") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return loads(f.read())
     
     except Exception as e:
         logger.error(f"Error reading JSON: {str(e)}")
@@ -93,4 +100,33 @@ def read_file(file_path: Path) -> str:
     
     except Exception as e:
         logger.error(f"Error reading file: {str(e)}")
-        raise e
\ No newline at end of file
+        raise e
+
+@contextmanager
+def file_lock(lock_path: Path, blocking: bool = True):
+    """
+    Hold an exclusive advisory lock shared by every worker process on this host
+    
+    Args:
+        lock_path: Lock file, created if missing. The lock is not reentrant:
+            taking it again in the same process blocks forever.
+        blocking: Wait for the lock; otherwise give up at once if another
+            process holds it
+        
+    Yields:
+        Whether the lock was acquired (always True when blocking)
+    """
+    import fcntl
+    
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as f:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,80 @@
+# backend/app/utils/structured_output.py
+
+import json
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the first complete JSON object in LLM output.
+    
+    Scans the text once, tracking brace depth and string literals, so objects
+    wrapped in prose or markdown code fences are found without retrying
+    json.loads at every offset.
+    
+    Args:
+        text: Raw model output
+        
+    Returns:
+        The decoded object, or None if no valid object is present
+    """
+    if not text:
+        return None
+    
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        
+        if char == '"' and depth > 0:
+            in_string = True
+        elif char == "{":
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                try:
+                    candidate = json.loads(text[start:index + 1])
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(candidate, dict):
+                    return candidate
+    
+    return None
+
+
+def parse_structured(text: str, model: Type[M]) -> Tuple[Optional[M], Optional[str]]:
+    """
+    Extract and validate a JSON object against a Pydantic model.
+    
+    Args:
+        text: Raw model output
+        model: Pydantic model class describing the expected shape
+        
+    Returns:
+        Tuple of (validated model or None, error description or None)
+    """
+    data = extract_json_object(text)
+    if data is None:
+        return None, "Response did not contain a JSON object"
+    
+    try:
+        return model.model_validate(data), None
+    except ValidationError as e:
+        return None, str(e)
@@ -0,0 +1,88 @@
+"""
+Throughput and peak memory of the bulk interview export at 100k records.
+
+Writes synthetic completed interviews (ten-turn transcripts) into a
+temporary results directory, then streams each export format to a null
+sink, recording rows/s and the peak of Python allocations (tracemalloc)
+while exporting, which should stay flat as the number of records grows.
+Parquet and Arrow are skipped when pyarrow is not installed.
+
+Usage (from backend/):
+    python benchmarks/bench_export.py [--records 100000] [--formats ndjson csv parquet arrow]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from services.export_service import ExportFilter, ExportUnavailable, export  # noqa: E402
+from utils.serialization import dumps  # noqa: E402
+
+
+def write_records(directory: Path, count: int):
+    rng = random.Random(0)
+    answer = "I led the migration of our billing service to Kubernetes and cut deploy time in half. " * 3
+    for n in range(count):
+        record = {
+            "id": f"interview-{n:06d}",
+            "status": "completed",
+            "role_id": f"role-{n % 20}",
+            "interviewer_name": "AI Interviewer",
+            "created_at": f"2026-{1 + n % 9:02d}-01T09:00:00+00:00",
+            "completed_at": f"2026-{1 + n % 9:02d}-01T09:30:00+00:00",
+            "questions_asked": 5,
+            "max_questions": 5,
+            "rating": rng.randint(1, 10),
+            "verdict": rng.choice(["Hire", "No hire"]),
+            "detailed_feedback": {"strengths": ["Kubernetes"], "weaknesses": ["Testing"], "summary": answer},
+            "transcript": [{"speaker": speaker, "text": answer} for _ in range(5) for speaker in ("ai", "candidate")],
+            "version": 1
+        }
+        (directory / f"{record['id']}.json").write_bytes(dumps(record))
+
+
+def run(file_format: str, directory: Path, export_filter: ExportFilter):
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = 0
+    try:
+        for chunk in export(export_filter, file_format, results_dir=directory):
+            size += len(chunk)
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--formats", nargs="+", default=["ndjson", "csv", "parquet", "arrow"])
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    start = time.perf_counter()
+    write_records(directory, args.records)
+    print(f"Wrote {args.records} records in {time.perf_counter() - start:.1f}s")
+
+    print(f"{'format':>8} {'filter':>10} {'seconds':>8} {'rows/s':>9} {'output MB':>10} {'peak MB':>8}")
+    filters = (("all", ExportFilter()), ("one role", ExportFilter(role_id="role-3", include_transcript=False)))
+    for file_format in args.formats:
+        for label, export_filter in filters:
+            try:
+                elapsed, size, peak = run(file_format, directory, export_filter)
+            except ExportUnavailable as e:
+                print(f"{file_format:>8} skipped: {str(e)}")
+                break
+            print(f"{file_format:>8} {label:>10} {elapsed:8.2f} {args.records / elapsed:9.0f} {size / 1e6:10.1f} {peak / 1e6:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
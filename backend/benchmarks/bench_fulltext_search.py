@@ -0,0 +1,129 @@
+"""
+Query latency of the full-text interview index at 100k interviews.
+
+Builds a temporary SQLite FTS5 index of synthetic interviews (ten turns,
+a verdict and detailed feedback each, from Zipf-distributed filler words
+plus technologies mentioned by a known share of candidates), then times
+searches of different selectivity, filters and deep pages, and the
+incremental indexing of single turns.
+
+Usage (from backend/):
+    python benchmarks/bench_fulltext_search.py [--interviews 100000] [--queries 50]
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from services.fulltext_service import FullTextIndex  # noqa: E402
+
+# Technologies and the share of interviews whose candidate mentions each
+TECHNOLOGIES = {
+    "python": 0.5, "kubernetes": 0.3, "postgres": 0.2, "terraform": 0.15, "redis": 0.1,
+    "kafka": 0.05, "rust": 0.02, "c++": 0.02, "elixir": 0.005, "cobol": 0.002,
+}
+
+# Everything else: 5000 Zipf-distributed filler words, "experience" the most common
+FILLER = ["experience", "team", "service", "project", "design"] + [f"word{n}" for n in range(4995)]
+FILLER_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(FILLER))))
+
+QUERIES = (
+    ("common term", "experience", {}),
+    ("50% term", "python", {}),
+    ("10% term", "redis", {}),
+    ("0.2% term", "cobol", {}),
+    ("two terms", "kubernetes terraform", {}),
+    ("phrase", '"team service"', {}),
+    ("prefix", "postg*", {}),
+    ("candidate only", "kafka", {"speaker": "candidate"}),
+    ("feedback + role", "word20", {"field": "feedback", "role_id": "role-3"}),
+    ("page 10", "kubernetes", {"page": 10}),
+)
+
+
+def synthetic_text(rng: random.Random, words: int, technologies=()) -> str:
+    tokens = rng.choices(FILLER, cum_weights=FILLER_WEIGHTS, k=words)
+    for technology in technologies:
+        tokens[rng.randrange(words)] = technology
+    return " ".join(tokens)
+
+
+def build_index(path: Path, interviews: int, rng: random.Random) -> FullTextIndex:
+    index = FullTextIndex(path)
+    operations = []
+    for n in range(interviews):
+        mentioned = [technology for technology, share in TECHNOLOGIES.items() if rng.random() < share]
+        interview = {
+            "id": f"interview-{n:06d}",
+            "status": "completed",
+            "role_id": f"role-{n % 20}",
+            "completed_at": "2026-06-01T09:30:00+00:00",
+            "transcript": [
+                {"speaker": "ai", "text": synthetic_text(rng, 12)} if turn % 2 == 0 else
+                {"speaker": "candidate", "text": synthetic_text(rng, 60, mentioned if turn == 1 else ())}
+                for turn in range(10)
+            ],
+            "verdict": rng.choice(["Hire", "No hire", "Strong hire"]),
+            "detailed_feedback": {
+                "strengths": [synthetic_text(rng, 6)],
+                "weaknesses": [synthetic_text(rng, 6)],
+                "summary": synthetic_text(rng, 25)
+            }
+        }
+        operations.append(index._index_operation(interview))
+        if len(operations) == 1000:
+            index.apply(operations)
+            operations = []
+    if operations:
+        index.apply(operations)
+    return index
+
+
+def percentiles(timings):
+    timings = np.array(timings) * 1000
+    return np.percentile(timings, 50), np.percentile(timings, 95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--interviews", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=50, help="Repetitions of each query")
+    args = parser.parse_args()
+
+    path = Path(tempfile.mkdtemp()) / "fulltext.db"
+    start = time.perf_counter()
+    index = build_index(path, args.interviews, random.Random(0))
+    print(f"Indexed {args.interviews} interviews in {time.perf_counter() - start:.1f}s "
+          f"({path.stat().st_size / 1e6:.0f}MB)")
+
+    print(f"{'query':>16} {'matches':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for label, query, filters in QUERIES:
+        timings = []
+        for _ in range(args.queries):
+            start = time.perf_counter()
+            result = index.search(query, **filters)
+            timings.append(time.perf_counter() - start)
+        p50, p95 = percentiles(timings)
+        print(f"{label:>16} {result['total']:8d} {p50:8.2f} {p95:8.2f}")
+
+    # Incremental updates as the websocket makes them: queue a turn, then wait for the commit
+    timings = []
+    for n in range(args.queries):
+        start = time.perf_counter()
+        index.add_turn("interview-live", "candidate", "I migrated our kafka consumers to rust")
+        index.flush()
+        timings.append(time.perf_counter() - start)
+    p50, p95 = percentiles(timings)
+    print(f"{'add_turn':>16} {'':>8} {p50:8.2f} {p95:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Micro-benchmarks for code that runs on every interview turn or API request,
+compared against a checked-in baseline.
+
+Each case is timed in repeats of enough loops to last ~50 ms; the fastest
+repeat is reported per call, as it is the least disturbed by other load.
+A case regresses when it is slower than its baseline by more than the
+tolerance factor, and the script then exits non-zero.
+
+Baselines depend on the machine, so refresh benchmarks/baseline.json with
+--update-baseline on the machine that runs the comparison.
+
+Usage (from backend/):
+    python benchmarks/bench_hot_paths.py [--filter prompt] [--tolerance 1.3]
+    python benchmarks/bench_hot_paths.py --update-baseline
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+# Keep generated fixtures out of the real data directory
+os.environ["DATA_DIR"] = tempfile.mkdtemp(prefix="bench-hot-paths-")
+
+from config import DATA_DIR  # noqa: E402
+from utils.prompt_utils import create_follow_up_prompt  # noqa: E402
+from utils.storage import save_json, read_json  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+ANSWER = (
+    "In my last role I owned the ingestion pipeline, moving it from cron jobs to Kafka consumers. "
+    "The main trade-off was exactly-once delivery versus throughput, so we made the consumers "
+    "idempotent and kept at-least-once semantics, which cut end-to-end latency from minutes to seconds. "
+)
+QUESTION = "Can you describe a system you designed end to end, and the trade-offs you made along the way?"
+
+
+def make_transcript(turns: int) -> List[Dict[str, str]]:
+    transcript = []
+    for _ in range(turns):
+        transcript.append({"speaker": "ai", "text": QUESTION})
+        transcript.append({"speaker": "candidate", "text": ANSWER * 2})
+    return transcript
+
+
+def make_interview(interview_id: str, questions: int = 10) -> dict:
+    """Completed interview document shaped like the ones in data/results"""
+    return {
+        "id": interview_id,
+        "cv_path": f"/data/cv/{interview_id}.pdf",
+        "jd_path": f"/data/jd/{interview_id}.pdf",
+        "prompt_path": f"/data/prompts/{interview_id}.json",
+        "status": "completed",
+        "transcript": make_transcript(questions),
+        "questions_asked": questions,
+        "max_questions": questions,
+        "interviewer_name": "AI Interviewer",
+        "role_id": "0123456789abcdef",
+        "created_at": "2024-01-15T10:00:00+00:00",
+        "completed_at": "2024-01-15T10:30:00+00:00",
+        "initial_questions": [QUESTION] * 3,
+        "answer_scores": [
+            {
+                "question_number": n,
+                "scores": {
+                    dimension: {"score": 7, "evidence": ANSWER[:120]}
+                    for dimension in ("technical_depth", "communication", "role_fit")
+                },
+            }
+            for n in range(1, questions + 1)
+        ],
+        "session": {"resume_token": "x" * 22, "last_seq": questions, "pending_question": None},
+        "rating": 7,
+        "verdict": "Hire: the candidate is a good match with some areas to develop.",
+        "detailed_feedback": {"strengths": [ANSWER[:80]] * 5, "weaknesses": [ANSWER[:80]] * 3},
+    }
+
+
+def make_pdf(path: Path, pages: int, lines_per_page: int = 40):
+    """Write a text PDF with Helvetica pages, without needing a PDF library"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_refs = []
+    for page in range(pages):
+        lines = [f"Page {page + 1} line {line}: {ANSWER[:90]}" for line in range(lines_per_page)]
+        text = " ".join(f"({line}) Tj T*" for line in lines)
+        stream = f"BT /F1 10 Tf 12 TL 40 800 Td {text} ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        page_refs.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def run_async(coroutine_function: Callable) -> Callable:
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(coroutine_function())
+
+
+def build_cases() -> List[Tuple[str, Callable[[], Callable]]]:
+    """(name, setup) pairs; setup builds fixtures and returns the function to time"""
+    cases = []
+
+    for turns in (5, 20, 50):
+        def setup(turns=turns):
+            transcript = make_transcript(turns)
+            cv_text, jd_text = ANSWER * 30, ANSWER * 20
+            return lambda: create_follow_up_prompt(transcript, cv_text, jd_text, "Be friendly.")
+        cases.append((f"create_follow_up_prompt[{turns}_turns]", setup))
+
+    def setup_save():
+        document, path = make_interview("bench-save"), DATA_DIR / "bench" / "save.json"
+        return lambda: save_json(document, path)
+    cases.append(("save_json[interview]", setup_save))
+
+    def setup_read():
+        path = save_json(make_interview("bench-read"), DATA_DIR / "bench" / "read.json")
+        return lambda: read_json(path)
+    cases.append(("read_json[interview]", setup_read))
+
+    for recheck, label in ((60, "cached"), (0, "stat")):
+        def setup(recheck=recheck):
+            from services.interview_store import InterviewStore
+            store = InterviewStore(DATA_DIR / "bench", recheck_seconds=recheck)
+            store.save(make_interview("bench-version"))
+            return lambda: store.version("bench-version")
+        cases.append((f"interview_version[{label}]", setup))
+
+    for pages in (2, 10):
+        def setup(pages=pages):
+            from services.llm_service import LLMService
+            service = LLMService()
+            path = DATA_DIR / "bench" / f"cv-{pages}.pdf"
+            make_pdf(path, pages)
+
+            async def extract():
+                # Measure a cold extraction, not the per-file cache
+                service._pdf_text_cache.clear()
+                return await service._extract_text_from_pdf(str(path))
+            return run_async(extract)
+        cases.append((f"extract_text_from_pdf[{pages}_pages]", setup))
+
+    for count in (1000, 10000):
+        def setup(count=count):
+            import routers.interviews as interviews
+            directory = DATA_DIR / f"results-{count}"
+            document = make_interview("template")
+            for n in range(count):
+                document["id"] = f"interview-{n:05d}"
+                save_json(document, directory / f"{document['id']}.json")
+            interviews.RESULTS_DIR = directory
+            return run_async(interviews.list_interviews)
+        cases.append((f"list_interviews[{count}_files]", setup))
+
+    for kilobytes in (64, 1024):
+        def setup(kilobytes=kilobytes):
+            from services.stt_service import STTService
+            audio = base64.b64encode(os.urandom(kilobytes * 1024)).decode("ascii")
+
+            return lambda: STTService._decode_audio(audio)
+        cases.append((f"stt_decode_audio[{kilobytes}_kb]", setup))
+
+    for seconds in (1, 10):
+        def setup(seconds=seconds):
+            import io
+            import wave
+            from utils.audio_format import normalize_audio
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav:
+                wav.setnchannels(2)
+                wav.setsampwidth(2)
+                wav.setframerate(48000)
+                wav.writeframes(os.urandom(seconds * 48000 * 4))
+            audio = buffer.getvalue()
+            return lambda: normalize_audio(audio)
+        cases.append((f"normalize_audio[48k_stereo_{seconds}s]", setup))
+
+    return cases
+
+
+def measure(function: Callable, repeat: int, min_time: float = 0.05) -> Dict[str, float]:
+    """Per-call seconds: fastest and median of `repeat` timed batches"""
+    function()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        if time.perf_counter() - start >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        timings.append((time.perf_counter() - start) / loops)
+    return {"min_us": round(min(timings) * 1e6, 2), "median_us": round(statistics.median(timings) * 1e6, 2), "loops": loops}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend hot-path micro-benchmarks")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=float(os.getenv("BENCH_TOLERANCE", "1.3")),
+                        help="Flag cases slower than baseline x tolerance")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"cases": {}}
+    results = {}
+    regressions = []
+
+    print(f"{'case':42s} {'min':>12s} {'median':>12s} {'baseline':>12s} {'ratio':>7s}")
+    for name, setup in build_cases():
+        if args.filter not in name:
+            continue
+        result = measure(setup(), args.repeat)
+        results[name] = result
+
+        reference = baseline["cases"].get(name)
+        ratio = result["min_us"] / reference["min_us"] if reference else None
+        flag = ""
+        if ratio is not None and ratio > args.tolerance:
+            regressions.append((name, reference["min_us"], result["min_us"], ratio))
+            flag = "  REGRESSION"
+        print(f"{name:42s} {result['min_us']:10.1f}us {result['median_us']:10.1f}us "
+              f"{(str(reference['min_us']) + 'us') if reference else '-':>12s} "
+              f"{f'{ratio:.2f}x' if ratio else '-':>7s}{flag}")
+
+    if args.update_baseline:
+        cases = {**baseline["cases"], **results} if args.filter else results
+        args.baseline.write_text(json.dumps({
+            "machine": f"{platform.system()} {platform.machine()} Python {platform.python_version()}",
+            "cases": dict(sorted(cases.items())),
+        }, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: {before:.1f}us -> {after:.1f}us ({ratio:.2f}x, tolerance {args.tolerance}x)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+JSON encode/decode cost of an interview document with a 50-turn transcript.
+
+Compares the previous storage format (json.dump with indent=2), compact
+stdlib JSON and orjson (when installed), plus the API response path:
+FastAPI's default encoding against FastJSONResponse.
+
+Usage (from backend/):
+    python benchmarks/bench_json.py [--turns 50] [--number 200]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from bench_hot_paths import make_interview  # noqa: E402
+from utils.serialization import BACKEND, FastJSONResponse  # noqa: E402
+
+
+def per_call_us(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON serialization benchmark")
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    document = make_interview("bench-json", questions=args.turns)
+    pretty = json.dumps(document, indent=2)
+    compact = json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+
+    codecs = {
+        "stdlib indent=2 (old)": (lambda: json.dumps(document, indent=2), lambda: json.loads(pretty), len(pretty)),
+        "stdlib compact": (
+            lambda: json.dumps(document, separators=(",", ":"), ensure_ascii=False),
+            lambda: json.loads(compact),
+            len(compact.encode("utf-8")),
+        ),
+    }
+    try:
+        import orjson
+        encoded = orjson.dumps(document)
+        codecs["orjson"] = (lambda: orjson.dumps(document), lambda: orjson.loads(encoded), len(encoded))
+    except ImportError:
+        print("orjson is not installed; skipping it")
+
+    print(f"Interview with {args.turns} turns; utils.serialization backend: {BACKEND}\n")
+    print(f"{'codec':24s} {'encode':>10s} {'decode':>10s} {'bytes':>9s}")
+    for name, (encode, decode, size) in codecs.items():
+        print(f"{name:24s} {per_call_us(encode, args.number):8.1f}us {per_call_us(decode, args.number):8.1f}us {size:9d}")
+
+    print(f"\n{'response':24s} {'render':>10s}")
+    responses = {
+        "JSONResponse + encoder": lambda: JSONResponse(jsonable_encoder(document)),
+        "FastJSONResponse": lambda: FastJSONResponse(document),
+    }
+    for name, render in responses.items():
+        print(f"{name:24s} {per_call_us(render, args.number):8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
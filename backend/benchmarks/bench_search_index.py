@@ -0,0 +1,76 @@
+"""
+Query latency of the local similarity index at 10k and 100k documents.
+
+Usage (from backend/):
+    python benchmarks/bench_search_index.py [--sizes 10000 100000] [--queries 200]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from services.search_service import SearchIndex, KINDS, embed_text  # noqa: E402
+
+VOCABULARY = (
+    "python java kubernetes docker terraform aws gcp azure react typescript sql postgres "
+    "redis kafka spark airflow pandas numpy pytorch tensorflow linux networking security "
+    "testing ci cd microservices api design leadership mentoring agile scrum product "
+    "latency scaling caching monitoring observability incident migration refactoring"
+).split()
+
+
+def synthetic_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def build_index(size: int, use_ann: bool, rng: random.Random) -> SearchIndex:
+    index = SearchIndex(directory=Path(tempfile.mkdtemp()), use_ann=use_ann)
+    index._loaded = True
+    kinds = list(KINDS)
+    documents = [
+        {"doc_id": f"doc:{i}", "kind": kinds[i % 3], "interview_id": f"i{i // 10}", "text": synthetic_text(rng, 60)}
+        for i in range(size)
+    ]
+    vectors = np.stack([embed_text(d["text"], index.dim) for d in documents])
+    index._append(documents, vectors)
+    return index
+
+
+def measure(index: SearchIndex, queries, **kwargs):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, k=10, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings = np.array(timings)
+    return np.percentile(timings, 50), np.percentile(timings, 95), np.percentile(timings, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    queries = [synthetic_text(rng, 4) for _ in range(args.queries)]
+
+    print(f"{'docs':>8} {'mode':>12} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for size in args.sizes:
+        for use_ann in (False, True):
+            index = build_index(size, use_ann, rng)
+            for label, kwargs in (("brute", {"approximate": False}), ("brute+kind", {"approximate": False, "kind": "answer"})) \
+                    if not use_ann else (("lsh", {"approximate": True}),):
+                p50, p95, p99 = measure(index, queries, **kwargs)
+                print(f"{size:>8} {label:>12} {p50:8.2f} {p95:8.2f} {p99:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Latency of transcribing long answers whole, split into parallel segments,
+and incrementally while the answer is still being spoken.
+
+Answers are synthetic 16 kHz WAV recordings of noise bursts ("speech")
+separated by short pauses, transcribed by fakes.FakeSTTService, whose
+requests take a fixed latency plus a cost per second of audio. Incremental
+transcription receives the answer in one-second chunks at speaking pace;
+its latency is measured from the last chunk. Time is compressed by
+--speed so a five minute answer does not take five minutes; all reported
+figures are scaled back to real time.
+
+Usage (from backend/):
+    python benchmarks/bench_segmented_stt.py [--lengths 30,60,120,300] [--realtime-factor 0.1]
+"""
+
+import argparse
+import asyncio
+import base64
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np  # noqa: E402
+
+from fakes import FakeSTTService, LatencyModel  # noqa: E402
+from utils.audio_segmenter import PCMAudio, frame_energies, silence_threshold, split_at_silence  # noqa: E402
+
+SAMPLE_RATE = 16000
+
+# The fake needs no API key
+logging.getLogger("services.stt_service").setLevel(logging.ERROR)
+
+
+def make_answer(seconds: float, seed: int) -> PCMAudio:
+    """Noise bursts of 1.5-6s separated by 0.3-1.2s near-silent pauses"""
+    rng = random.Random(seed)
+    noise = np.random.default_rng(seed)
+    parts = []
+    total = 0.0
+    while total < seconds:
+        speech = rng.uniform(1.5, 6.0)
+        pause = rng.uniform(0.3, 1.2)
+        parts.append(noise.normal(0, 3000, int(speech * SAMPLE_RATE)))
+        parts.append(noise.normal(0, 30, int(pause * SAMPLE_RATE)))
+        total += speech + pause
+    samples = np.clip(np.concatenate(parts)[:int(seconds * SAMPLE_RATE)], -32768, 32767).astype("<i2")
+    return PCMAudio(samples.tobytes(), SAMPLE_RATE)
+
+
+def check_cuts(audio: PCMAudio, segments) -> bool:
+    """Every cut falls in a pause (or at a forced cut when there was none)"""
+    energies = frame_energies(audio)
+    threshold = silence_threshold(energies)
+    frame_bytes = audio.frame_bytes()
+    position = 0
+    for segment in segments[:-1]:
+        position += len(segment.samples)
+        if energies[position // frame_bytes] >= threshold:
+            return False
+    return True
+
+
+async def timed(coroutine):
+    start = time.perf_counter()
+    result = await coroutine
+    return result, time.perf_counter() - start
+
+
+async def run(args):
+    speed = args.speed
+    print(f"{'answer':>7s} {'segments':>9s} {'whole':>9s} {'segmented':>10s} {'incremental':>12s}  cuts in pauses")
+    for length in args.lengths:
+        audio = make_answer(length, seed=length)
+        wav = audio.to_wav()
+        audio_data = base64.b64encode(wav).decode("ascii")
+
+        def service(**overrides):
+            stt = FakeSTTService(LatencyModel(args.latency / speed), realtime_factor=args.realtime_factor / speed)
+            for name, value in overrides.items():
+                setattr(stt, name, value)
+            return stt
+
+        whole = service(segment_max_seconds=float("inf"))
+        _, whole_time = await timed(whole.speech_to_text(audio_data))
+
+        segmented = service()
+        segments = split_at_silence(audio, segmented.segment_seconds, segmented.segment_max_seconds, segmented.min_silence_ms)
+        _, segmented_time = await timed(segmented.speech_to_text(audio_data))
+
+        incremental = service()
+        transcription = incremental.incremental()
+        chunk = audio.bytes_per_second
+        for offset in range(0, len(audio.samples), chunk):
+            piece = PCMAudio(audio.samples[offset:offset + chunk], SAMPLE_RATE)
+            await transcription.feed(base64.b64encode(piece.to_wav()).decode("ascii"))
+            await asyncio.sleep(piece.duration / speed)
+        _, incremental_time = await timed(transcription.finish())
+
+        print(
+            f"{length:6d}s {len(segments):9d} {whole_time * speed:8.2f}s {segmented_time * speed:9.2f}s "
+            f"{incremental_time * speed:11.2f}s  {'yes' if check_cuts(audio, segments) else 'NO'}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Segmented transcription benchmark")
+    parser.add_argument("--lengths", default="30,60,120,300", help="Answer lengths in seconds")
+    parser.add_argument("--latency", type=float, default=0.3, help="Fixed STT request latency in seconds")
+    parser.add_argument("--realtime-factor", type=float, default=0.1, help="STT seconds per second of audio")
+    parser.add_argument("--speed", type=float, default=20.0, help="Time compression of the simulation")
+    args = parser.parse_args()
+    args.lengths = [int(length) for length in args.lengths.split(",")]
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Cold-start benchmark: time a fresh `import main` and fail on regressions.
+
+Exits non-zero if the median cold import exceeds the budget or if a provider
+SDK that should be lazily imported is loaded at startup.
+
+Usage (from backend/):
+    python benchmarks/bench_startup.py [--runs 7] [--max-ms 1500]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+# Heavy modules that must only be imported when a service first needs them
+LAZY_MODULES = ["openai", "deepgram", "PyPDF2", "jwt", "requests", "numpy"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (LAZY_MODULES,)
+
+
+def run_once() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit("Importing main failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "1500")),
+                        help="Fail if the median cold import takes longer than this")
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+    timings = sorted(sample["ms"] for sample in samples)
+    median = statistics.median(timings)
+    loaded = sorted({module for sample in samples for module in sample["loaded"]})
+
+    print(f"cold import of main over {args.runs} runs: "
+          f"min {timings[0]:.0f} ms, median {median:.0f} ms, max {timings[-1]:.0f} ms (budget {args.max_ms:.0f} ms)")
+
+    failed = False
+    if median > args.max_ms:
+        print(f"FAIL: median cold start {median:.0f} ms exceeds budget of {args.max_ms:.0f} ms")
+        failed = True
+    if loaded:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(loaded)}")
+        failed = True
+
+    if failed:
+        raise SystemExit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Memory and speed of models.transcript.Transcript against lists of dicts.
+
+Builds the transcripts of many live sessions both ways and reports the
+memory traced while building them, plus append and iteration cost. The text
+strings are shared between both representations so only the per-turn
+overhead is compared.
+
+Usage (from backend/):
+    python benchmarks/bench_transcript_memory.py [--sessions 2000] [--turns 20]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from models.transcript import Transcript  # noqa: E402
+from utils.serialization import dumps  # noqa: E402
+
+QUESTION = "Can you describe a system you designed end to end, and the trade-offs you made?"
+ANSWER = "I owned the ingestion pipeline and moved it from cron jobs to Kafka consumers."
+
+
+def build_dicts(sessions: int, turns: int, now: float):
+    return [
+        [
+            {"speaker": "ai" if n % 2 == 0 else "candidate", "text": QUESTION if n % 2 == 0 else ANSWER, "at": now}
+            for n in range(turns)
+        ]
+        for _ in range(sessions)
+    ]
+
+
+def build_transcripts(sessions: int, turns: int, now: float):
+    result = []
+    for _ in range(sessions):
+        transcript = Transcript()
+        for n in range(turns):
+            transcript.append("ai" if n % 2 == 0 else "candidate", QUESTION if n % 2 == 0 else ANSWER, at=now)
+        result.append(transcript)
+    return result
+
+
+def traced(build, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = build(*args)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, size, elapsed
+
+
+def iterate(data) -> float:
+    start = time.perf_counter()
+    for transcript in data:
+        for entry in transcript:
+            entry["speaker"], entry["text"]
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcript memory benchmark")
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    turns_total = args.sessions * args.turns
+    print(f"{args.sessions} sessions x {args.turns} turns\n")
+    print(f"{'representation':18s} {'memory':>10s} {'bytes/turn':>11s} {'build':>9s} {'iterate':>9s}")
+
+    results = {}
+    now = time.time()
+    for name, build in (("list of dicts", build_dicts), ("Transcript", build_transcripts)):
+        data, size, build_time = traced(build, args.sessions, args.turns, now)
+        iterate_time = iterate(data)
+        results[name] = data
+        print(f"{name:18s} {size / 1e6:8.2f}MB {size / turns_total:11.1f} "
+              f"{build_time * 1000:7.1f}ms {iterate_time * 1000:7.1f}ms")
+
+    # The compact form must serialize to exactly the stored JSON shape
+    assert dumps(results["Transcript"][0]) == dumps(results["list of dicts"][0])
+    print("\nSerialized output is identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Local stand-ins for the LLM, STT and TTS services with configurable latency.
+
+They implement the methods the routers and the interview websocket call, so a
+worker can be exercised end to end without network access or API keys.
+Latencies are drawn from a log-normal distribution given by its median and
+95th percentile, and calls that would overrun the turn deadline behave like
+the real services on timeout.
+"""
+
+import asyncio
+import math
+import random
+from typing import Dict, List, Optional
+
+from services.llm_service import DEFAULT_FOLLOW_UP_QUESTION
+from services.stt_service import STTService
+from utils.audio_segmenter import read_wav
+from utils.latency import Deadline
+
+# z-score of the 95th percentile of a standard normal distribution
+Z_95 = 1.6449
+
+
+class LatencyModel:
+    """Log-normal latency distribution given its median and p95 in seconds"""
+
+    def __init__(self, median: float, p95: float = None, seed: int = None):
+        self.median = median
+        self.p95 = max(p95 if p95 is not None else median, median)
+        self.sigma = math.log(self.p95 / median) / Z_95 if median > 0 else 0.0
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def parse(cls, spec: str, seed: int = None) -> "LatencyModel":
+        """Build from "median" or "median,p95", e.g. "0.8,2.5" """
+        parts = [float(part) for part in spec.split(",")]
+        return cls(parts[0], parts[1] if len(parts) > 1 else None, seed=seed)
+
+    def sample(self) -> float:
+        if self.median <= 0:
+            return 0.0
+        return self.median * math.exp(self.sigma * self.rng.gauss(0.0, 1.0))
+
+    async def wait(self, deadline: Optional[Deadline] = None) -> bool:
+        """Sleep for one sampled latency; False if the deadline cut it short"""
+        delay = self.sample()
+        if deadline is not None and delay > deadline.remaining():
+            await asyncio.sleep(max(deadline.remaining(), 0.0))
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    def __repr__(self):
+        return f"LatencyModel(median={self.median}, p95={self.p95})"
+
+
+class FakeLLMService:
+    """LLMService replacement returning canned questions and scores"""
+
+    def __init__(self, latency: LatencyModel, scoring_latency: LatencyModel = None):
+        self.latency = latency
+        self.scoring_latency = scoring_latency or latency
+
+    async def get_document_text(self, pdf_path: str) -> str:
+        return "Senior backend engineer with Python, FastAPI, PostgreSQL and Kubernetes experience."
+
+    async def generate_initial_questions(self, cv_path: str, jd_path: str, system_prompt: str, max_questions: int = 10) -> List[str]:
+        await self.latency.wait()
+        return [f"Can you walk me through project number {n}?" for n in range(1, min(max_questions, 3) + 1)]
+
+    async def generate_follow_up_question(self, transcript, system_prompt, cv_path, jd_path, deadline: Optional[Deadline] = None) -> str:
+        if not await self.latency.wait(deadline):
+            return DEFAULT_FOLLOW_UP_QUESTION
+        return f"Thanks. What trade-offs did you make in answer {len(transcript) // 2}?"
+
+    async def score_answer_dimension(self, dimension: str, question: str, answer: str, cv_path: str, jd_path: str) -> Optional[Dict]:
+        await self.scoring_latency.wait()
+        return {"score": 6 + len(answer) % 4, "evidence": answer[:80]}
+
+    async def generate_final_assessment(self, transcript, cv_path, jd_path) -> Dict:
+        await self.latency.wait()
+        return {"rating": 7, "verdict": "Hire", "detailed_feedback": {"strengths": [], "weaknesses": []}}
+
+
+class FakeSTTService(STTService):
+    """
+    STTService with the Deepgram call replaced by a wait, so decoding,
+    segmentation and parallel segment transcription run as in production.
+    Each request takes a sampled latency plus `realtime_factor` seconds per
+    second of audio (raw bytes are assumed to be 16 kHz mono 16-bit).
+    """
+
+    def __init__(self, latency: LatencyModel, realtime_factor: float = 0.0):
+        super().__init__()
+        self.provider_latency = latency
+        self.realtime_factor = realtime_factor
+        self.requests = 0
+
+    async def _transcribe(self, audio: bytes, deadline: Optional[Deadline] = None, mimetype: str = "audio/wav") -> str:
+        self.requests += 1
+        pcm = read_wav(audio)
+        duration = pcm.duration if pcm is not None else len(audio) / 32000
+        await asyncio.sleep(duration * self.realtime_factor)
+        if not await self.provider_latency.wait(deadline):
+            raise asyncio.TimeoutError()
+        return f"Synthetic answer transcribed from {len(audio)} bytes of audio."
+
+    async def close(self):
+        pass
+
+
+class FakeTTSService:
+    """TTSService replacement returning a placeholder audio URL"""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self._counter = 0
+
+    async def text_to_speech(self, text: str, deadline: Optional[Deadline] = None) -> str:
+        if not await self.latency.wait(deadline):
+            return ""
+        self._counter += 1
+        return f"/data/audio/fake-{self._counter}.mp3"
+
+    async def close(self):
+        pass
+
+
+def install_fakes(container, llm: FakeLLMService, stt: FakeSTTService, tts: FakeTTSService):
+    """Put the fakes into a ServiceContainer before any service is first used"""
+    container._llm = llm
+    container._stt = stt
+    container._tts = tts
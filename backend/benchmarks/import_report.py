@@ -0,0 +1,62 @@
+"""
+Import-time report for the backend, based on `python -X importtime`.
+
+Usage (from backend/):
+    python benchmarks/import_report.py [--module main] [--top 25] [--by-package]
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+
+def collect(module: str):
+    """Return (module, self_us, cumulative_us) rows for a fresh import of `module`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time breakdown of the backend")
+    parser.add_argument("--module", default="main", help="Module to import from backend/app")
+    parser.add_argument("--top", type=int, default=25, help="Number of rows to show")
+    parser.add_argument("--by-package", action="store_true", help="Aggregate self time by top-level package")
+    args = parser.parse_args()
+
+    rows = collect(args.module)
+    total_ms = max(cumulative for _, _, cumulative in rows) / 1000
+
+    if args.by_package:
+        totals = defaultdict(int)
+        for name, self_us, _ in rows:
+            totals[name.split(".")[0]] += self_us
+        print(f"{'package':<40} {'self ms':>9} {'share':>7}")
+        for package, self_us in sorted(totals.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"{package:<40} {self_us / 1000:9.1f} {self_us / 1000 / total_ms:7.1%}")
+    else:
+        print(f"{'module':<50} {'self ms':>9} {'cumul ms':>9}")
+        for name, self_us, cumulative_us in sorted(rows, key=lambda row: -row[2])[:args.top]:
+            print(f"{name:<50} {self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}")
+
+    print(f"\nTotal import time of {args.module}: {total_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
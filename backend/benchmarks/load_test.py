@@ -0,0 +1,272 @@
+"""
+Offline load test: N simulated candidates against one in-process worker.
+
+Starts the app with uvicorn on a local port, backed by the fake LLM/STT/TTS
+services in benchmarks/fakes.py, then has each candidate create an interview
+through POST /api/admin/interviews and answer every question over
+/api/ws/interview/{id}. Reports interview and turn throughput, turn latency
+percentiles (answer sent -> next question received) and the lag of the
+server's event loop.
+
+All data is written to a temporary DATA_DIR, so the real data directory is
+never touched.
+
+Usage (from backend/):
+    python benchmarks/load_test.py --candidates 50 --questions 5 \\
+        --llm-latency 0.8,2.5 --stt-latency 0.3,0.8 --tts-latency 0.4,1.2
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Isolate the run before the app reads its configuration
+os.environ["DATA_DIR"] = tempfile.mkdtemp(prefix="load-test-")
+os.environ.setdefault("SESSION_REGISTRY", "memory")
+os.environ.setdefault("WARM_UP_SERVICES", "False")
+
+import requests  # noqa: E402
+import uvicorn  # noqa: E402
+import websockets  # noqa: E402
+
+from fakes import FakeLLMService, FakeSTTService, FakeTTSService, LatencyModel, install_fakes  # noqa: E402
+
+# Smallest file the upload endpoint accepts as a "PDF"; the fakes never parse it
+FAKE_PDF = b"%PDF-1.4\n1 0 obj << /Type /Catalog >> endobj\ntrailer << /Root 1 0 R >>\n%%EOF\n"
+
+
+def make_answer_audio(kilobytes: int) -> str:
+    """Base64 WAV of 16 kHz mono noise, decoded and normalized like a real answer"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(os.urandom(kilobytes * 1024))
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def percentile(samples, q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summarize(samples) -> dict:
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 1),
+        "p90_ms": round(percentile(samples, 90) * 1000, 1),
+        "p99_ms": round(percentile(samples, 99) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1) if samples else 0.0,
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes a periodic timer"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.samples = []
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+
+class Worker:
+    """The app served by uvicorn on its own thread and event loop"""
+
+    def __init__(self, port: int):
+        import main
+        self.app = main.app
+        self.container = main.services
+        self.server = uvicorn.Server(uvicorn.Config(
+            self.app, host="127.0.0.1", port=port, log_level="warning", lifespan="on", ws_max_size=64 * 1024 * 1024
+        ))
+        self.lag = LoopLagMonitor()
+        self.thread = threading.Thread(target=lambda: asyncio.run(self._serve()), daemon=True)
+
+    async def _serve(self):
+        self.lag.start()
+        try:
+            await self.server.serve()
+        finally:
+            self.lag.stop()
+
+    def start(self):
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise SystemExit("Worker failed to start")
+            time.sleep(0.05)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=30)
+
+
+def create_interview(base_url: str, questions: int) -> str:
+    response = requests.post(
+        f"{base_url}/api/admin/interviews",
+        files={
+            "cv": ("cv.pdf", FAKE_PDF, "application/pdf"),
+            "jd": ("jd.pdf", FAKE_PDF, "application/pdf"),
+        },
+        data={"system_prompt": "You are a friendly technical interviewer.", "max_questions": str(questions)},
+        timeout=60,
+    )
+    response.raise_for_status()
+    return response.json()["interview_id"]
+
+
+async def run_candidate(number: int, args, base_url: str, ws_url: str, stats: dict):
+    await asyncio.sleep(args.ramp_up * number / max(args.candidates, 1))
+
+    start = time.perf_counter()
+    try:
+        interview_id = await asyncio.to_thread(create_interview, base_url, args.questions)
+    except Exception as e:
+        stats["errors"].append(f"create: {e}")
+        return
+    stats["create"].append(time.perf_counter() - start)
+
+    audio = make_answer_audio(args.audio_kb)
+    try:
+        async with websockets.connect(f"{ws_url}/api/ws/interview/{interview_id}", max_size=None) as ws:
+            # A new session: no resume token
+            await ws.send(json.dumps({"type": "resume", "resume_token": None}))
+            # Session and greeting messages come before the first question
+            message = json.loads(await ws.recv())
+            while message["type"] not in ("question", "error"):
+                message = json.loads(await ws.recv())
+
+            seq = 0
+            while message["type"] == "question":
+                await asyncio.sleep(args.think_time)
+                seq += 1
+                answer = {"type": "response", "seq": seq}
+                if args.text_answers:
+                    answer["text"] = f"Synthetic answer {seq} from candidate {number}."
+                else:
+                    answer["audio_data"] = audio
+
+                sent = time.perf_counter()
+                await ws.send(json.dumps(answer))
+                message = json.loads(await ws.recv())
+                stats["turns"].append(time.perf_counter() - sent)
+
+            if message["type"] == "error":
+                stats["errors"].append(f"session: {message['message']}")
+                return
+            if message["type"] == "completion":
+                results = json.loads(await ws.recv())
+                if results["type"] == "results":
+                    stats["completed"] += 1
+                    stats["interviews"].append(time.perf_counter() - start)
+    except Exception as e:
+        stats["errors"].append(f"websocket: {type(e).__name__}: {e}")
+
+
+async def run_candidates(args, base_url: str, ws_url: str) -> dict:
+    stats = {"create": [], "turns": [], "interviews": [], "completed": 0, "errors": []}
+    await asyncio.gather(*(
+        run_candidate(number, args, base_url, ws_url, stats) for number in range(args.candidates)
+    ))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test with simulated candidates")
+    parser.add_argument("--candidates", type=int, default=20, help="Simultaneous simulated candidates")
+    parser.add_argument("--questions", type=int, default=5, help="Questions per interview")
+    parser.add_argument("--ramp-up", type=float, default=2.0, help="Seconds over which candidates join")
+    parser.add_argument("--think-time", type=float, default=0.5, help="Seconds a candidate waits before answering")
+    parser.add_argument("--audio-kb", type=int, default=64, help="Size of each synthetic audio answer")
+    parser.add_argument("--text-answers", action="store_true", help="Send text answers instead of audio")
+    parser.add_argument("--llm-latency", default="0.8,2.5", help="LLM latency median[,p95] in seconds")
+    parser.add_argument("--stt-latency", default="0.3,0.8", help="STT latency median[,p95] in seconds")
+    parser.add_argument("--tts-latency", default="0.4,1.2", help="TTS latency median[,p95] in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", type=Path, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    port = free_port()
+    worker = Worker(port)
+    install_fakes(
+        worker.container,
+        llm=FakeLLMService(LatencyModel.parse(args.llm_latency, seed=args.seed)),
+        stt=FakeSTTService(LatencyModel.parse(args.stt_latency, seed=args.seed + 1)),
+        tts=FakeTTSService(LatencyModel.parse(args.tts_latency, seed=args.seed + 2)),
+    )
+    worker.start()
+
+    start = time.perf_counter()
+    try:
+        stats = asyncio.run(run_candidates(args, f"http://127.0.0.1:{port}", f"ws://127.0.0.1:{port}"))
+    finally:
+        elapsed = time.perf_counter() - start
+        worker.stop()
+
+    report = {
+        "config": {key: (str(value) if isinstance(value, Path) else value) for key, value in vars(args).items()},
+        "elapsed_s": round(elapsed, 2),
+        "completed": stats["completed"],
+        "errors": len(stats["errors"]),
+        "interviews_per_min": round(stats["completed"] / elapsed * 60, 2),
+        "turns_per_s": round(len(stats["turns"]) / elapsed, 2),
+        "create_latency": summarize(stats["create"]),
+        "turn_latency": summarize(stats["turns"]),
+        "interview_duration": summarize(stats["interviews"]),
+        "event_loop_lag": summarize(worker.lag.samples),
+    }
+
+    print(f"{stats['completed']}/{args.candidates} interviews completed in {elapsed:.1f}s "
+          f"({report['interviews_per_min']} interviews/min, {report['turns_per_s']} turns/s)")
+    for name in ("create_latency", "turn_latency", "interview_duration", "event_loop_lag"):
+        summary = report[name]
+        print(f"{name:18s} n={summary['count']:<6d} p50={summary['p50_ms']:8.1f}ms p90={summary['p90_ms']:8.1f}ms "
+              f"p99={summary['p99_ms']:8.1f}ms max={summary['max_ms']:8.1f}ms")
+    for error in stats["errors"][:10]:
+        print(f"error: {error}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,6 +35,19 @@ const Message = styled.div`
   color: ${(props) => (props.type === 'error' ? '#721c24' : '#155724')};
 `;
 
+// Close codes after which the session is resumed: going away, abnormal
+// closure (network drop), server error, service restart and try again later
+const RETRYABLE_CLOSE_CODES = [1001, 1006, 1011, 1012, 1013];
+const MAX_RECONNECT_ATTEMPTS = 8;
+const RECONNECT_MAX_DELAY_MS = 30000;
+
+// Voice activity detection on the microphone: speech starts after
+// SPEECH_START_MS above the RMS threshold and ends after SPEECH_END_MS below it
+const VAD_INTERVAL_MS = 50;
+const SPEECH_RMS_THRESHOLD = 0.02;
+const SPEECH_START_MS = 200;
+const SPEECH_END_MS = 1500;
+
 const Interview: React.FC = () => {
   const { interviewId } = useParams<{ interviewId: string }>();
   const [room, setRoom] = useState<Room | null>(null);
@@ -44,9 +57,17 @@ const Interview: React.FC = () => {
   const [error, setError] = useState<string>('');
   const [message, setMessage] = useState<string>('');
   const wsRef = useRef<WebSocket | null>(null);
+  const seqRef = useRef<number>(0);
+  const reconnectAttemptsRef = useRef<number>(0);
+  const reconnectTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // Set once the interview completed or the server refused the session
+  const finishedRef = useRef<boolean>(false);
+  const audioRef = useRef<HTMLAudioElement | null>(null);
+  const audioContextRef = useRef<AudioContext | null>(null);
+  const vadTimerRef = useRef<ReturnType<typeof setInterval> | null>(null);
 
   useEffect(() => {
-    const setupInterviewchrom = async () => {
+    const setupInterview = async () => {
       if (!interviewId) {
         setError('Invalid interview ID.');
         setIsLoading(false);
@@ -74,67 +95,165 @@ const Interview: React.FC = () => {
         // Request microphone access
         await room.localParticipant.enableMicrophone();
 
-        // Setup WebSocket
-        wsRef.current = new WebSocket(`${import.meta.env.VITE_API_URL}/api/ws/interview/${interviewId}`);
+        // Setup WebSocket, resuming the previous session after a reconnect.
+        // The resume token is sent in the first message, never in the URL.
+        const resumeKey = `resume_token:${interviewId}`;
+        const connect = () => {
+          const ws = new WebSocket(`${import.meta.env.VITE_API_URL}/api/ws/interview/${interviewId}`);
+          wsRef.current = ws;
 
-        wsRef.current.onopen = () => {
-          console.log('WebSocket connected');
-        };
+          ws.onopen = () => {
+            console.log('WebSocket connected');
+            ws.send(
+              JSON.stringify({
+                type: 'resume',
+                resume_token: sessionStorage.getItem(resumeKey),
+              })
+            );
+          };
 
-        wsRef.current.onmessage = async (event) => {
-          const data = JSON.parse(event.data);
-          switch (data.type) {
-            case 'greeting':
-            case 'question':
-              setCurrentQuestion(data.text);
-              setAudioUrl(`${import.meta.env.VITE_API_URL}${data.audio_url}`);
-              break;
-            case 'completion':
-              setMessage('Interview completed. Thank you for participating!');
-              setCurrentQuestion('');
-              setAudioUrl('');
-              break;
-            case 'results':
-              setMessage(`Rating: ${data.rating}/10. Verdict: ${data.verdict}`);
-              break;
-            case 'error':
-              setError(data.message);
-              break;
-          }
-        };
+          ws.onmessage = async (event) => {
+            const data = JSON.parse(event.data);
+            switch (data.type) {
+              case 'session':
+                reconnectAttemptsRef.current = 0;
+                setMessage('');
+                sessionStorage.setItem(resumeKey, data.resume_token);
+                seqRef.current = Math.max(seqRef.current, data.last_seq);
+                break;
+              case 'greeting':
+              case 'question':
+                setCurrentQuestion(data.text);
+                setAudioUrl(`${import.meta.env.VITE_API_URL}${data.audio_url}`);
+                break;
+              case 'completion':
+                finishedRef.current = true;
+                setMessage('Interview completed. Thank you for participating!');
+                setCurrentQuestion('');
+                setAudioUrl('');
+                break;
+              case 'results':
+                setMessage(`Rating: ${data.rating}/10. Verdict: ${data.verdict}`);
+                break;
+              case 'error':
+                finishedRef.current = true;
+                setError(data.message);
+                break;
+            }
+          };
 
-        wsRef.current.onerror = () => {
-          setError('WebSocket connection failed.');
-        };
+          ws.onerror = () => {
+            console.log('WebSocket error');
+          };
 
-        wsRef.current.onclose = () => {
-          setMessage('Interview session closed.');
+          ws.onclose = (event) => {
+            // Dropped connections and server restarts are resumed with backoff
+            if (
+              !finishedRef.current &&
+              RETRYABLE_CLOSE_CODES.includes(event.code) &&
+              reconnectAttemptsRef.current < MAX_RECONNECT_ATTEMPTS
+            ) {
+              const delay = Math.min(RECONNECT_MAX_DELAY_MS, 1000 * 2 ** reconnectAttemptsRef.current);
+              reconnectAttemptsRef.current += 1;
+              setMessage('Connection lost. Reconnecting...');
+              reconnectTimerRef.current = setTimeout(connect, delay);
+              return;
+            }
+            if (event.code === 4409) {
+              setError('This interview was resumed in another window.');
+            } else if (!finishedRef.current && event.code !== 1000) {
+              setError('Connection lost. Reload the page to continue the interview.');
+            } else {
+              setMessage((current) => current || 'Interview session closed.');
+            }
+          };
         };
+        connect();
 
         // Send audio data
         room.on(RoomEvent.AudioTrackPublished, async (track) => {
           const stream = track.audioStream;
           if (stream) {
-            const mediaRecorder = new MediaRecorder(stream);
-            mediaRecorder.ondataavailable = (event) => {
-              if (event.data.size > 0 && wsRef.current?.readyState === WebSocket.OPEN) {
-                event.data.arrayBuffer().then((buffer) => {
-                  const base64 = btoa(
-                    new Uint8Array(buffer).reduce(
-                      (data, byte) => data + String.fromCharCode(byte),
-                      ''
-                    )
-                  );
-                  wsRef.current?.send(
-                    JSON.stringify({
-                      type: 'response',
-                      audio_data: base64,
-                    })
-                  );
-                });
+            // Messages are sent in order, after the audio chunks before them are encoded
+            let sending: Promise<void> = Promise.resolve();
+            const send = (build: () => Promise<object> | object) => {
+              sending = sending.then(async () => {
+                const payload = await build();
+                if (wsRef.current?.readyState === WebSocket.OPEN) {
+                  wsRef.current.send(JSON.stringify(payload));
+                }
+              });
+            };
+
+            // Each answer is recorded separately and streamed while it is
+            // spoken, so the server transcribes it as it arrives; the
+            // response message marks its end
+            let mediaRecorder: MediaRecorder | null = null;
+
+            // Barge-in: when the candidate starts talking, stop the question
+            // being played and let the server cancel the follow-up it is
+            // still preparing
+            const onSpeechStart = () => {
+              audioRef.current?.pause();
+              send(() => ({ type: 'speech_start' }));
+
+              if (mediaRecorder?.state === 'recording') {
+                return;
               }
+              mediaRecorder = new MediaRecorder(stream);
+              mediaRecorder.ondataavailable = (event) => {
+                if (event.data.size > 0) {
+                  send(async () => {
+                    const buffer = await event.data.arrayBuffer();
+                    const base64 = btoa(
+                      new Uint8Array(buffer).reduce(
+                        (data, byte) => data + String.fromCharCode(byte),
+                        ''
+                      )
+                    );
+                    return { type: 'audio_chunk', audio_data: base64 };
+                  });
+                }
+              };
+              mediaRecorder.onstop = () => {
+                send(() => ({ type: 'response', seq: ++seqRef.current }));
+              };
+              mediaRecorder.start(1000); // Stream audio chunks every second
             };
-            mediaRecorder.start(1000); // Send audio chunks every second
+
+            const onSpeechEnd = () => {
+              if (mediaRecorder?.state === 'recording') {
+                mediaRecorder.stop();
+              }
+            };
+
+            const audioContext = new AudioContext();
+            audioContextRef.current = audioContext;
+            const analyser = audioContext.createAnalyser();
+            analyser.fftSize = 1024;
+            audioContext.createMediaStreamSource(stream).connect(analyser);
+            const samples = new Float32Array(analyser.fftSize);
+            let speaking = false;
+            let loudMs = 0;
+            let quietMs = 0;
+            vadTimerRef.current = setInterval(() => {
+              analyser.getFloatTimeDomainData(samples);
+              const rms = Math.sqrt(samples.reduce((sum, value) => sum + value * value, 0) / samples.length);
+              if (rms >= SPEECH_RMS_THRESHOLD) {
+                loudMs += VAD_INTERVAL_MS;
+                quietMs = 0;
+              } else {
+                quietMs += VAD_INTERVAL_MS;
+                loudMs = 0;
+              }
+              if (!speaking && loudMs >= SPEECH_START_MS) {
+                speaking = true;
+                onSpeechStart();
+              } else if (speaking && quietMs >= SPEECH_END_MS) {
+                speaking = false;
+                onSpeechEnd();
+              }
+            }, VAD_INTERVAL_MS);
           }
         });
 
@@ -147,6 +266,14 @@ const Interview: React.FC = () => {
 
     setupInterview();
     return () => {
+      finishedRef.current = true;
+      if (reconnectTimerRef.current) {
+        clearTimeout(reconnectTimerRef.current);
+      }
+      if (vadTimerRef.current) {
+        clearInterval(vadTimerRef.current);
+      }
+      audioContextRef.current?.close();
       if (wsRef.current) {
         wsRef.current.close();
       }
@@ -168,7 +295,7 @@ const Interview: React.FC = () => {
           {currentQuestion && (
             <QuestionDisplay>
               <p>{currentQuestion}</p>
-              {audioUrl && <AudioPlayer controls src={audioUrl} autoPlay />}
+              {audioUrl && <AudioPlayer ref={audioRef} controls src={audioUrl} autoPlay />}
             </QuestionDisplay>
           )}
           {room && (